@@ -61,10 +61,12 @@ class CommandEdgeAddAnnotation(QtWidgets.QUndoCommand):
     def redo(self):
         """redo the command"""
         self._edge.addAnnotation(self.ann)
+        self._edge.diagram.sgnUpdated.emit()
 
     def undo(self):
         """undo the command"""
         self._edge.removeAnnotation(self.ann)
+        self._edge.diagram.sgnUpdated.emit()
 
 
 class CommandEdgeRemoveAnnotation(QtWidgets.QUndoCommand):
@@ -87,17 +89,19 @@ class CommandEdgeRemoveAnnotation(QtWidgets.QUndoCommand):
     def redo(self):
         """redo the command"""
         self._edge.removeAnnotation(self._ann)
+        self._edge.diagram.sgnUpdated.emit()
 
     def undo(self):
         """undo the command"""
         self._edge.addAnnotation(self._ann)
+        self._edge.diagram.sgnUpdated.emit()
 
 
 class CommandEdgeModifyAnnotation(QtWidgets.QUndoCommand):
     """
     This command is used to set axiom properties.
     """
-    def __init__(self, project, ann, undo, redo, name=None):
+    def __init__(self, project, ann, undo, redo, name=None, edge=None):
         """
         Initialize the command.
         :type project: Project
@@ -105,8 +109,10 @@ class CommandEdgeModifyAnnotation(QtWidgets.QUndoCommand):
         :type undo: dict
         :type redo: dict
         :type name: str
+        :type edge: AxiomEdge
         """
         super().__init__(name or 'Modify annotation {} '.format(str(ann)))
+        self._edge = edge
         self._project = project
         self._ann = ann
         self._undo = undo
@@ -115,10 +121,14 @@ class CommandEdgeModifyAnnotation(QtWidgets.QUndoCommand):
     def redo(self):
         """redo the command"""
         self._ann.refactor(self._redo)
+        if self._edge and self._edge.diagram:
+            self._edge.diagram.sgnUpdated.emit()
 
     def undo(self):
         """undo the command"""
         self._ann.refactor(self._undo)
+        if self._edge and self._edge.diagram:
+            self._edge.diagram.sgnUpdated.emit()
 
 
 #############################################
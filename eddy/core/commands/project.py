@@ -382,7 +382,7 @@ class CommandProjectSetProfile(QtWidgets.QUndoCommand):
         self.project.profile = self.project.session.createProfile(self.data['redo'], self.project)
 
         # Reshape all the Role and Attribute nodes to show/hide functionality and inverse functionality.
-        for node in self.project.nodes():
+        for node in self.project.iterNodes():
             if node.type() in {Item.RoleNode, Item.AttributeNode}:
                 node.updateNode(selected=node.isSelected())
 
@@ -395,7 +395,7 @@ class CommandProjectSetProfile(QtWidgets.QUndoCommand):
         self.project.profile = self.project.session.createProfile(self.data['undo'], self.project)
 
         # Reshape all the Role and Attribute nodes to show/hide functionality and inverse functionality.
-        for node in self.project.nodes():
+        for node in self.project.iterNodes():
             if node.type() in {Item.RoleNode, Item.AttributeNode}:
                 node.updateNode(selected=node.isSelected())
                 # Emit updated signals.
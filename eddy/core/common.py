@@ -1399,6 +1399,9 @@ class HasThreadingSystem(object):
             name = name_or_qthread
             if not isinstance(name, str):
                 name = name_or_qthread.objectName()
+                # THE NAME MAY HAVE BEEN REUSED BY A THREAD STARTED AFTER THE GIVEN ONE WAS STOPPED
+                if self._threads.get(name) is not name_or_qthread:
+                    return
             if name in self._threads:
                 try:
                     LOGGER.debug("[THREADS] Terminate thread: %s (runtime=%.2fms)",
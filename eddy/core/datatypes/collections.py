@@ -140,4 +140,75 @@ class DistinctList(list):
         x.__getslice__(i, j) <==> x[i:j] (built-in CPython types needs this one).
         Use of negative indices is not supported.
         """
-        return self[max(0, i):max(0, j):]
\ No newline at end of file
+        return self[max(0, i):max(0, j):]
+
+
+class StringTrie(object):
+    """
+    Character trie mapping string keys to sets of values, which allows to retrieve
+    all the keys that are prefixes of a given string in time linear in its length.
+    """
+    __slots__ = ('_root',)
+
+    def __init__(self, items=None):
+        """
+        Initialize the StringTrie.
+        :type items: iterable
+        """
+        self._root = [{}, set()]
+        if items:
+            for key, value in items:
+                self.add(key, value)
+
+    def add(self, key, value):
+        """
+        Associate the given value to the given key.
+        :type key: str
+        :type value: mixed
+        """
+        node = self._root
+        for char in key:
+            node = node[0].setdefault(char, [{}, set()])
+        node[1].add(value)
+
+    def clear(self):
+        """
+        Removes all the keys from the trie.
+        """
+        self._root = [{}, set()]
+
+    def match(self, string):
+        """
+        Returns a generator of (key, value) pairs for all the keys that are prefixes
+        of the given string, from the shortest key to the longest one.
+        :type string: str
+        :rtype: generator
+        """
+        node = self._root
+        for value in node[1]:
+            yield '', value
+        for index, char in enumerate(string):
+            node = node[0].get(char)
+            if node is None:
+                break
+            for value in node[1]:
+                yield string[:index + 1], value
+
+    def remove(self, key, value):
+        """
+        Silently remove the association between the given key and the given value.
+        :type key: str
+        :type value: mixed
+        """
+        path = [self._root]
+        for char in key:
+            node = path[-1][0].get(char)
+            if node is None:
+                return
+            path.append(node)
+        path[-1][1].discard(value)
+        # PRUNE BRANCHES LEFT WITHOUT VALUES
+        for index in range(len(key), 0, -1):
+            if path[index][0] or path[index][1]:
+                break
+            del path[index - 1][0][key[index - 1]]
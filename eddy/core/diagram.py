@@ -35,6 +35,8 @@
 
 from __future__ import annotations
 
+from collections import deque
+from time import time
 from typing import (
     cast,
     Dict,
@@ -45,6 +47,7 @@ from typing import (
 
 from PyQt5 import (
     QtCore,
+    QtGui,
     QtWidgets,
 )
 
@@ -108,6 +111,7 @@ class Diagram(QtWidgets.QGraphicsScene):
     MaxSize = 1000000
     MinFontSize = 8
     MaxFontSize = 40
+    NodeGeometryLogSize = 1024
     SelectionRadius = 4
 
     sgnItemAdded = QtCore.pyqtSignal(QtWidgets.QGraphicsScene, QtWidgets.QGraphicsItem)
@@ -141,6 +145,11 @@ class Diagram(QtWidgets.QGraphicsScene):
         self.mp_NodePos = None
         self.mp_Pos = None
 
+        self.renderQueue = deque()
+        # SCENE AREAS COVERED BY THE NODES WHOSE GEOMETRY CHANGED: [(id(node), QRectF)]
+        self.nodeGeometryLog = deque(maxlen=Diagram.NodeGeometryLogSize)
+        self.nodeGeometryVersion = 0
+
         settings = QtCore.QSettings()
         self.setFont(
             Font(
@@ -720,7 +729,7 @@ class Diagram(QtWidgets.QGraphicsScene):
         """
         Returns `True` if this diagram contains no element, `False` otherwise.
         """
-        return len(self.project.items(self)) == 0
+        return self.project.itemCount(self) == 0
 
     def items(self, mixed=None, mode=QtCore.Qt.IntersectsItemShape, **kwargs):
         """
@@ -745,6 +754,28 @@ class Diagram(QtWidgets.QGraphicsScene):
                     x not in kwargs.get('skip', set())
         ], key=lambda i: i.zValue(), reverse=True)
 
+    def logNodeGeometry(self, node: AbstractNode, rect: QtCore.QRectF) -> None:
+        """
+        Record that the given node has been added, removed, moved, resized or restacked
+        within the given scene area.
+        """
+        self.nodeGeometryLog.append((id(node), rect))
+        self.nodeGeometryVersion += 1
+
+    def nodeGeometryChanged(self, version: int, rect: QtCore.QRectF, skip: Set[int]) -> bool:
+        """
+        Returns True if, since the given version of the node geometry log, the geometry of a node
+        changed within the given scene area, ignoring the nodes whose id is in the given set.
+        """
+        count = self.nodeGeometryVersion - version
+        if count > len(self.nodeGeometryLog):
+            return True
+        for i in range(1, count + 1):
+            nodeId, changed = self.nodeGeometryLog[-i]
+            if nodeId not in skip and changed.intersects(rect):
+                return True
+        return False
+
     def nodes(self) -> Set[AbstractNode]:
         """
         Returns a collection with all the nodes in the diagram.
@@ -757,6 +788,49 @@ class Diagram(QtWidgets.QGraphicsScene):
         """
         return self.project.node(self, nid)
 
+    def hasPendingRender(self) -> bool:
+        """
+        Returns True if the diagram contains items whose rendering has been deferred.
+        """
+        return bool(self.renderQueue)
+
+    def render(
+        self,
+        painter: QtGui.QPainter,
+        target: QtCore.QRectF = QtCore.QRectF(),
+        source: QtCore.QRectF = QtCore.QRectF(),
+        mode: QtCore.Qt.AspectRatioMode = QtCore.Qt.KeepAspectRatio,
+    ) -> None:
+        """
+        Render the diagram using the given painter, completing any deferred item rendering first.
+        """
+        self.renderPendingItems()
+        super().render(painter, target, source, mode)
+
+    def renderPendingItems(self, budget: float = None) -> bool:
+        """
+        Update the geometry and the cache of the items whose rendering has been deferred.
+        If a time budget (in seconds) is given, stop as soon as it is exhausted.
+        Returns True if no item is left to render.
+        """
+        start = time()
+        while self.renderQueue:
+            item = self.renderQueue.popleft()
+            if item.scene() is self:
+                item.updateEdgeOrNode()
+            if budget is not None and time() - start >= budget:
+                break
+        return not self.renderQueue
+
+    def scheduleRender(self) -> None:
+        """
+        Defer the rendering of all the items in the diagram: nodes first, so that
+        edges are computed against the final geometry of their endpoints.
+        """
+        self.renderQueue.clear()
+        self.renderQueue.extend(self.nodes())
+        self.renderQueue.extend(self.edges())
+
     def selectedEdges(self, filter_on_edges=lambda x: True):
         """
         Returns the edges selected in the diagram.
@@ -822,6 +896,7 @@ class Diagram(QtWidgets.QGraphicsScene):
         """
         Returns a rectangle matching the area of visible items.
         """
+        self.renderPendingItems()
         items = self.items()
         if items:
             x = set()
@@ -33,16 +33,21 @@
 ##########################################################################
 
 import os
+from collections import deque
 
-from PyQt5 import QtXml
+from PyQt5 import (
+    QtCore,
+    QtXml,
+)
 
 from eddy.core.datatypes.graphol import Item
 from eddy.core.datatypes.system import File
 from eddy.core.exporters.common import AbstractProjectExporter
-from eddy.core.functions.fsystem import mkdir, fwrite, fexists, isdir
+from eddy.core.functions.fsystem import mkdir, fwritelines, fexists, isdir
 from eddy.core.functions.misc import postfix
 from eddy.core.items.nodes.concept import ConceptNode
 from eddy.core.output import getLogger
+from eddy.core.worker import AbstractWorker
 from eddy.ui.dialogs import DiagramSelectionDialog
 
 LOGGER = getLogger()
@@ -133,7 +138,22 @@ class GrapholIRIProjectExporter(AbstractProjectExporter):
         """
         Create the QDomDocument where to store project information.
         """
-        self.document = QtXml.QDomDocument()
+        project = self.createDocumentSkeleton()
+
+        ontologyEl = self.getOntologyDomElement()
+        project.appendChild(ontologyEl)
+
+        diagramsEl = self.getDiagramsDomElement()
+        project.appendChild(diagramsEl)
+
+    def createDocumentSkeleton(self, document=None):
+        """
+        Create a new QDomDocument holding only the 'graphol' and 'project' elements.
+        The given document, if any, is used in place of a new QDomDocument.
+        :type document: T <= QDomDocument|DomSnapshot
+        :rtype: QDomElement
+        """
+        self.document = QtXml.QDomDocument() if document is None else document
         instruction = self.document.createProcessingInstruction('xml', 'version="1.0" encoding="UTF-8"')
         self.document.appendChild(instruction)
         graphol = self.getDomElement('graphol')
@@ -144,12 +164,84 @@ class GrapholIRIProjectExporter(AbstractProjectExporter):
         project.setAttribute('name', self.project.name)
         project.setAttribute('version', self.project.version)
         graphol.appendChild(project)
+        return project
+
+    def createDocumentParts(self, factory=QtXml.QDomDocument):
+        """
+        Generate the QDomDocuments holding the pieces of the project document.
+        The first document holds the ontology, followed by a placeholder 'diagram'
+        element whenever there are diagrams to export; each of the following ones
+        holds a single diagram nested at the same level it has in the project file.
+        Every document is detached from the project items, hence it can be safely
+        serialized while the project is being modified. Documents are created using
+        the given factory, so that DomSnapshot can be used to record plain data.
+        :type factory: callable
+        :rtype: T <= generator
+        """
+        diagrams = sorted(self.getDiagramsToExport(), key=str)
+        project = self.createDocumentSkeleton(factory())
+        project.appendChild(self.getOntologyDomElement())
+        diagramsEl = self.getDomElement('diagrams')
+        project.appendChild(diagramsEl)
+        if diagrams:
+            diagramsEl.appendChild(self.getDomElement('diagram'))
+        yield self.document
+        for diagram in diagrams:
+            project = self.createDocumentSkeleton(factory())
+            diagramsEl = self.getDomElement('diagrams')
+            project.appendChild(diagramsEl)
+            diagramsEl.appendChild(self.getDiagramDomElement(diagram))
+            yield self.document
+        self.document = None
 
-        ontologyEl = self.getOntologyDomElement()
-        project.appendChild(ontologyEl)
+    @staticmethod
+    def joinDocumentParts(texts):
+        """
+        Slice the serialized documents generated by createDocumentParts so that,
+        once concatenated, they yield the whole project document. The produced text
+        is the same as QDomDocument.toString(2) on the whole project.
+        :type texts: T <= iterable
+        :rtype: T <= generator
+        """
+        texts = iter(texts)
+        content = next(texts)
+        # Markup characters are always escaped in text and attribute values,
+        # hence the placeholder tag can only match the placeholder element.
+        placeholder = content.rfind('<diagram/>\n')
+        if placeholder < 0:
+            yield content
+            return
+        lineStart = content.rindex('\n', 0, placeholder) + 1
+        yield content[:lineStart]
+        tail = content[placeholder + len('<diagram/>\n'):]
+        del content
+        for content in texts:
+            start = content.index('<diagrams>\n') + len('<diagrams>\n')
+            end = content.rindex('\n', 0, content.rindex('</diagrams>\n')) + 1
+            yield content[start:end]
+            del content
+        yield tail
 
-        diagramsEl = self.getDiagramsDomElement()
-        project.appendChild(diagramsEl)
+    @classmethod
+    def serializeDocumentParts(cls, parts):
+        """
+        Serialize the documents generated by createDocumentParts one piece at a time.
+        The produced text is the same as QDomDocument.toString(2) on the whole project.
+        :type parts: T <= iterable
+        :rtype: T <= generator
+        """
+        return cls.joinDocumentParts(document.toString(2) for document in parts)
+
+    def generateDocument(self):
+        """
+        Generate the serialized project document one piece at a time.
+        The ontology and each diagram are built in their own QDomDocument, which
+        is serialized and released before the next one is created, so that the
+        whole project never needs to be held in memory as a single DOM tree or
+        string. The produced text is the same as QDomDocument.toString(2).
+        :rtype: T <= generator
+        """
+        return self.serializeDocumentParts(self.createDocumentParts())
 
     def getOntologyDomElement(self):
         """
@@ -374,14 +466,19 @@ class GrapholIRIProjectExporter(AbstractProjectExporter):
 
     def getDiagramsDomElement(self):
         diagramsEl = self.getDomElement('diagrams')
-        if self.selectedDiagrams:
-            currSet = self.selectedDiagrams
-        else:
-            currSet = self.project.diagrams()
-        for diagram in sorted(currSet,key=str):
+        for diagram in sorted(self.getDiagramsToExport(),key=str):
             diagramsEl.appendChild(self.getDiagramDomElement(diagram))
         return diagramsEl
 
+    def getDiagramsToExport(self):
+        """
+        Returns the collection of diagrams to be exported.
+        :rtype: T <= set|list
+        """
+        if self.selectedDiagrams:
+            return self.selectedDiagrams
+        return self.project.diagrams()
+
     def getDiagramDomElement(self,diagram):
         diagramEl = self.getDomElement('diagram')
         diagramEl.setAttribute('name', diagram.name)
@@ -768,10 +865,24 @@ class GrapholIRIProjectExporter(AbstractProjectExporter):
 
     def createProjectFile(self):
         """
-        Serialize a previously created QDomDocument to disk.
+        Serialize the project to disk, streaming the document to the staging file.
+        """
+        self.writeProjectFile(self.generateDocument(), self.projectFilePath())
+
+    def projectFilePath(self):
+        """
+        Returns the path of the file the project is exported to.
+        :rtype: str
+        """
+        return self.exportPath if self.exportPath else self.project.path
+
+    def writeProjectFile(self, chunks, currPath):
+        """
+        Write the given serialized document chunks to the project file.
+        :type chunks: T <= iterable
+        :type currPath: str
         """
         try:
-            currPath = self.exportPath if self.exportPath else self.project.path
             if not fexists(currPath):
                 folderPath = os.path.dirname(currPath)
                 if not isdir(folderPath):
@@ -781,7 +892,7 @@ class GrapholIRIProjectExporter(AbstractProjectExporter):
             #TODO filename = postfix(self.project.name, File.Graphol.extension)
             #TODO filepath = os.path.join(self.project.path, filename)
             #TODO fwrite(self.document.toString(2), filepath)
-            fwrite(self.document.toString(2), currPath)
+            fwritelines(chunks, currPath)
         except Exception as e:
             raise e
         else:
@@ -814,7 +925,171 @@ class GrapholIRIProjectExporter(AbstractProjectExporter):
             if not self.selectedDiagrams:
                 return
 
-        self.createDomDocument()
         #self.createOntology()
         #self.createDiagrams()
         self.createProjectFile()
+
+
+class DomRecord(object):
+    """
+    Plain data record of a DOM element created through a DomSnapshot.
+    """
+    __slots__ = ('tag', 'attributes', 'children')
+
+    def __init__(self, tag):
+        """
+        Initialize the record.
+        :type tag: str
+        """
+        self.tag = tag
+        self.attributes = []
+        self.children = []
+
+    def appendChild(self, child):
+        """
+        Append the given record, text or processing instruction to the children of this element.
+        :type child: T <= DomRecord|str|tuple
+        :rtype: T <= DomRecord|str|tuple
+        """
+        self.children.append(child)
+        return child
+
+    def setAttribute(self, name, value):
+        """
+        Record the given attribute, which is set on the QDomElement as it is.
+        :type name: str
+        :type value: T <= str|int|float
+        """
+        self.attributes.append((name, value))
+
+
+class DomSnapshot(object):
+    """
+    Stand-in for QDomDocument which records the nodes created by the project exporter
+    as plain Python data rather than as a DOM tree. Recording does not touch Qt, and the
+    QDomDocument is built later by toDocument, from any thread, producing the same document
+    the exporter would have built directly.
+    """
+    __slots__ = ('children',)
+
+    def __init__(self):
+        """
+        Initialize the snapshot.
+        """
+        self.children = []
+
+    def appendChild(self, child):
+        """
+        Append the given record or processing instruction to the document.
+        :type child: T <= DomRecord|tuple
+        :rtype: T <= DomRecord|tuple
+        """
+        self.children.append(child)
+        return child
+
+    @staticmethod
+    def createElement(tag):
+        """
+        Returns a new element record with the given tag.
+        :type tag: str
+        :rtype: DomRecord
+        """
+        return DomRecord(tag)
+
+    @staticmethod
+    def createProcessingInstruction(target, data):
+        """
+        Returns a new processing instruction record.
+        :type target: str
+        :type data: str
+        :rtype: tuple
+        """
+        return target, data
+
+    @staticmethod
+    def createTextNode(text):
+        """
+        Returns a new text node record.
+        :type text: str
+        :rtype: str
+        """
+        return text
+
+    def toDocument(self):
+        """
+        Build the QDomDocument recorded by this snapshot.
+        :rtype: QDomDocument
+        """
+        document = QtXml.QDomDocument()
+
+        def build(record):
+            if isinstance(record, str):
+                return document.createTextNode(record)
+            if isinstance(record, tuple):
+                return document.createProcessingInstruction(*record)
+            element = document.createElement(record.tag)
+            for name, value in record.attributes:
+                element.setAttribute(name, value)
+            for child in record.children:
+                element.appendChild(build(child))
+            return element
+
+        for child in self.children:
+            document.appendChild(build(child))
+        return document
+
+
+class GrapholIRIProjectSaveWorker(AbstractWorker):
+    """
+    Extends AbstractWorker providing a worker thread that will write a Graphol project to disk.
+    The project is snapshotted into plain data (see DomSnapshot) when the worker is created,
+    so that building and serializing the document, one part at a time, and the file
+    replacement can run in the worker thread while the project is being edited.
+    """
+    sgnCompleted = QtCore.pyqtSignal()
+    sgnErrored = QtCore.pyqtSignal(Exception)
+    sgnProgress = QtCore.pyqtSignal(int, int)
+    sgnStarted = QtCore.pyqtSignal()
+
+    def __init__(self, exporter):
+        """
+        Initialize the Graphol project save worker.
+        Must be called from the thread owning the project (i.e: the GUI thread).
+        :type exporter: GrapholIRIProjectExporter
+        """
+        super().__init__()
+        self.exporter = exporter
+        self.path = exporter.projectFilePath()
+        self.parts = deque(exporter.createDocumentParts(DomSnapshot))
+        self.num = 0
+        self.max = len(self.parts)
+
+    #############################################
+    #   INTERFACE
+    #################################
+
+    def generateParts(self):
+        """
+        Build and serialize the snapshot documents, releasing each one once serialized.
+        :rtype: T <= generator
+        """
+        while self.parts:
+            yield self.parts.popleft().toDocument().toString(2)
+            self.num += 1
+            self.sgnProgress.emit(self.num, self.max)
+
+    def run(self):
+        """
+        Main worker.
+        """
+        try:
+            self.sgnStarted.emit()
+            chunks = self.exporter.joinDocumentParts(self.generateParts())
+            self.exporter.writeProjectFile(chunks, self.path)
+        except Exception as e:
+            self.sgnErrored.emit(e)
+        else:
+            self.sgnCompleted.emit()
+        finally:
+            self.parts.clear()
+            self.finished.emit()
@@ -141,6 +141,7 @@ class AbstractMetadataExporter(AbstractProjectExporter):
             self.annotations = self.project.getAnnotationPropertyIRIs()
         if self.items is None:
             self.items = self.Types.keys()
+        annotations = set(self.annotations)
         meta = []  # type: List[Dict[str, str]]
         processed = set()
         # PROJECT METADATA
@@ -160,7 +161,7 @@ class AbstractMetadataExporter(AbstractProjectExporter):
                         self.KeyValue: '',
                     })
                 for annotation in node.iri.annotationAssertions:
-                    if annotation.assertionProperty in self.annotations:
+                    if annotation.assertionProperty in annotations:
                         meta.append({
                             self.KeyResource: str(node.iri),
                             self.KeySimpleName: node.iri.getSimpleName(),
@@ -187,7 +188,7 @@ class AbstractMetadataExporter(AbstractProjectExporter):
                 if resource in processed:
                     continue
                 for annotation in resource.annotationAssertions:
-                    if annotation.assertionProperty in self.annotations:
+                    if annotation.assertionProperty in annotations:
                         meta.append({
                             self.KeyResource: str(resource),
                             self.KeySimpleName: resource.getSimpleName(),
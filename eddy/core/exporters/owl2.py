@@ -36,6 +36,7 @@
 import json
 import os
 import textwrap
+from contextlib import contextmanager
 
 from PyQt5 import (
     QtCore,
@@ -87,8 +88,11 @@ from eddy.core.functions.path import (
     expandPath,
     openPath,
 )
-from eddy.core.functions.signals import connect
-from eddy.core.jvm import getJavaVM
+from eddy.core.functions.signals import (
+    connect,
+    disconnect,
+)
+from eddy.core.jvm import getJavaVM, getOWLOntologyManager
 from eddy.core.metadata import (
     LiteralValue,
     NamedEntity,
@@ -100,6 +104,7 @@ from eddy.core.ndc import (
 from eddy.core.network import NetworkManager
 from eddy.core.output import getLogger
 from eddy.core.owl import (
+    IRI,
     OWL2Datatype,
     OWL2Facet,
 )
@@ -127,7 +132,7 @@ class OWLOntologyExporter(AbstractOntologyExporter, HasThreadingSystem):
         :type session: Session
         """
         super().__init__(project, session)
-        self.items = list(project.edges()) + list(filter(lambda n: not n.adjacentNodes(), project.nodes()))
+        self.items = list(project.iterEdges()) + list(filter(lambda n: not n.adjacentNodes(), project.iterNodes()))
         self.path = None
         self.progress = None
         self.diagrams = kwargs.get('diagrams', None)
@@ -571,6 +576,7 @@ class OWLOntologyExporterWorker(AbstractWorker):
             self.vm.initialize()
         self.vm.attachThreadToJVM()
         self.AddOntologyAnnotation = self.vm.getJavaClass('org.semanticweb.owlapi.model.AddOntologyAnnotation')
+        self.Arrays = self.vm.getJavaClass('java.util.Arrays')
         self.DefaultPrefixManager = self.vm.getJavaClass('org.semanticweb.owlapi.util.DefaultPrefixManager')
         self.FunctionalSyntaxDocumentFormat = self.vm.getJavaClass('org.semanticweb.owlapi.formats.FunctionalSyntaxDocumentFormat')
         self.HashSet = self.vm.getJavaClass('java.util.HashSet')
@@ -609,6 +615,8 @@ class OWLOntologyExporterWorker(AbstractWorker):
         self._axioms = set()
         self._converted = dict()
         self._converted_meta_individuals = dict()
+        self._cacheHits = 0
+        self._cacheMisses = 0
         self.metadataProperty = self.project.getIRI('urn:x-graphol:origin')
 
         self.df = None
@@ -639,58 +647,105 @@ class OWLOntologyExporterWorker(AbstractWorker):
     def convert(self, node):
         """
         Build and returns the OWL 2 conversion of the given node.
+        Conversions are memoized by (diagram, node id) so that shared
+        sub-expressions are translated only once.
         :type node: AbstractNode
         :rtype: OWLObject
         """
-        if node.diagram.name not in self._converted:
-            self._converted[node.diagram.name] = dict()
-            self._converted_meta_individuals[node.diagram.name] = dict()
-        if node not in self._converted[node.diagram.name]:
-            if node.type() is Item.ConceptNode:
-                self._converted[node.diagram.name][node.id] = self.getConcept(node)
-                if node.occursAsIndividual():
-                    self._converted_meta_individuals[node.diagram.name][node.id] = self.getIndividual(node)
-            elif node.type() is Item.AttributeNode:
-                self._converted[node.diagram.name][node.id] = self.getAttribute(node)
-                if node.occursAsIndividual():
-                    self._converted_meta_individuals[node.diagram.name][node.id] = self.getIndividual(node)
-            elif node.type() is Item.RoleNode:
-                self._converted[node.diagram.name][node.id] = self.getRole(node)
-                if node.occursAsIndividual():
-                    self._converted_meta_individuals[node.diagram.name][node.id] = self.getIndividual(node)
-            elif node.type() is Item.ValueDomainNode:
-                self._converted[node.diagram.name][node.id] = self.getValueDomain(node)
-            elif node.type() is Item.IndividualNode:
-                self._converted[node.diagram.name][node.id] = self.getIndividual(node)
-            elif node.type() is Item.LiteralNode:
-                self._converted[node.diagram.name][node.id] = self.getLiteral(node)
-            elif node.type() is Item.FacetNode:
-                self._converted[node.diagram.name][node.id] = self.getFacet(node)
-            elif node.type() is Item.RoleInverseNode:
-                self._converted[node.diagram.name][node.id] = self.getRoleInverse(node)
-            elif node.type() is Item.RoleChainNode:
-                self._converted[node.diagram.name][node.id] = self.getRoleChain(node)
-            elif node.type() is Item.ComplementNode:
-                self._converted[node.diagram.name][node.id] = self.getComplement(node)
-            elif node.type() is Item.EnumerationNode:
-                self._converted[node.diagram.name][node.id] = self.getEnumeration(node)
-            elif node.type() is Item.IntersectionNode:
-                self._converted[node.diagram.name][node.id] = self.getIntersection(node)
-            elif node.type() in {Item.UnionNode, Item.DisjointUnionNode}:
-                self._converted[node.diagram.name][node.id] = self.getUnion(node)
-            elif node.type() is Item.DatatypeRestrictionNode:
-                self._converted[node.diagram.name][node.id] = self.getDatatypeRestriction(node)
-            elif node.type() is Item.PropertyAssertionNode:
-                self._converted[node.diagram.name][node.id] = self.getPropertyAssertion(node)
-            elif node.type() is Item.DomainRestrictionNode:
-                self._converted[node.diagram.name][node.id] = self.getDomainRestriction(node)
-            elif node.type() is Item.RangeRestrictionNode:
-                self._converted[node.diagram.name][node.id] = self.getRangeRestriction(node)
-            elif node.type() is Item.HasKeyNode:
-                self._converted[node.diagram.name][node.id] = self.getHasKey(node)
-            else:
-                raise ValueError('no conversion available for node %s' % node)
-        return self._converted[node.diagram.name][node.id]
+        diagramName = node.diagram.name
+        if diagramName not in self._converted:
+            self._converted[diagramName] = dict()
+            self._converted_meta_individuals[diagramName] = dict()
+        converted = self._converted[diagramName]
+        if node.id in converted:
+            self._cacheHits += 1
+            return converted[node.id]
+        self._cacheMisses += 1
+        if node.type() is Item.ConceptNode:
+            converted[node.id] = self.getConcept(node)
+            if node.occursAsIndividual():
+                self._converted_meta_individuals[diagramName][node.id] = self.getIndividual(node)
+        elif node.type() is Item.AttributeNode:
+            converted[node.id] = self.getAttribute(node)
+            if node.occursAsIndividual():
+                self._converted_meta_individuals[diagramName][node.id] = self.getIndividual(node)
+        elif node.type() is Item.RoleNode:
+            converted[node.id] = self.getRole(node)
+            if node.occursAsIndividual():
+                self._converted_meta_individuals[diagramName][node.id] = self.getIndividual(node)
+        elif node.type() is Item.ValueDomainNode:
+            converted[node.id] = self.getValueDomain(node)
+        elif node.type() is Item.IndividualNode:
+            converted[node.id] = self.getIndividual(node)
+        elif node.type() is Item.LiteralNode:
+            converted[node.id] = self.getLiteral(node)
+        elif node.type() is Item.FacetNode:
+            converted[node.id] = self.getFacet(node)
+        elif node.type() is Item.RoleInverseNode:
+            converted[node.id] = self.getRoleInverse(node)
+        elif node.type() is Item.RoleChainNode:
+            converted[node.id] = self.getRoleChain(node)
+        elif node.type() is Item.ComplementNode:
+            converted[node.id] = self.getComplement(node)
+        elif node.type() is Item.EnumerationNode:
+            converted[node.id] = self.getEnumeration(node)
+        elif node.type() is Item.IntersectionNode:
+            converted[node.id] = self.getIntersection(node)
+        elif node.type() in {Item.UnionNode, Item.DisjointUnionNode}:
+            converted[node.id] = self.getUnion(node)
+        elif node.type() is Item.DatatypeRestrictionNode:
+            converted[node.id] = self.getDatatypeRestriction(node)
+        elif node.type() is Item.PropertyAssertionNode:
+            converted[node.id] = self.getPropertyAssertion(node)
+        elif node.type() is Item.DomainRestrictionNode:
+            converted[node.id] = self.getDomainRestriction(node)
+        elif node.type() is Item.RangeRestrictionNode:
+            converted[node.id] = self.getRangeRestriction(node)
+        elif node.type() is Item.HasKeyNode:
+            converted[node.id] = self.getHasKey(node)
+        else:
+            raise ValueError('no conversion available for node %s' % node)
+        return converted[node.id]
+
+    def convertDiagram(self, diagram):
+        """
+        Convert all the nodes of the given diagram into OWL 2 expressions.
+        Nodes are visited in dependency order (operands before the operators
+        consuming them through input edges), so that each node is translated
+        exactly once and its operands are always found in the conversion cache.
+        :type diagram: Diagram
+        """
+        visited = set()
+        for root in diagram.nodes():
+            if root in visited:
+                continue
+            visited.add(root)
+            stack = [(root, iter(self.operands(root)))]
+            while stack:
+                node, operands = stack[-1]
+                for operand in operands:
+                    if operand not in visited:
+                        visited.add(operand)
+                        stack.append((operand, iter(self.operands(operand))))
+                        break
+                else:
+                    stack.pop()
+                    self.convert(node)
+                    self.step(+1)
+
+    def cacheHits(self):
+        """
+        Returns the number of node conversions served from the conversion cache.
+        :rtype: int
+        """
+        return self._cacheHits
+
+    def cacheMisses(self):
+        """
+        Returns the number of node conversions actually performed.
+        :rtype: int
+        """
+        return self._cacheMisses
 
     def converted(self):
         """
@@ -699,6 +754,15 @@ class OWLOntologyExporterWorker(AbstractWorker):
         """
         return self._converted
 
+    @staticmethod
+    def operands(node):
+        """
+        Returns the list of nodes connected in input to the given node.
+        :type node: AbstractNode
+        :rtype: list
+        """
+        return [e.source for e in node.edges if e.type() is Item.InputEdge and e.target is node]
+
     def convertPredicateNodeOccurringAsIndividual(self, node):
         """
         Needed for translation of PropertyAssertion nodes (i.e., getPropertyAssertion).
@@ -722,6 +786,30 @@ class OWLOntologyExporterWorker(AbstractWorker):
     #   AUXILIARY METHODS
     #################################
 
+    def newHashSet(self, items=()):
+        """
+        Build a java.util.HashSet holding the given objects, crossing the JNI
+        boundary once for the whole collection rather than once per element.
+        :type items: iterable
+        :rtype: HashSet
+        """
+        items = list(items)
+        if not items:
+            return self.HashSet()
+        return self.HashSet(self.Arrays.asList(items))
+
+    def newLinkedList(self, items=()):
+        """
+        Build a java.util.LinkedList holding the given objects (in order), crossing
+        the JNI boundary once for the whole collection rather than once per element.
+        :type items: iterable
+        :rtype: LinkedList
+        """
+        items = list(items)
+        if not items:
+            return self.LinkedList()
+        return self.LinkedList(self.Arrays.asList(items))
+
     def getOWLApiAnnotation(self, annotation):
         """
         Returns an OWLAnnotation corresponding to the given annotation object.
@@ -874,11 +962,9 @@ class OWLOntologyExporterWorker(AbstractWorker):
         :type edge: AxiomEdge
         :rtype: Set
         """
-        collection = self.HashSet()
         if OWLAxiom.Annotation in self.axiomsList:
-            for annotation in edge.annotations:
-                collection.add(self.getOWLApiAnnotation(annotation))
-        return collection
+            return self.newHashSet([self.getOWLApiAnnotation(annotation) for annotation in edge.annotations])
+        return self.newHashSet()
 
     def getComplement(self, node):
         """
@@ -952,10 +1038,7 @@ class OWLOntologyExporterWorker(AbstractWorker):
         if not incoming:
             raise DiagramMalformedError(node, 'missing facet node(s)')
 
-        collection = self.HashSet()
-        for facet in incoming:
-            conversion = self.convert(facet)
-            collection.add(conversion)
+        collection = self.newHashSet([self.convert(facet) for facet in incoming])
 
         #############################################
         # BUILD DATATYPE RESTRICTION
@@ -1010,18 +1093,18 @@ class OWLOntologyExporterWorker(AbstractWorker):
             if node.restriction() is Restriction.Forall:
                 return self.df.getOWLDataAllValuesFrom(dpe, dre)
             if node.restriction() is Restriction.Cardinality:
-                cardinalities = self.HashSet()
+                cardinalities = []
                 min_cardinality = node.cardinality('min')
                 max_cardinality = node.cardinality('max')
                 if min_cardinality:
-                    cardinalities.add(self.df.getOWLDataMinCardinality(min_cardinality, dpe, dre))
+                    cardinalities.append(self.df.getOWLDataMinCardinality(min_cardinality, dpe, dre))
                 if max_cardinality is not None:
-                    cardinalities.add(self.df.getOWLDataMaxCardinality(max_cardinality, dpe, dre))
-                if cardinalities.isEmpty():
+                    cardinalities.append(self.df.getOWLDataMaxCardinality(max_cardinality, dpe, dre))
+                if not cardinalities:
                     raise DiagramMalformedError(node, 'missing cardinality')
-                if cardinalities.size() > 1:
-                    return self.df.getOWLObjectIntersectionOf(self.vm.cast(self.Set, cardinalities))
-                return cardinalities.iterator().next()
+                if len(cardinalities) > 1:
+                    return self.df.getOWLObjectIntersectionOf(self.vm.cast(self.Set, self.newHashSet(cardinalities)))
+                return first(cardinalities)
             raise DiagramMalformedError(node, 'unsupported restriction (%s)' % node.restriction())
 
         elif operand.identity() is Identity.Role:
@@ -1049,18 +1132,18 @@ class OWLOntologyExporterWorker(AbstractWorker):
             if node.restriction() is Restriction.Forall:
                 return self.df.getOWLObjectAllValuesFrom(ope, ce)
             if node.restriction() is Restriction.Cardinality:
-                cardinalities = self.HashSet()
+                cardinalities = []
                 min_cardinality = node.cardinality('min')
                 max_cardinality = node.cardinality('max')
                 if min_cardinality:
-                    cardinalities.add(self.df.getOWLObjectMinCardinality(min_cardinality, ope, ce))
+                    cardinalities.append(self.df.getOWLObjectMinCardinality(min_cardinality, ope, ce))
                 if max_cardinality is not None:
-                    cardinalities.add(self.df.getOWLObjectMaxCardinality(max_cardinality, ope, ce))
-                if cardinalities.isEmpty():
+                    cardinalities.append(self.df.getOWLObjectMaxCardinality(max_cardinality, ope, ce))
+                if not cardinalities:
                     raise DiagramMalformedError(node, 'missing cardinality')
-                if cardinalities.size() > 1:
-                    return self.df.getOWLObjectIntersectionOf(self.vm.cast(self.Set, cardinalities))
-                return cardinalities.iterator().next()
+                if len(cardinalities) > 1:
+                    return self.df.getOWLObjectIntersectionOf(self.vm.cast(self.Set, self.newHashSet(cardinalities)))
+                return first(cardinalities)
             raise DiagramMalformedError(node, 'unsupported restriction (%s)' % node.restriction())
 
     def getEnumeration(self, node):
@@ -1073,13 +1156,10 @@ class OWLOntologyExporterWorker(AbstractWorker):
             raise DiagramMalformedError(node, 'unsupported operand(s)')
         f1 = lambda x: x.type() is Item.InputEdge
         f2 = lambda x: x.type() is Item.IndividualNode
-        individuals = self.HashSet()
-        for individual in node.incomingNodes(filter_on_edges=f1, filter_on_nodes=f2):
-            conversion = self.convert(individual)
-            individuals.add(conversion)
-        if individuals.isEmpty():
+        individuals = [self.convert(x) for x in node.incomingNodes(filter_on_edges=f1, filter_on_nodes=f2)]
+        if not individuals:
             raise DiagramMalformedError(node, 'missing operand(s)')
-        return self.df.getOWLObjectOneOf(self.vm.cast(self.Set, individuals))
+        return self.df.getOWLObjectOneOf(self.vm.cast(self.Set, self.newHashSet(individuals)))
 
     def getFacet(self, node):
         """
@@ -1148,14 +1228,12 @@ class OWLOntologyExporterWorker(AbstractWorker):
         """
         if node.identity() is Identity.Unknown:
             raise DiagramMalformedError(node, 'unsupported operand(s)')
-        collection = self.HashSet()
         f1 = lambda x: x.type() is Item.InputEdge
         f2 = lambda x: x.identity() is node.identity()
-        for operand in node.incomingNodes(filter_on_edges=f1, filter_on_nodes=f2):
-            conversion = self.convert(operand)
-            collection.add(conversion)
-        if collection.isEmpty():
+        operands = [self.convert(x) for x in node.incomingNodes(filter_on_edges=f1, filter_on_nodes=f2)]
+        if not operands:
             raise DiagramMalformedError(node, 'missing operand(s)')
+        collection = self.newHashSet(operands)
         if node.identity() is Identity.Concept:
             return self.df.getOWLObjectIntersectionOf(self.vm.cast(self.Set, collection))
         return self.df.getOWLDataIntersectionOf(self.vm.cast(self.Set, collection))
@@ -1250,18 +1328,18 @@ class OWLOntologyExporterWorker(AbstractWorker):
             if node.restriction() is Restriction.Forall:
                 return self.df.getOWLObjectAllValuesFrom(ope, ce)
             if node.restriction() is Restriction.Cardinality:
-                cardinalities = self.HashSet()
+                cardinalities = []
                 min_cardinality = node.cardinality('min')
                 max_cardinality = node.cardinality('max')
                 if min_cardinality:
-                    cardinalities.add(self.df.getOWLObjectMinCardinality(min_cardinality, ope, ce))
+                    cardinalities.append(self.df.getOWLObjectMinCardinality(min_cardinality, ope, ce))
                 if max_cardinality is not None:
-                    cardinalities.add(self.df.getOWLObjectMaxCardinality(max_cardinality, ope, ce))
-                if cardinalities.isEmpty():
+                    cardinalities.append(self.df.getOWLObjectMaxCardinality(max_cardinality, ope, ce))
+                if not cardinalities:
                     raise DiagramMalformedError(node, 'missing cardinality')
-                if cardinalities.size() > 1:
-                    return self.df.getOWLObjectIntersectionOf(self.vm.cast(self.Set, cardinalities))
-                return cardinalities.iterator().next()
+                if len(cardinalities) > 1:
+                    return self.df.getOWLObjectIntersectionOf(self.vm.cast(self.Set, self.newHashSet(cardinalities)))
+                return first(cardinalities)
             raise DiagramMalformedError(node, 'unsupported restriction (%s)' % node.restriction())
 
     def getRole(self, node):
@@ -1309,15 +1387,14 @@ class OWLOntologyExporterWorker(AbstractWorker):
         """
         if not node.inputs:
             raise DiagramMalformedError(node, 'missing operand(s)')
-        collection = self.LinkedList()
+        operands = []
         for operand in [node.diagram.edge(i).other(node) for i in node.inputs]:
             if operand.type() not in {Item.RoleNode, Item.RoleInverseNode}:
                 raise DiagramMalformedError(node, 'unsupported operand (%s)' % operand)
-            conversion = self.convert(operand)
-            collection.add(conversion)
-        if collection.isEmpty():
+            operands.append(self.convert(operand))
+        if not operands:
             raise DiagramMalformedError(node, 'missing operand(s)')
-        return self.vm.cast(self.List, collection)
+        return self.vm.cast(self.List, self.newLinkedList(operands))
 
     def getRoleInverse(self, node):
         """
@@ -1340,14 +1417,12 @@ class OWLOntologyExporterWorker(AbstractWorker):
         """
         if node.identity() is Identity.Unknown:
             raise DiagramMalformedError(node, 'unsupported operand(s)')
-        collection = self.HashSet()
         f1 = lambda x: x.type() is Item.InputEdge
         f2 = lambda x: x.identity() is node.identity()
-        for operand in node.incomingNodes(filter_on_edges=f1, filter_on_nodes=f2):
-            conversion = self.convert(operand)
-            collection.add(conversion)
-        if collection.isEmpty():
+        operands = [self.convert(x) for x in node.incomingNodes(filter_on_edges=f1, filter_on_nodes=f2)]
+        if not operands:
             raise DiagramMalformedError(node, 'missing operand(s)')
+        collection = self.newHashSet(operands)
         if node.identity() is Identity.Concept:
             return self.df.getOWLObjectUnionOf(self.vm.cast(self.Set, collection))
         return self.df.getOWLDataUnionOf(self.vm.cast(self.Set, collection))
@@ -1465,14 +1540,15 @@ class OWLOntologyExporterWorker(AbstractWorker):
         :type edge: DifferentEdge
         """
         if OWLAxiom.DifferentIndividuals in self.axiomsList:
-            collection = self.HashSet()
+            individuals = []
             anns = self.getAxiomAnnotationSet(edge)
             for node in [edge.source, edge.target]:
                 if node.identity() in {Identity.Concept, Identity.Role, Identity.Attribute}:
                     # Perform punning of node
-                    collection.add(self._converted_meta_individuals[node.diagram.name][node.id])
+                    individuals.append(self._converted_meta_individuals[node.diagram.name][node.id])
                 else:
-                    collection.add(self.convert(node))
+                    individuals.append(self.convert(node))
+            collection = self.newHashSet(individuals)
             self.addAxiom(self.df.getOWLDifferentIndividualsAxiom(collection, anns))
 
     def createDisjointClassesAxiom(self, node):
@@ -1482,19 +1558,15 @@ class OWLOntologyExporterWorker(AbstractWorker):
         """
         if OWLAxiom.DisjointClasses in self.axiomsList:
             if node.type() is Item.DisjointUnionNode:
-                collection = self.HashSet()
-                for operand in node.incomingNodes(lambda x: x.type() is Item.InputEdge):
-                    conversion = self.convert(operand)
-                    collection.add(conversion)
+                operands = [self.convert(x) for x in node.incomingNodes(lambda x: x.type() is Item.InputEdge)]
+                collection = self.newHashSet(operands)
                 self.addAxiom(self.df.getOWLDisjointClassesAxiom(self.vm.cast(self.Set, collection)))
             elif node.type() is Item.ComplementNode:
                 operand = first(node.incomingNodes(lambda x: x.type() is Item.InputEdge))
                 conversionA = self.convert(operand)
                 for included in node.adjacentNodes(lambda x: x.type() in {Item.InclusionEdge, Item.EquivalenceEdge}):
                     conversionB = self.convert(included)
-                    collection = self.HashSet()
-                    collection.add(conversionA)
-                    collection.add(conversionB)
+                    collection = self.newHashSet((conversionA, conversionB))
                     self.addAxiom(self.df.getOWLDisjointClassesAxiom(self.vm.cast(self.Set, collection)))
 
     def createDisjointDataPropertiesAxiom(self, edge):
@@ -1505,9 +1577,7 @@ class OWLOntologyExporterWorker(AbstractWorker):
         if OWLAxiom.DisjointDataProperties in self.axiomsList:
             conversionA = self.convert(edge.source)
             conversionB = self.convert(edge.target)
-            collection = self.HashSet()
-            collection.add(conversionA)
-            collection.add(conversionB)
+            collection = self.newHashSet((conversionA, conversionB))
             anns = self.getAxiomAnnotationSet(edge)
             self.addAxiom(self.df.getOWLDisjointDataPropertiesAxiom(collection, anns))
 
@@ -1519,9 +1589,7 @@ class OWLOntologyExporterWorker(AbstractWorker):
         if OWLAxiom.DisjointObjectProperties in self.axiomsList:
             conversionA = self.convert(edge.source)
             conversionB = self.convert(edge.target)
-            collection = self.HashSet()
-            collection.add(conversionA)
-            collection.add(conversionB)
+            collection = self.newHashSet((conversionA, conversionB))
             anns = self.getAxiomAnnotationSet(edge)
             self.addAxiom(self.df.getOWLDisjointObjectPropertiesAxiom(collection, anns))
 
@@ -1565,9 +1633,7 @@ class OWLOntologyExporterWorker(AbstractWorker):
             else:
                 conversionA = self.convert(edge.source)
                 conversionB = self.convert(edge.target)
-                collection = self.HashSet()
-                collection.add(conversionA)
-                collection.add(conversionB)
+                collection = self.newHashSet((conversionA, conversionB))
                 self.addAxiom(self.df.getOWLEquivalentClassesAxiom(collection, anns))
 
     def createEquivalentDataPropertiesAxiom(self, edge):
@@ -1585,9 +1651,7 @@ class OWLOntologyExporterWorker(AbstractWorker):
             else:
                 conversionA = self.convert(edge.source)
                 conversionB = self.convert(edge.target)
-                collection = self.HashSet()
-                collection.add(conversionA)
-                collection.add(conversionB)
+                collection = self.newHashSet((conversionA, conversionB))
                 self.addAxiom(self.df.getOWLEquivalentDataPropertiesAxiom(collection, anns))
 
     def createEquivalentObjectPropertiesAxiom(self, edge):
@@ -1605,9 +1669,7 @@ class OWLOntologyExporterWorker(AbstractWorker):
             else:
                 conversionA = self.convert(edge.source)
                 conversionB = self.convert(edge.target)
-                collection = self.HashSet()
-                collection.add(conversionA)
-                collection.add(conversionB)
+                collection = self.newHashSet((conversionA, conversionB))
                 self.addAxiom(self.df.getOWLEquivalentObjectPropertiesAxiom(collection, anns))
 
     def createHasKeyAxiom(self, node):
@@ -1616,10 +1678,9 @@ class OWLOntologyExporterWorker(AbstractWorker):
         :type node: HasKeyNode
         """
         if OWLAxiom.HasKey in self.axiomsList:
-            properties = self.HashSet()
-            expression = self.convert(node)[0]
-            for prop in self.convert(node)[1:]:
-                properties.add(prop)
+            conversion = self.convert(node)
+            expression = conversion[0]
+            properties = self.newHashSet(conversion[1:])
             self.addAxiom(self.df.getOWLHasKeyAxiom(expression, properties))
 
     def createInverseObjectPropertiesAxiom(self, edge):
@@ -1783,14 +1844,15 @@ class OWLOntologyExporterWorker(AbstractWorker):
         :type edge: SameEdge
         """
         if OWLAxiom.SameIndividual in self.axiomsList:
-            collection = self.HashSet()
+            individuals = []
             anns = self.getAxiomAnnotationSet(edge)
             for node in [edge.source, edge.target]:
                 if node.identity() in {Identity.Concept, Identity.Role, Identity.Attribute}:
                     # Perform punning of node
-                    collection.add(self._converted_meta_individuals[node.diagram.name][node.id])
+                    individuals.append(self._converted_meta_individuals[node.diagram.name][node.id])
                 else: # Node is already an IndividualNode
-                    collection.add(self.convert(node))
+                    individuals.append(self.convert(node))
+            collection = self.newHashSet(individuals)
             self.addAxiom(self.df.getOWLSameIndividualAxiom(collection, anns))
 
     def createSubclassOfAxiom(self, edge):
@@ -1924,6 +1986,135 @@ class OWLOntologyExporterWorker(AbstractWorker):
                     proj = first(dataset.projects(URIRef(str(annotation.value))))
                     self.createNDCNamedIndividual(proj)
 
+    #############################################
+    #   AXIOMS GENERATION
+    #################################
+
+    def createNodeAxioms(self, node):
+        """
+        Generate the OWL 2 axioms originating from the given node.
+        :type node: AbstractNode
+        """
+        if node.type() is Item.DisjointUnionNode:
+            self.createDisjointClassesAxiom(node)
+        elif node.type() is Item.ComplementNode:
+            if node.identity() is Identity.Concept:
+                self.createDisjointClassesAxiom(node)
+        elif node.type() is Item.DomainRestrictionNode:
+            self.createPropertyDomainAxiom(node)
+        elif node.type() is Item.RangeRestrictionNode:
+            self.createPropertyRangeAxiom(node)
+        elif node.type() is Item.HasKeyNode:
+            self.createHasKeyAxiom(node)
+
+        if node.isPredicate():
+            self.createAnnotationAssertionAxioms(node)
+
+    def createEdgeAxioms(self, edge):
+        """
+        Generate the OWL 2 axioms originating from the given edge.
+        :type edge: AbstractEdge
+        """
+        #############################################
+        # INCLUSION
+        #################################
+
+        if edge.type() is Item.InclusionEdge:
+            # CONCEPTS
+            if edge.source.identity() is Identity.Concept and edge.target.identity() is Identity.Concept:
+                self.createSubclassOfAxiom(edge)
+            # ROLES
+            elif edge.source.identity() is Identity.Role and edge.target.identity() is Identity.Role:
+                if edge.source.type() is Item.RoleChainNode:
+                    self.createSubPropertyChainOfAxiom(edge)
+                elif edge.source.type() in {Item.RoleNode, Item.RoleInverseNode}:
+                    if edge.target.type() is Item.ComplementNode:
+                        self.createDisjointObjectPropertiesAxiom(edge)
+                    elif edge.target.type() in {Item.RoleNode, Item.RoleInverseNode}:
+                        self.createSubObjectPropertyOfAxiom(edge)
+            # ATTRIBUTES
+            elif edge.source.identity() is Identity.Attribute and edge.target.identity() is Identity.Attribute:
+                if edge.source.type() is Item.AttributeNode:
+                    if edge.target.type() is Item.ComplementNode:
+                        self.createDisjointDataPropertiesAxiom(edge)
+                    elif edge.target.type() is Item.AttributeNode:
+                        self.createSubDataPropertyOfAxiom(edge)
+            # VALUE DOMAIN (ONLY DATA PROPERTY RANGE)
+            elif edge.source.type() is Item.RangeRestrictionNode and edge.target.identity() is Identity.ValueDomain:
+                # This is being handled already in createPropertyRangeAxiom.
+                pass
+            else:
+                raise DiagramMalformedError(edge, 'invalid inclusion assertion')
+
+        #############################################
+        # EQUIVALENCE
+        #################################
+
+        elif edge.type() is Item.EquivalenceEdge:
+
+            # CONCEPTS
+            if edge.source.identity() is Identity.Concept and edge.target.identity() is Identity.Concept:
+                self.createEquivalentClassesAxiom(edge)
+            # ROLES
+            elif edge.source.identity() is Identity.Role and edge.target.identity() is Identity.Role:
+                if Item.RoleInverseNode in {edge.source.type(), edge.target.type()}:
+                    self.createInverseObjectPropertiesAxiom(edge)
+                else:
+                    self.createEquivalentObjectPropertiesAxiom(edge)
+            # ATTRIBUTES
+            elif edge.source.identity() is Identity.Attribute and edge.target.identity() is Identity.Attribute:
+                self.createEquivalentDataPropertiesAxiom(edge)
+            else:
+                raise DiagramMalformedError(edge, 'invalid equivalence assertion')
+
+        #############################################
+        # MEMBERSHIP
+        #################################
+
+        elif edge.type() is Item.MembershipEdge:
+
+            # CONCEPTS
+            if Identity.Individual in edge.source.identities() and edge.target.identity() is Identity.Concept:
+                self.createClassAssertionAxiom(edge)
+            # ROLES
+            elif edge.source.identity() is Identity.RoleInstance:
+                if edge.target.type() is Item.ComplementNode:
+                    self.createNegativeObjectPropertyAssertionAxiom(edge)
+                else:
+                    self.createObjectPropertyAssertionAxiom(edge)
+            # ATTRIBUTES
+            elif edge.source.identity() is Identity.AttributeInstance:
+                if edge.target.type() is Item.ComplementNode:
+                    self.createNegativeDataPropertyAssertionAxiom(edge)
+                else:
+                    self.createDataPropertyAssertionAxiom(edge)
+            else:
+                raise DiagramMalformedError(edge, 'invalid membership assertion')
+
+        #############################################
+        # SAME
+        #################################
+
+        elif edge.type() is Item.SameEdge:
+            if edge.source.identity() in {Identity.Individual, Identity.Concept, Identity.Role, Identity.Attribute} and \
+               edge.target.identity() in {Identity.Individual, Identity.Concept, Identity.Role, Identity.Attribute} and \
+               edge.source.identities().intersection(edge.target.identities()):
+                self.createSameIndividualAxiom(edge)
+            else:
+                raise DiagramMalformedError(edge, 'invalid sameIndividual assertion')
+
+        #############################################
+        # DIFFERENT
+        #################################
+
+        elif edge.type() is Item.DifferentEdge:
+            if edge.source.identity() in {Identity.Individual, Identity.Concept, Identity.Role, Identity.Attribute} and \
+               edge.target.identity() in {Identity.Individual, Identity.Concept, Identity.Role, Identity.Attribute} and \
+               edge.source.identities().intersection(edge.target.identities()):
+                self.createDifferentIndividualsAxiom(edge)
+            else:
+                raise DiagramMalformedError(edge, 'invalid differentIndividuals assertion')
+
     #############################################
     #   MAIN WORKER
     #################################
@@ -1961,9 +2152,10 @@ class OWLOntologyExporterWorker(AbstractWorker):
             #################################
 
             if OWLAxiom.Annotation in self.axiomsList:
-                for annotation in self.project.ontologyIRI.annotationAssertions:
-                    value = self.getOWLApiAnnotation(annotation)
-                    self.ontology.applyChange(self.AddOntologyAnnotation(self.ontology, value))
+                changes = [self.AddOntologyAnnotation(self.ontology, self.getOWLApiAnnotation(annotation))
+                           for annotation in self.project.ontologyIRI.annotationAssertions]
+                if changes:
+                    self.man.applyChanges(self.newLinkedList(changes))
 
             self.createNDCNamedIndividuals()
             LOGGER.debug('Initialized OWL 2 Ontology: %s', ontologyIRI)
@@ -1972,36 +2164,19 @@ class OWLOntologyExporterWorker(AbstractWorker):
             # NODES PRE-PROCESSING
             #################################
 
-            # for node in self.project.nodes():
             for diagram in self.selected_diagrams:
-                for node in diagram.nodes():
-                    self.convert(node)
-                    self.step(+1)
+                self.convertDiagram(diagram)
 
-            LOGGER.debug('Pre-processed %s nodes into OWL 2 expressions', len(self.converted()))
+            LOGGER.debug('Pre-processed %s nodes into OWL 2 expressions (cache hits = %s)',
+                         self.cacheMisses(), self.cacheHits())
 
             #############################################
             # AXIOMS FROM NODES
             #################################
 
-            # for node in self.project.nodes():
             for diagram in self.selected_diagrams:
                 for node in diagram.nodes():
-                    if node.type() is Item.DisjointUnionNode:
-                        self.createDisjointClassesAxiom(node)
-                    elif node.type() is Item.ComplementNode:
-                        if node.identity() is Identity.Concept:
-                            self.createDisjointClassesAxiom(node)
-                    elif node.type() is Item.DomainRestrictionNode:
-                        self.createPropertyDomainAxiom(node)
-                    elif node.type() is Item.RangeRestrictionNode:
-                        self.createPropertyRangeAxiom(node)
-                    elif node.type() is Item.HasKeyNode:
-                        self.createHasKeyAxiom(node)
-
-                    if node.isPredicate():
-                        self.createAnnotationAssertionAxioms(node)
-
+                    self.createNodeAxioms(node)
                     self.step(+1)
 
             LOGGER.debug('Generated OWL 2 axioms from nodes (axioms = %s)', len(self.axioms()))
@@ -2010,110 +2185,9 @@ class OWLOntologyExporterWorker(AbstractWorker):
             # AXIOMS FROM EDGES
             #################################
 
-            # for edge in self.project.edges():
             for diagram in self.selected_diagrams:
                 for edge in diagram.edges():
-
-                    #############################################
-                    # INCLUSION
-                    #################################
-
-                    if edge.type() is Item.InclusionEdge:
-                        # CONCEPTS
-                        if edge.source.identity() is Identity.Concept and edge.target.identity() is Identity.Concept:
-                            self.createSubclassOfAxiom(edge)
-                        # ROLES
-                        elif edge.source.identity() is Identity.Role and edge.target.identity() is Identity.Role:
-                            if edge.source.type() is Item.RoleChainNode:
-                                self.createSubPropertyChainOfAxiom(edge)
-                            elif edge.source.type() in {Item.RoleNode, Item.RoleInverseNode}:
-                                if edge.target.type() is Item.ComplementNode:
-                                    self.createDisjointObjectPropertiesAxiom(edge)
-                                elif edge.target.type() in {Item.RoleNode, Item.RoleInverseNode}:
-                                    self.createSubObjectPropertyOfAxiom(edge)
-                        # ATTRIBUTES
-                        elif edge.source.identity() is Identity.Attribute and edge.target.identity() is Identity.Attribute:
-                            if edge.source.type() is Item.AttributeNode:
-                                if edge.target.type() is Item.ComplementNode:
-                                    self.createDisjointDataPropertiesAxiom(edge)
-                                elif edge.target.type() is Item.AttributeNode:
-                                    self.createSubDataPropertyOfAxiom(edge)
-                        # VALUE DOMAIN (ONLY DATA PROPERTY RANGE)
-                        elif edge.source.type() is Item.RangeRestrictionNode and edge.target.identity() is Identity.ValueDomain:
-                            # This is being handled already in createPropertyRangeAxiom.
-                            pass
-                        else:
-                            raise DiagramMalformedError(edge, 'invalid inclusion assertion')
-
-                    #############################################
-                    # EQUIVALENCE
-                    #################################
-
-                    elif edge.type() is Item.EquivalenceEdge:
-
-                        # CONCEPTS
-                        if edge.source.identity() is Identity.Concept and edge.target.identity() is Identity.Concept:
-                            self.createEquivalentClassesAxiom(edge)
-                        # ROLES
-                        elif edge.source.identity() is Identity.Role and edge.target.identity() is Identity.Role:
-                            if Item.RoleInverseNode in {edge.source.type(), edge.target.type()}:
-                                self.createInverseObjectPropertiesAxiom(edge)
-                            else:
-                                self.createEquivalentObjectPropertiesAxiom(edge)
-                        # ATTRIBUTES
-                        elif edge.source.identity() is Identity.Attribute and edge.target.identity() is Identity.Attribute:
-                            self.createEquivalentDataPropertiesAxiom(edge)
-                        else:
-                            raise DiagramMalformedError(edge, 'invalid equivalence assertion')
-
-                    #############################################
-                    # MEMBERSHIP
-                    #################################
-
-                    elif edge.type() is Item.MembershipEdge:
-
-                        # CONCEPTS
-                        if Identity.Individual in edge.source.identities() and edge.target.identity() is Identity.Concept:
-                            self.createClassAssertionAxiom(edge)
-                        # ROLES
-                        elif edge.source.identity() is Identity.RoleInstance:
-                            if edge.target.type() is Item.ComplementNode:
-                                self.createNegativeObjectPropertyAssertionAxiom(edge)
-                            else:
-                                self.createObjectPropertyAssertionAxiom(edge)
-                        # ATTRIBUTES
-                        elif edge.source.identity() is Identity.AttributeInstance:
-                            if edge.target.type() is Item.ComplementNode:
-                                self.createNegativeDataPropertyAssertionAxiom(edge)
-                            else:
-                                self.createDataPropertyAssertionAxiom(edge)
-                        else:
-                            raise DiagramMalformedError(edge, 'invalid membership assertion')
-
-                    #############################################
-                    # SAME
-                    #################################
-
-                    elif edge.type() is Item.SameEdge:
-                        if edge.source.identity() in {Identity.Individual, Identity.Concept, Identity.Role, Identity.Attribute} and \
-                           edge.target.identity() in {Identity.Individual, Identity.Concept, Identity.Role, Identity.Attribute} and \
-                           edge.source.identities().intersection(edge.target.identities()):
-                            self.createSameIndividualAxiom(edge)
-                        else:
-                            raise DiagramMalformedError(edge, 'invalid sameIndividual assertion')
-
-                    #############################################
-                    # DIFFERENT
-                    #################################
-
-                    elif edge.type() is Item.DifferentEdge:
-                        if edge.source.identity() in {Identity.Individual, Identity.Concept, Identity.Role, Identity.Attribute} and \
-                           edge.target.identity() in {Identity.Individual, Identity.Concept, Identity.Role, Identity.Attribute} and \
-                           edge.source.identities().intersection(edge.target.identities()):
-                            self.createDifferentIndividualsAxiom(edge)
-                        else:
-                            raise DiagramMalformedError(edge, 'invalid differentIndividuals assertion')
-
+                    self.createEdgeAxioms(edge)
                     self.step(+1)
 
             LOGGER.debug('Generated OWL 2 axioms from edges (axioms = %s)', len(self.axioms()))
@@ -2124,8 +2198,7 @@ class OWLOntologyExporterWorker(AbstractWorker):
 
             LOGGER.debug('Applying OWL 2 axioms on the OWL 2 Ontology')
 
-            for axiom in self.axioms():
-                self.man.addAxiom(self.ontology, axiom)
+            self.man.addAxioms(self.ontology, self.newHashSet(self.axioms()))
 
             #############################################
             # IMPORT DECLARATIONS
@@ -2204,3 +2277,312 @@ class OWLOntologyExporterWorker(AbstractWorker):
         finally:
             self.vm.detachThreadFromJVM()
             self.finished.emit()
+
+
+class OWLOntologyMirror(QtCore.QObject):
+    """
+    Extends QtCore.QObject providing a long-lived OWL 2 translation of a Project.
+    The mirror keeps an OWLAPI ontology in sync with the project: axioms are tracked
+    per diagram, and only the diagrams affected by a change are re-translated (and
+    their axiom differences applied to the ontology) the next time it is requested.
+    """
+    def __init__(self, project):
+        """
+        Initialize the OWL 2 ontology mirror.
+        :type project: Project
+        """
+        super().__init__(project)
+        self.project = project
+        self.vm = getJavaVM()
+        self.df = None
+        self.man = None
+        # RECURSIVE, SO THAT getOntology CAN BE CALLED WHILE THE ONTOLOGY IS LOCKED
+        self.mutex = QtCore.QMutex(QtCore.QMutex.Recursive)
+        self.ontology = None
+        self.ontologyID = None
+
+        self._annotations = set()
+        self._dirty = set()
+        self._headerDirty = True
+        self._headerAxioms = set()
+        self._imports = dict()
+        self._partitions = dict()
+        self._refcount = dict()
+
+        for diagram in project.diagrams():
+            self.onDiagramAdded(diagram)
+        connect(project.sgnDiagramAdded, self.onDiagramAdded)
+        connect(project.sgnDiagramRemoved, self.onDiagramRemoved)
+        connect(project.sgnItemAdded, self.onItemChanged)
+        connect(project.sgnItemRemoved, self.onItemChanged)
+        connect(project.sgnItemUpdated, self.onItemChanged)
+        connect(project.sgnOntologyIRIModified, self.onOntologyIRIModified)
+        self.connectOntologyIRISignals(project.ontologyIRI)
+
+    #############################################
+    #   SLOTS
+    #################################
+
+    @QtCore.pyqtSlot()
+    def onHeaderChanged(self):
+        """
+        Executed when the ontology annotations change.
+        """
+        self._headerDirty = True
+
+    @QtCore.pyqtSlot(QtWidgets.QGraphicsScene)
+    def onDiagramAdded(self, diagram):
+        """
+        Executed when a diagram is added to the project.
+        :type diagram: Diagram
+        """
+        connect(diagram.sgnUpdated, self.onDiagramUpdated)
+        self._dirty.add(diagram)
+
+    @QtCore.pyqtSlot(QtWidgets.QGraphicsScene)
+    def onDiagramRemoved(self, diagram):
+        """
+        Executed when a diagram is removed from the project.
+        :type diagram: Diagram
+        """
+        disconnect(diagram.sgnUpdated, self.onDiagramUpdated)
+        self._dirty.add(diagram)
+
+    @QtCore.pyqtSlot()
+    def onDiagramUpdated(self):
+        """
+        Executed when a diagram of the project is updated.
+        """
+        self._dirty.add(self.sender())
+
+    @QtCore.pyqtSlot(QtWidgets.QGraphicsScene, QtWidgets.QGraphicsItem)
+    def onItemChanged(self, diagram, _):
+        """
+        Executed when an item is added, removed or updated in the project.
+        :type diagram: Diagram
+        """
+        self._dirty.add(diagram)
+
+    @QtCore.pyqtSlot(IRI)
+    def onOntologyIRIModified(self, iri):
+        """
+        Executed when the project ontology IRI changes.
+        :type iri: IRI
+        """
+        self.connectOntologyIRISignals(iri)
+        self._headerDirty = True
+
+    #############################################
+    #   INTERFACE
+    #################################
+
+    def connectOntologyIRISignals(self, iri):
+        """
+        Connect the signals of the given ontology IRI to the header invalidation slot.
+        :type iri: IRI
+        """
+        if iri:
+            connect(iri.sgnAnnotationAdded, self.onHeaderChanged)
+            connect(iri.sgnAnnotationRemoved, self.onHeaderChanged)
+            connect(iri.sgnAnnotationModified, self.onHeaderChanged)
+
+    def getOntology(self):
+        """
+        Returns the OWL 2 ontology mirroring the project, re-translating
+        only the diagrams which changed since the last request.
+        The returned ontology is modified in place by the following requests, possibly from
+        other threads: use lockOntology to keep it unchanged while it is being used.
+        The calling thread must be attached to the JVM.
+        :rtype: OWLOntology
+        """
+        with self.lockOntology() as ontology:
+            return ontology
+
+    @contextmanager
+    def lockOntology(self):
+        """
+        Context manager which synchronizes the OWL 2 ontology mirroring the project (see getOntology)
+        and yields it, keeping other threads from modifying it until the context exits (e.g. while a
+        reasoner is running on it). The calling thread must be attached to the JVM.
+        :rtype: OWLOntology
+        """
+        self.mutex.lock()
+        try:
+            if not self.ontology:
+                self.initialize()
+            worker = OWLOntologyExporterWorker(self.project, axioms={x for x in OWLAxiom}, diagrams=[])
+            worker.man = self.man
+            worker.df = self.df
+            worker.ontology = self.ontology
+            self.syncHeader(worker)
+            self.syncImports(worker)
+            self.syncDiagrams(worker)
+            yield self.ontology
+        finally:
+            self.mutex.unlock()
+
+    def initialize(self):
+        """
+        Create the (empty) mirror ontology in the ontology manager shared by the project workers.
+        """
+        self.man = getOWLOntologyManager(self.project)
+        self.df = self.man.getOWLDataFactory()
+        self.ontologyID = self.getOntologyID()
+        self.ontology = self.man.createOntology(self.createOntologyID(*self.ontologyID))
+        self._headerDirty = True
+        self._dirty.update(self.project.diagrams())
+        LOGGER.debug('Initialized OWL 2 ontology mirror: %s', self.ontologyID[0])
+
+    def createOntologyID(self, ontologyIRI, versionIRI):
+        """
+        Build an OWLOntologyID using the given ontology and version IRIs.
+        :type ontologyIRI: str
+        :type versionIRI: str
+        :rtype: OWLOntologyID
+        """
+        IRIClass = self.vm.getJavaClass('org.semanticweb.owlapi.model.IRI')
+        OWLOntologyID = self.vm.getJavaClass('org.semanticweb.owlapi.model.OWLOntologyID')
+        if versionIRI:
+            return OWLOntologyID(IRIClass.create(ontologyIRI), IRIClass.create(versionIRI))
+        return OWLOntologyID(IRIClass.create(ontologyIRI))
+
+    def getOntologyID(self):
+        """
+        Returns the ontology and version IRIs of the project.
+        :rtype: tuple
+        """
+        return str(self.project.ontologyIRI), self.project.version
+
+    def applyAxioms(self, worker, added, removed):
+        """
+        Update axiom reference counts, applying to the ontology the axioms
+        which are no longer produced by any partition or newly produced.
+        :type worker: OWLOntologyExporterWorker
+        :type added: set
+        :type removed: set
+        :rtype: tuple
+        """
+        toRemove = []
+        for axiom in removed:
+            self._refcount[axiom] -= 1
+            if not self._refcount[axiom]:
+                del self._refcount[axiom]
+                toRemove.append(axiom)
+        toAdd = []
+        for axiom in added:
+            if axiom not in self._refcount:
+                self._refcount[axiom] = 0
+                toAdd.append(axiom)
+            self._refcount[axiom] += 1
+        if toRemove:
+            self.man.removeAxioms(self.ontology, worker.newHashSet(toRemove))
+        if toAdd:
+            self.man.addAxioms(self.ontology, worker.newHashSet(toAdd))
+        return len(toAdd), len(toRemove)
+
+    def syncDiagrams(self, worker):
+        """
+        Re-translate the diagrams which changed since the last synchronization.
+        If the translation of a diagram fails, its partition is left untouched and the
+        diagrams not synchronized yet are kept dirty, so that the next request retries them.
+        :type worker: OWLOntologyExporterWorker
+        """
+        dirty, self._dirty = self._dirty, set()
+        pending = set(dirty)
+        diagrams = self.project.diagrams()
+        try:
+            for diagram in dirty:
+                previous = self._partitions.get(diagram, set())
+                current = set()
+                if diagram in diagrams:
+                    worker._axioms = set()
+                    worker.convertDiagram(diagram)
+                    for node in diagram.nodes():
+                        worker.createNodeAxioms(node)
+                    for edge in diagram.edges():
+                        worker.createEdgeAxioms(edge)
+                    current = worker.axioms()
+                added, removed = self.applyAxioms(worker, current - previous, previous - current)
+                if diagram in diagrams:
+                    self._partitions[diagram] = current
+                else:
+                    self._partitions.pop(diagram, None)
+                pending.discard(diagram)
+                LOGGER.debug('Synchronized OWL 2 ontology mirror for diagram %s (+%s, -%s)', diagram.name, added, removed)
+        finally:
+            self._dirty.update(pending)
+
+    def syncHeader(self, worker):
+        """
+        Synchronize the ontology ID, the ontology annotations and the NDC individuals.
+        :type worker: OWLOntologyExporterWorker
+        """
+        ontologyID = self.getOntologyID()
+        if ontologyID != self.ontologyID:
+            SetOntologyID = self.vm.getJavaClass('org.semanticweb.owlapi.model.SetOntologyID')
+            self.man.applyChange(SetOntologyID(self.ontology, self.createOntologyID(*ontologyID)))
+            self.ontologyID = ontologyID
+        if self._headerDirty:
+            self._headerDirty = False
+            AddOntologyAnnotation = self.vm.getJavaClass('org.semanticweb.owlapi.model.AddOntologyAnnotation')
+            RemoveOntologyAnnotation = self.vm.getJavaClass('org.semanticweb.owlapi.model.RemoveOntologyAnnotation')
+            annotations = {worker.getOWLApiAnnotation(x) for x in self.project.ontologyIRI.annotationAssertions}
+            changes = [RemoveOntologyAnnotation(self.ontology, x) for x in self._annotations - annotations]
+            changes.extend(AddOntologyAnnotation(self.ontology, x) for x in annotations - self._annotations)
+            if changes:
+                self.man.applyChanges(worker.newLinkedList(changes))
+            self._annotations = annotations
+            worker._axioms = set()
+            worker.createNDCNamedIndividuals()
+            current = worker.axioms()
+            self.applyAxioms(worker, current - self._headerAxioms, self._headerAxioms - current)
+            self._headerAxioms = current
+
+    def syncImports(self, worker):
+        """
+        Synchronize import declarations and load imported ontologies into the manager.
+        :type worker: OWLOntologyExporterWorker
+        """
+        imports = {(x.ontologyIRI, x.docLocation, x.isLocalDocument) for x in self.project.importedOntologies}
+        if imports == set(self._imports):
+            return
+        AddImport = self.vm.getJavaClass('org.semanticweb.owlapi.model.AddImport')
+        RemoveImport = self.vm.getJavaClass('org.semanticweb.owlapi.model.RemoveImport')
+        for key in set(self._imports) - imports:
+            declaration, loaded = self._imports.pop(key)
+            self.man.applyChange(RemoveImport(self.ontology, declaration))
+            if loaded:
+                self.man.removeOntology(loaded)
+        for key in imports - set(self._imports):
+            ontologyIRI, docLocation, isLocalDocument = key
+            impOntIRI = worker.IRI.create(ontologyIRI)
+            declaration = self.df.getOWLImportsDeclaration(impOntIRI)
+            self.man.applyChange(AddImport(self.ontology, declaration))
+            try:
+                if isLocalDocument:
+                    docObj = worker.JavaFileClass(docLocation)
+                else:
+                    docObj = worker.URIClass(docLocation)
+                docLocationIRI = worker.IRI.create(docObj)
+                self.man.getIRIMappers().add(worker.IRIMapperClass(impOntIRI, docLocationIRI))
+                loaded = self.man.loadOntology(impOntIRI)
+            except Exception as e:
+                LOGGER.exception('The imported ontology <{}> cannot be loaded.\nError:{}'.format(ontologyIRI, str(e)))
+                self._imports[key] = (declaration, None)
+            else:
+                LOGGER.debug('Ontology ({}) correctly loaded.'.format(ontologyIRI))
+                self._imports[key] = (declaration, loaded)
+
+
+def getOWLOntologyMirror(project):
+    """
+    Returns the OWL 2 ontology mirror of the given project, creating it if needed.
+    The mirror is created as a child of the project, hence this function must
+    be called from the thread owning the project (i.e. the GUI thread).
+    :type project: Project
+    :rtype: OWLOntologyMirror
+    """
+    mirror = project.findChild(OWLOntologyMirror)
+    if not mirror:
+        mirror = OWLOntologyMirror(project)
+    return mirror
@@ -121,10 +121,25 @@ def fwrite(content, path, newline=None):
     :type path: str
     :type newline: str, optional
     """
+    fwritelines((content,), path, newline)
+
+
+def fwritelines(chunks, path, newline=None):
+    """
+    Safely write the content produced by the given 'chunks' iterable in the file
+    identified by the given 'path', one chunk at a time, so that the whole content
+    never needs to be held in memory. As for fwrite, an already existing file is
+    replaced only once all the chunks have been written successfully.
+    Optional newline parameter has the same role as `newline` in :func:`io.open`.
+    :type chunks: T <= iterable
+    :type path: str
+    :type newline: str, optional
+    """
     components = os.path.split(expandPath(path))
     stage = os.path.join(components[0], '.{0}'.format(components[1]))
     with io.open(stage, 'w', encoding='utf8', newline=newline) as ptr:
-        ptr.write(content)
+        for chunk in chunks:
+            ptr.write(chunk)
     fremove(path)
     frename(stage, path)
 
@@ -60,6 +60,22 @@ def clamp(val, minval=None, maxval=None):
     return val
 
 
+def chunks(iterable, size):
+    """
+    Generator which splits the given iterable into lists of at most size elements.
+    :type iterable: iterable
+    :type size: int
+    :rtype: generator
+    """
+    if size < 1:
+        raise ValueError('size ({0}) MUST be a positive integer'.format(size))
+    iterator = iter(iterable)
+    chunk = list(itertools.islice(iterator, size))
+    while chunk:
+        yield chunk
+        chunk = list(itertools.islice(iterator, size))
+
+
 def first(iterable, default=None, filter_on_item=lambda x: True):
     """
     Returns the first element in 'iterable' if it exists, otherwise it returns the given default.
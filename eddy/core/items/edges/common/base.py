@@ -60,6 +60,7 @@ class AbstractEdge(AbstractItem):
     """
     __metaclass__ = ABCMeta
 
+    OverlapMargin = 100.0  # Margin (in pixels) of the area cached when looking up overlapping nodes
     Prefix = 'e'
 
     def __init__(self, source, target=None, breakpoints=None, **kwargs):
@@ -81,6 +82,10 @@ class AbstractEdge(AbstractItem):
         self.path = Polygon(QtGui.QPainterPath())
         self.selection = Polygon(QtGui.QPainterPath())
 
+        self._boundingRect = QtCore.QRectF()
+        self._shape = QtGui.QPainterPath()
+        self._overlapCache = (None, 0, QtCore.QRectF(), None)
+
         self.mp_AnchorNode = None
         self.mp_AnchorNodePos = None
         self.mp_BreakPoint = None
@@ -250,6 +255,13 @@ class AbstractEdge(AbstractItem):
 
         self.breakpoints[breakpoint] = pos
 
+    def boundingRect(self):
+        """
+        Returns the shape bounding rect (cached until the next call to updateEdge).
+        :rtype: QRectF
+        """
+        return self._boundingRect
+
     def canDraw(self):
         """
         Check whether we have to draw the edge or not.
@@ -279,6 +291,14 @@ class AbstractEdge(AbstractItem):
         """
         pass
 
+    @abstractmethod
+    def createBoundingRect(self):
+        """
+        Create the shape bounding rect.
+        :rtype: QRectF
+        """
+        pass
+
     def createPath(self, source, target, points):
         """
         Returns a list of QtCore.QLineF instance representing all the visible edge pieces.
@@ -296,6 +316,14 @@ class AbstractEdge(AbstractItem):
                     if (not A.contains(x.p1()) or not A.contains(x.p2())) and \
                         (not B or (not B.contains(x.p1()) or not B.contains(x.p2())))]
 
+    @abstractmethod
+    def createShape(self):
+        """
+        Create the shape of this item as a QPainterPath in local coordinates.
+        :rtype: QPainterPath
+        """
+        pass
+
     def isSwapAllowed(self):
         """
         Returns True if this edge can be swapped, False otherwise.
@@ -324,6 +352,38 @@ class AbstractEdge(AbstractItem):
             return self.source
         raise AttributeError('node {0} is not attached to edge {1}'.format(node, self))
 
+    def overlappingDepth(self, default):
+        """
+        Returns the highest depth of the nodes whose bounding rect may overlap the bounding rect
+        of this edge, or the given default if there is none. The lookup is performed on an area
+        slightly larger than the edge bounding rect, and its result is reused as long as the edge
+        stays within that area and no node other than the endpoints of this edge is added, removed,
+        moved, resized or restacked within it (see Diagram.logNodeGeometry).
+        :type default: float
+        :rtype: float
+        """
+        diagram = self.diagram
+        if not diagram:
+            return default
+        rect = self.sceneBoundingRect()
+        cachedDiagram, version, area, depth = self._overlapCache
+        skip = {id(self.source), id(self.target)}
+        if cachedDiagram is not diagram or not area.contains(rect) or \
+                diagram.nodeGeometryChanged(version, area, skip):
+            margin = AbstractEdge.OverlapMargin
+            area = rect.adjusted(-margin, -margin, margin, margin)
+            nodes = diagram.items(area, QtCore.Qt.IntersectsItemBoundingRect, edges=False)
+            depth = nodes[0].zValue() if nodes else None
+        self._overlapCache = (diagram, diagram.nodeGeometryVersion, area, depth)
+        return default if depth is None else max(depth, default)
+
+    def shape(self):
+        """
+        Returns the shape of this item as a QPainterPath in local coordinates (cached until the next call to updateEdge).
+        :rtype: QPainterPath
+        """
+        return self._shape
+
     def updateEdge(self, selected=None, visible=None, breakpoint=None, anchor=None, **kwargs):
         """
         Update the current edge.
@@ -376,18 +436,13 @@ class AbstractEdge(AbstractItem):
             polygon.setPen(bpPen)
         self.selection.setBrush(selectionBrush)
 
-        ## Z-VALUE (DEPTH)
-        try:
-            zValue = max(*(x.zValue() for x in self.collidingItems())) + 0.1
-        except TypeError:
-            zValue = source.zValue() + 0.1
-            if source.label:
-                zValue = max(zValue, source.label.zValue())
-            if target:
-                zValue = max(zValue, target.zValue())
-                if target.label:
-                    zValue = max(zValue, target.label.zValue())
-        self.setZValue(zValue)
+        ## BOUNDING RECT + SHAPE (GEOMETRY CACHE)
+        self._boundingRect = self.createBoundingRect()
+        self._shape = self.createShape()
+
+        ## Z-VALUE (DEPTH) --> NB: EDGES ARE STACKED ABOVE THE NODES THEY OVERLAP, NOT ABOVE OTHER EDGES
+        nodes = [source, target] if target else [source]
+        self.setZValue(self.overlappingDepth(max(x.zValue() for x in nodes)) + 0.1)
 
         ## FORCE CACHE REGENERATION
         self.setCacheMode(AbstractItem.NoCache)
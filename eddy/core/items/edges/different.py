@@ -61,9 +61,21 @@ class DifferentEdge(AxiomEdge):
     #   INTERFACE
     #################################
 
-    def boundingRect(self):
+    def copy(self, diagram):
+        """
+        Create a copy of the current item.
+        :type diagram: Diagram
+        """
+        return diagram.factory.create(self.type(), **{
+            'id': self.id,
+            'source': self.source,
+            'target': self.target,
+            'breakpoints': self.breakpoints[:],
+        })
+
+    def createBoundingRect(self):
         """
-        Returns the shape bounding rect.
+        Create the shape bounding rect.
         :rtype: QRectF
         """
         path = QtGui.QPainterPath()
@@ -74,17 +86,21 @@ class DifferentEdge(AxiomEdge):
             path.addEllipse(polygon.geometry())
         return path.controlPointRect()
 
-    def copy(self, diagram):
+    def createShape(self):
         """
-        Create a copy of the current item.
-        :type diagram: Diagram
+        Create the shape of this item as a QPainterPath in local coordinates.
+        :rtype: QPainterPath
         """
-        return diagram.factory.create(self.type(), **{
-            'id': self.id,
-            'source': self.source,
-            'target': self.target,
-            'breakpoints': self.breakpoints[:],
-        })
+        path = QtGui.QPainterPath()
+        path.addPath(self.selection.geometry())
+
+        if self.isSelected():
+            for polygon in self.handles:
+                path.addEllipse(polygon.geometry())
+            for polygon in self.anchors.values():
+                path.addEllipse(polygon.geometry())
+
+        return path
 
     def paint(self, painter, option, widget=None):
         """
@@ -135,22 +151,6 @@ class DifferentEdge(AxiomEdge):
         """
         self.label.setPos(pos)
 
-    def shape(self):
-        """
-        Returns the shape of this item as a QPainterPath in local coordinates.
-        :rtype: QPainterPath
-        """
-        path = QtGui.QPainterPath()
-        path.addPath(self.selection.geometry())
-
-        if self.isSelected():
-            for polygon in self.handles:
-                path.addEllipse(polygon.geometry())
-            for polygon in self.anchors.values():
-                path.addEllipse(polygon.geometry())
-
-        return path
-
     def text(self):
         """
         Returns the label text.
@@ -61,9 +61,21 @@ class EquivalenceEdge(AxiomEdge):
     #   INTERFACE
     #################################
 
-    def boundingRect(self):
+    def copy(self, diagram):
+        """
+        Create a copy of the current item.
+        :type diagram: Diagram
         """
-        Returns the shape bounding rect.
+        return diagram.factory.create(self.type(), **{
+            'id': self.id,
+            'source': self.source,
+            'target': self.target,
+            'breakpoints': self.breakpoints[:],
+        })
+
+    def createBoundingRect(self):
+        """
+        Create the shape bounding rect.
         :rtype: QRectF
         """
         path = QtGui.QPainterPath()
@@ -76,18 +88,6 @@ class EquivalenceEdge(AxiomEdge):
             path.addEllipse(polygon.geometry())
         return path.controlPointRect()
 
-    def copy(self, diagram):
-        """
-        Create a copy of the current item.
-        :type diagram: Diagram
-        """
-        return diagram.factory.create(self.type(), **{
-            'id': self.id,
-            'source': self.source,
-            'target': self.target,
-            'breakpoints': self.breakpoints[:],
-        })
-
     @staticmethod
     def createHead(p1, angle, size):
         """
@@ -102,6 +102,22 @@ class EquivalenceEdge(AxiomEdge):
         p3 = p1 - QtCore.QPointF(sin(rad + M_PI - M_PI / 3.0) * size, cos(rad + M_PI - M_PI / 3.0) * size)
         return QtGui.QPolygonF([p1, p2, p3])
 
+    def createShape(self):
+        """
+        Create the shape of this item as a QPainterPath in local coordinates.
+        :rtype: QPainterPath
+        """
+        path = QtGui.QPainterPath()
+        path.addPath(self.selection.geometry())
+        path.addPolygon(self.head.geometry())
+        path.addPolygon(self.tail.geometry())
+        if self.isSelected():
+            for polygon in self.handles:
+                path.addEllipse(polygon.geometry())
+            for polygon in self.anchors.values():
+                path.addEllipse(polygon.geometry())
+        return path
+
     @staticmethod
     def createTail(p1, angle, size):
         """
@@ -175,22 +191,6 @@ class EquivalenceEdge(AxiomEdge):
         """
         pass
 
-    def shape(self):
-        """
-        Returns the shape of this item as a QPainterPath in local coordinates.
-        :rtype: QPainterPath
-        """
-        path = QtGui.QPainterPath()
-        path.addPath(self.selection.geometry())
-        path.addPolygon(self.head.geometry())
-        path.addPolygon(self.tail.geometry())
-        if self.isSelected():
-            for polygon in self.handles:
-                path.addEllipse(polygon.geometry())
-            for polygon in self.anchors.values():
-                path.addEllipse(polygon.geometry())
-        return path
-
     def text(self):
         """
         Returns the label text.
@@ -59,20 +59,6 @@ class InclusionEdge(AxiomEdge):
     #   INTERFACE
     #################################
 
-    def boundingRect(self):
-        """
-        Returns the shape bounding rect.
-        :rtype: QRectF
-        """
-        path = QtGui.QPainterPath()
-        path.addPath(self.selection.geometry())
-        path.addPolygon(self.head.geometry())
-        for polygon in self.handles:
-            path.addEllipse(polygon.geometry())
-        for polygon in self.anchors.values():
-            path.addEllipse(polygon.geometry())
-        return path.controlPointRect()
-
     def copy(self, diagram):
         """
         Create a copy of the current item.
@@ -85,6 +71,20 @@ class InclusionEdge(AxiomEdge):
             'breakpoints': self.breakpoints[:],
         })
 
+    def createBoundingRect(self):
+        """
+        Create the shape bounding rect.
+        :rtype: QRectF
+        """
+        path = QtGui.QPainterPath()
+        path.addPath(self.selection.geometry())
+        path.addPolygon(self.head.geometry())
+        for polygon in self.handles:
+            path.addEllipse(polygon.geometry())
+        for polygon in self.anchors.values():
+            path.addEllipse(polygon.geometry())
+        return path.controlPointRect()
+
     @staticmethod
     def createHead(p1, angle, size):
         """
@@ -99,6 +99,21 @@ class InclusionEdge(AxiomEdge):
         p3 = p1 - QtCore.QPointF(sin(rad + M_PI - M_PI / 3.0) * size, cos(rad + M_PI - M_PI / 3.0) * size)
         return QtGui.QPolygonF([p1, p2, p3])
 
+    def createShape(self):
+        """
+        Create the shape of this item as a QPainterPath in local coordinates.
+        :rtype: QPainterPath
+        """
+        path = QtGui.QPainterPath()
+        path.addPath(self.selection.geometry())
+        path.addPolygon(self.head.geometry())
+        if self.isSelected():
+            for polygon in self.handles:
+                path.addEllipse(polygon.geometry())
+            for polygon in self.anchors.values():
+                path.addEllipse(polygon.geometry())
+        return path
+
     def paint(self, painter, option, widget=None):
         """
         Paint the edge in the diagram scene.
@@ -153,21 +168,6 @@ class InclusionEdge(AxiomEdge):
         """
         pass
 
-    def shape(self):
-        """
-        Returns the shape of this item as a QPainterPath in local coordinates.
-        :rtype: QPainterPath
-        """
-        path = QtGui.QPainterPath()
-        path.addPath(self.selection.geometry())
-        path.addPolygon(self.head.geometry())
-        if self.isSelected():
-            for polygon in self.handles:
-                path.addEllipse(polygon.geometry())
-            for polygon in self.anchors.values():
-                path.addEllipse(polygon.geometry())
-        return path
-
     def text(self):
         """
         Returns the label text.
@@ -61,20 +61,6 @@ class InputEdge(AbstractEdge):
     #   INTERFACE
     #################################
 
-    def boundingRect(self):
-        """
-        Returns the shape bounding rect.
-        :rtype: QRectF
-        """
-        path = QtGui.QPainterPath()
-        path.addPath(self.selection.geometry())
-        path.addPolygon(self.head.geometry())
-        for polygon in self.handles:
-            path.addEllipse(polygon.geometry())
-        for polygon in self.anchors.values():
-            path.addEllipse(polygon.geometry())
-        return path.controlPointRect()
-
     def copy(self, diagram):
         """
         Create a copy of the current item.
@@ -87,6 +73,20 @@ class InputEdge(AbstractEdge):
             'breakpoints': self.breakpoints[:],
         })
 
+    def createBoundingRect(self):
+        """
+        Create the shape bounding rect.
+        :rtype: QRectF
+        """
+        path = QtGui.QPainterPath()
+        path.addPath(self.selection.geometry())
+        path.addPolygon(self.head.geometry())
+        for polygon in self.handles:
+            path.addEllipse(polygon.geometry())
+        for polygon in self.anchors.values():
+            path.addEllipse(polygon.geometry())
+        return path.controlPointRect()
+
     @staticmethod
     def createHead(p1, angle, size):
         """
@@ -102,6 +102,21 @@ class InputEdge(AbstractEdge):
         p4 = p3 - QtCore.QPointF(sin(rad - 3.0 / 4.0 * M_PI) * size, cos(rad - 3.0 / 4.0 * M_PI) * size)
         return QtGui.QPolygonF([p1, p2, p3, p4])
 
+    def createShape(self):
+        """
+        Create the shape of this item as a QPainterPath in local coordinates.
+        :rtype: QPainterPath
+        """
+        path = QtGui.QPainterPath()
+        path.addPath(self.selection.geometry())
+        path.addPolygon(self.head.geometry())
+        if self.isSelected():
+            for polygon in self.handles:
+                path.addEllipse(polygon.geometry())
+            for polygon in self.anchors.values():
+                path.addEllipse(polygon.geometry())
+        return path
+
     def paint(self, painter, option, widget=None):
         """
         Paint the edge in the diagram scene.
@@ -156,21 +171,6 @@ class InputEdge(AbstractEdge):
         """
         self.label.setPos(pos)
 
-    def shape(self):
-        """
-        Returns the shape of this item as a QPainterPath in local coordinates.
-        :rtype: QPainterPath
-        """
-        path = QtGui.QPainterPath()
-        path.addPath(self.selection.geometry())
-        path.addPolygon(self.head.geometry())
-        if self.isSelected():
-            for polygon in self.handles:
-                path.addEllipse(polygon.geometry())
-            for polygon in self.anchors.values():
-                path.addEllipse(polygon.geometry())
-        return path
-
     def text(self):
         """
         Returns the label text.
@@ -62,20 +62,6 @@ class MembershipEdge(AxiomEdge):
     #   INTERFACE
     #################################
 
-    def boundingRect(self):
-        """
-        Returns the shape bounding rect.
-        :rtype: QRectF
-        """
-        path = QtGui.QPainterPath()
-        path.addPath(self.selection.geometry())
-        path.addPolygon(self.head.geometry())
-        for polygon in self.handles:
-            path.addEllipse(polygon.geometry())
-        for polygon in self.anchors.values():
-            path.addEllipse(polygon.geometry())
-        return path.controlPointRect()
-
     def copy(self, diagram):
         """
         Create a copy of the current item.
@@ -88,6 +74,20 @@ class MembershipEdge(AxiomEdge):
             'breakpoints': self.breakpoints[:],
         })
 
+    def createBoundingRect(self):
+        """
+        Create the shape bounding rect.
+        :rtype: QRectF
+        """
+        path = QtGui.QPainterPath()
+        path.addPath(self.selection.geometry())
+        path.addPolygon(self.head.geometry())
+        for polygon in self.handles:
+            path.addEllipse(polygon.geometry())
+        for polygon in self.anchors.values():
+            path.addEllipse(polygon.geometry())
+        return path.controlPointRect()
+
     @staticmethod
     def createHead(p1, angle, size):
         """
@@ -102,6 +102,23 @@ class MembershipEdge(AxiomEdge):
         p3 = p1 - QtCore.QPointF(sin(rad + M_PI - M_PI / 3.0) * size, cos(rad + M_PI - M_PI / 3.0) * size)
         return QtGui.QPolygonF([p1, p2, p3])
 
+    def createShape(self):
+        """
+        Create the shape of this item as a QPainterPath in local coordinates.
+        :rtype: QPainterPath
+        """
+        path = QtGui.QPainterPath()
+        path.addPath(self.selection.geometry())
+        path.addPolygon(self.head.geometry())
+
+        if self.isSelected():
+            for polygon in self.handles:
+                path.addEllipse(polygon.geometry())
+            for polygon in self.anchors.values():
+                path.addEllipse(polygon.geometry())
+
+        return path
+
     def paint(self, painter, option, widget=None):
         """
         Paint the edge in the diagram scene.
@@ -156,23 +173,6 @@ class MembershipEdge(AxiomEdge):
         """
         self.label.setPos(pos)
 
-    def shape(self):
-        """
-        Returns the shape of this item as a QPainterPath in local coordinates.
-        :rtype: QPainterPath
-        """
-        path = QtGui.QPainterPath()
-        path.addPath(self.selection.geometry())
-        path.addPolygon(self.head.geometry())
-
-        if self.isSelected():
-            for polygon in self.handles:
-                path.addEllipse(polygon.geometry())
-            for polygon in self.anchors.values():
-                path.addEllipse(polygon.geometry())
-
-        return path
-
     def text(self):
         """
         Returns the label text.
@@ -58,6 +58,13 @@ class AbstractNode(AbstractItem):
     Identities = {}
     Prefix = 'n'
 
+    # ITEM CHANGES AFFECTING THE STACKING OF THE EDGES AROUND THE NODE (see logGeometryChange)
+    GeometryLogChanges = (
+        AbstractItem.ItemSceneChange,
+        AbstractItem.ItemSceneHasChanged,
+        AbstractItem.ItemZValueHasChanged,
+    )
+
     def __init__(self, **kwargs):
         """
         Initialize the node.
@@ -65,6 +72,7 @@ class AbstractNode(AbstractItem):
         super().__init__(**kwargs)
 
         self._identity = Identity.Neutral
+        self._sceneRect = QtCore.QRectF()
 
         self.anchors = dict()
         self.edges = set()
@@ -276,6 +284,20 @@ class AbstractNode(AbstractItem):
         """
         return  Item.ConceptNode <= self.type() <= Item.IndividualNode
 
+    def logGeometryChange(self, change=None):
+        """
+        Record in the node geometry log of the diagram the scene area this node covered and
+        now covers, so that the edges around it can refresh their lookup of overlapping nodes
+        (see AbstractEdge.overlappingDepth). The given item change, if any, is the one which
+        triggered the update: on ItemSceneChange the node is leaving its diagram.
+        :type change: GraphicsItemChange
+        """
+        rect = self.sceneBoundingRect()
+        diagram = self.diagram
+        if diagram:
+            diagram.logNodeGeometry(self, rect.united(self._sceneRect))
+        self._sceneRect = QtCore.QRectF() if change == AbstractNode.ItemSceneChange else rect
+
     def moveBy(self, x, y):
         """
         Move the node by the given deltas.
@@ -377,6 +399,7 @@ class AbstractNode(AbstractItem):
         else:
             raise TypeError('too many arguments; expected {0}, got {1}'.format(2, len(__args)))
         super().setPos(pos + super().pos() - self.pos())
+        self.logGeometryChange()
 
     def updateEdges(self):
         """
@@ -409,6 +432,9 @@ class AbstractNode(AbstractItem):
         self.setCacheMode(AbstractItem.NoCache)
         self.setCacheMode(AbstractItem.DeviceCoordinateCache)
 
+        # GEOMETRY LOG (THE NODE MAY HAVE BEEN RESIZED)
+        self.logGeometryChange()
+
         # SCHEDULE REPAINT
         self.update(self.boundingRect())
 
@@ -445,6 +471,8 @@ class AbstractNode(AbstractItem):
         """
         if change == AbstractNode.ItemSelectedHasChanged:
             self.updateNode(selected=value)
+        elif change in AbstractNode.GeometryLogChanges:
+            self.logGeometryChange(change)
         return super().itemChange(change, value)
 
     def mousePressEvent(self, mouseEvent):
@@ -609,6 +637,9 @@ class AbstractResizableNode(AbstractNode):
         self.setCacheMode(AbstractItem.NoCache)
         self.setCacheMode(AbstractItem.DeviceCoordinateCache)
 
+        # GEOMETRY LOG (THE NODE MAY HAVE BEEN RESIZED)
+        self.logGeometryChange()
+
         # SCHEDULE REPAINT
         self.update(self.boundingRect())
 
@@ -644,6 +675,8 @@ class AbstractResizableNode(AbstractNode):
         if change == AbstractNode.ItemSelectedHasChanged:
             if self.diagram.mode is not DiagramMode.NodeResize:
                 self.updateNode(selected=value)
+        elif change in AbstractNode.GeometryLogChanges:
+            self.logGeometryChange(change)
         return super(AbstractNode, self).itemChange(change, value)
 
     def mousePressEvent(self, mouseEvent):
@@ -763,6 +796,7 @@ class PredicateNodeMixin:
             self.sgnIRISwitched.emit()
         self.doUpdateNodeLabel()
         if self.diagram:
+            self.diagram.project.sgnItemUpdated.emit(self.diagram, self)
             self.diagram.project.sgnUpdated.emit()
 
     @abstractmethod
@@ -783,17 +817,11 @@ class PredicateNodeMixin:
 
     def connectSignals(self):
         if self.diagram:
-            connect(self.project.sgnPrefixAdded, self.onPrefixAdded)
-            connect(self.project.sgnPrefixRemoved, self.onPrefixRemoved)
-            connect(self.project.sgnPrefixModified, self.onPrefixModified)
             #connect(self.session.sgnRenderingModified, self.onRenderingModified)
             self.connectIRISignals()
 
     def disconnectSignals(self):
         if self.diagram:
-            disconnect(self.project.sgnPrefixAdded, self.onPrefixAdded)
-            disconnect(self.project.sgnPrefixRemoved, self.onPrefixRemoved)
-            disconnect(self.project.sgnPrefixModified, self.onPrefixModified)
             #disconnect(self.session.sgnRenderingModified, self.onRenderingModified)
             self.disconnectIRISignals()
 
@@ -826,6 +854,7 @@ class PredicateNodeMixin:
     @QtCore.pyqtSlot()
     def onIRIPropModified(self):
         if self.diagram:
+            self.diagram.project.sgnItemUpdated.emit(self.diagram, self)
             self.diagram.project.sgnUpdated.emit()
 
     @QtCore.pyqtSlot()
@@ -851,11 +880,9 @@ class PredicateNodeMixin:
         """
         :type annotation: AnnotationAssertion
         """
-        settings = QtCore.QSettings()
-        rendering = settings.value('ontology/iri/render', IRIRender.PREFIX.value)
-        if rendering == IRIRender.LABEL.value:
-            self.doUpdateNodeLabel()
+        self.doUpdateNodeLabel()
         if self.diagram:
+            self.diagram.project.sgnItemUpdated.emit(self.diagram, self)
             self.diagram.project.sgnUpdated.emit()
 
     #@QtCore.pyqtSlot(AnnotationAssertion)
@@ -863,11 +890,9 @@ class PredicateNodeMixin:
         """
         :type annotation: AnnotationAssertion
         """
-        settings = QtCore.QSettings()
-        rendering = settings.value('ontology/iri/render', IRIRender.PREFIX.value, )
-        if rendering == IRIRender.LABEL.value:
-            self.doUpdateNodeLabel()
+        self.doUpdateNodeLabel()
         if self.diagram:
+            self.diagram.project.sgnItemUpdated.emit(self.diagram, self)
             self.diagram.project.sgnUpdated.emit()
 
     #@QtCore.pyqtSlot(AnnotationAssertion)
@@ -875,40 +900,18 @@ class PredicateNodeMixin:
         """
         :type annotation: AnnotationAssertion
         """
-        settings = QtCore.QSettings()
-        rendering = settings.value('ontology/iri/render', IRIRender.PREFIX.value, str)
-        if rendering == IRIRender.LABEL.value:
-            self.doUpdateNodeLabel()
+        self.doUpdateNodeLabel()
         if self.diagram:
+            self.diagram.project.sgnItemUpdated.emit(self.diagram, self)
             self.diagram.project.sgnUpdated.emit()
 
     #@QtCore.pyqtSlot()
     def onIRIModified(self):
         self.doUpdateNodeLabel()
         if self.diagram:
+            self.diagram.project.sgnItemUpdated.emit(self.diagram, self)
             self.diagram.project.sgnUpdated.emit()
 
-    #@QtCore.pyqtSlot('QString','QString')
-    def onPrefixAdded(self,pref,ns):
-        settings = QtCore.QSettings()
-        rendering = settings.value('ontology/iri/render', IRIRender.PREFIX.value, str)
-        if rendering==IRIRender.PREFIX.value or rendering==IRIRender.LABEL.value:
-            self.doUpdateNodeLabel()
-
-    #@QtCore.pyqtSlot(str)
-    def onPrefixRemoved(self,pref):
-        settings = QtCore.QSettings()
-        rendering = settings.value('ontology/iri/render', IRIRender.PREFIX.value, str)
-        if rendering==IRIRender.PREFIX.value or rendering==IRIRender.LABEL.value:
-            self.doUpdateNodeLabel()
-
-    #@QtCore.pyqtSlot(str)
-    def onPrefixModified(self,pref):
-        settings = QtCore.QSettings()
-        rendering = settings.value('ontology/iri/render', IRIRender.PREFIX.value, str)
-        if rendering==IRIRender.PREFIX.value or rendering==IRIRender.LABEL.value:
-            self.doUpdateNodeLabel()
-
     #############################################
     #   EVENTS
     #################################
@@ -0,0 +1,536 @@
+# -*- coding: utf-8 -*-
+
+##########################################################################
+#                                                                        #
+#  Eddy: a graphical editor for the specification of Graphol ontologies  #
+#  Copyright (C) 2015 Daniele Pantaleone <danielepantaleone@me.com>      #
+#                                                                        #
+#  This program is free software: you can redistribute it and/or modify  #
+#  it under the terms of the GNU General Public License as published by  #
+#  the Free Software Foundation, either version 3 of the License, or     #
+#  (at your option) any later version.                                   #
+#                                                                        #
+#  This program is distributed in the hope that it will be useful,       #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of        #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the          #
+#  GNU General Public License for more details.                          #
+#                                                                        #
+#  You should have received a copy of the GNU General Public License     #
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.  #
+#                                                                        #
+#  #####################                          #####################  #
+#                                                                        #
+#  Graphol is developed by members of the DASI-lab group of the          #
+#  Dipartimento di Ingegneria Informatica, Automatica e Gestionale       #
+#  A.Ruberti at Sapienza University of Rome: http://www.dis.uniroma1.it  #
+#                                                                        #
+#     - Domenico Lembo <lembo@dis.uniroma1.it>                           #
+#     - Valerio Santarelli <santarelli@dis.uniroma1.it>                  #
+#     - Domenico Fabio Savo <savo@dis.uniroma1.it>                       #
+#     - Daniele Pantaleone <pantaleone@dis.uniroma1.it>                  #
+#     - Marco Console <console@dis.uniroma1.it>                          #
+#                                                                        #
+##########################################################################
+
+
+import json
+import os
+
+from PyQt5 import (
+    QtCore,
+    QtXml,
+)
+
+from eddy.core.commands.common import (
+    CommandComposeAxiom,
+    CommandItemsAdd,
+    CommandItemsRemove,
+    CommandItemsTranslate,
+    CommandSnapItemsToGrid,
+)
+from eddy.core.commands.edges import (
+    CommandEdgeAdd,
+    CommandEdgeAnchorMove,
+    CommandEdgeBreakpointAdd,
+    CommandEdgeBreakpointMove,
+    CommandEdgeBreakpointRemove,
+    CommandEdgeSwap,
+    CommandSwitchSameDifferentEdge,
+)
+from eddy.core.commands.iri import (
+    CommandChangeFacetOfNode,
+    CommandChangeIRIOfNode,
+    CommandChangeLiteralOfNode,
+    CommandEdgeAddAnnotation,
+    CommandEdgeModifyAnnotation,
+    CommandEdgeRemoveAnnotation,
+    CommandIRIAddAnnotationAssertion,
+    CommandIRIModifyAnnotationAssertion,
+    CommandIRIRemoveAnnotationAssertion,
+    CommandIRISetMeta,
+)
+from eddy.core.commands.labels import CommandLabelMove
+from eddy.core.commands.nodes import (
+    CommandNodeAdd,
+    CommandNodeChangeInputsOrder,
+    CommandNodeMove,
+    CommandNodeRezize,
+    CommandNodeSetBrush,
+    CommandNodeSetDepth,
+    CommandNodeSetFont,
+    CommandNodeSwitchTo,
+)
+from eddy.core.diagram import Diagram
+from eddy.core.exporters.graphol_iri import (
+    GrapholIRIProjectExporter,
+    GrapholIRIProjectSaveWorker,
+)
+from eddy.core.functions.fsystem import (
+    fexists,
+    fread,
+    fremove,
+    frename,
+    fwrite,
+)
+from eddy.core.functions.signals import connect
+from eddy.core.items.common import AbstractItem
+from eddy.core.output import getLogger
+from eddy.core.qt import sip
+from eddy.core.owl import (
+    AnnotationAssertion,
+    IRI,
+)
+
+LOGGER = getLogger()
+
+
+class ProjectJournal(QtCore.QObject):
+    """
+    Append-only journal of the edits performed on a project since it was last written to disk.
+
+    Every time the undo stack of the session moves, the nodes, edges and IRIs affected by the
+    commands that have been done or undone are recorded in the journal as Graphol XML elements,
+    one JSON line per edit. Commands whose effects cannot be described in terms of diagram items
+    and IRIs (e.g: prefix or diagram management) are recorded as unjournaled: recovery stops
+    before them, and the journal is immediately compacted into a full background save so that
+    the edits can be recovered again from that point on.
+
+    The journal lives next to the project file, together with the last compacted save:
+     -----------------------
+     - projectdir/
+     -   projectname.graphol            # last save performed by the user
+     -   .projectname.autosave.graphol  # last compaction of the journal (if newer)
+     -   .projectname.journal           # edits performed since the newest of the two
+    """
+    CompactionThreshold = 1000
+
+    JournaledCommands = (
+        CommandChangeFacetOfNode,
+        CommandChangeIRIOfNode,
+        CommandChangeLiteralOfNode,
+        CommandComposeAxiom,
+        CommandEdgeAdd,
+        CommandEdgeAddAnnotation,
+        CommandEdgeAnchorMove,
+        CommandEdgeBreakpointAdd,
+        CommandEdgeBreakpointMove,
+        CommandEdgeBreakpointRemove,
+        CommandEdgeModifyAnnotation,
+        CommandEdgeRemoveAnnotation,
+        CommandEdgeSwap,
+        CommandIRIAddAnnotationAssertion,
+        CommandIRIModifyAnnotationAssertion,
+        CommandIRIRemoveAnnotationAssertion,
+        CommandIRISetMeta,
+        CommandItemsAdd,
+        CommandItemsRemove,
+        CommandItemsTranslate,
+        CommandLabelMove,
+        CommandNodeAdd,
+        CommandNodeChangeInputsOrder,
+        CommandNodeMove,
+        CommandNodeRezize,
+        CommandNodeSetBrush,
+        CommandNodeSetDepth,
+        CommandNodeSetFont,
+        CommandNodeSwitchTo,
+        CommandSnapItemsToGrid,
+        CommandSwitchSameDifferentEdge,
+    )
+
+    def __init__(self, session):
+        """
+        Initialize the project journal.
+        :type session: Session
+        """
+        super().__init__(session)
+        self.exporter = GrapholIRIProjectExporter(session.project, session)
+        self.undostack = session.undostack
+        self.index = self.undostack.index()
+        self.path = None
+        self.stream = None
+        self.seq = 0
+        self.baseSeq = 0
+        self.compaction = None
+        self.compactionPending = False
+        connect(self.undostack.indexChanged, self.onIndexChanged)
+
+    #############################################
+    #   PROPERTIES
+    #################################
+
+    @property
+    def project(self):
+        """
+        Returns the project being journaled.
+        :rtype: Project
+        """
+        return self.session.project
+
+    @property
+    def session(self):
+        """
+        Returns the active session (alias for ProjectJournal.parent()).
+        :rtype: Session
+        """
+        return self.parent()
+
+    #############################################
+    #   SLOTS
+    #################################
+
+    @QtCore.pyqtSlot(int)
+    def onIndexChanged(self, index):
+        """
+        Executed when the undo stack index changes.
+        :type index: int
+        """
+        if sip.isdeleted(self.undostack):
+            return
+        commands = [self.undostack.command(i) for i in range(min(index, self.index), max(index, self.index))]
+        self.index = index
+        if commands and all(commands):
+            self.record(commands)
+
+    @QtCore.pyqtSlot()
+    def onCompactionCompleted(self):
+        """
+        Executed when the journal has been compacted into the autosave file.
+        """
+        seq, path = self.compaction
+        self.compaction = None
+        if seq > self.baseSeq and path == self.autosavePath(self.path):
+            self.rebase(seq)
+        elif fexists(path):
+            # THE PROJECT HAS BEEN SAVED IN THE MEANTIME: THE COMPACTION IS STALE
+            fremove(path)
+        self.compactPending()
+
+    @QtCore.pyqtSlot(Exception)
+    def onCompactionErrored(self, exception):
+        """
+        Executed when the journal could not be compacted into the autosave file.
+        :type exception: Exception
+        """
+        self.compaction = None
+        LOGGER.error('Failed to compact project journal: %s', exception)
+        self.compactPending()
+
+    #############################################
+    #   INTERFACE
+    #################################
+
+    @staticmethod
+    def autosavePath(path):
+        """
+        Returns the path of the autosave file of the project stored at the given path.
+        :type path: str
+        :rtype: str
+        """
+        directory, filename = os.path.split(path)
+        return os.path.join(directory, '.{0}.autosave.graphol'.format(os.path.splitext(filename)[0]))
+
+    def close(self, discard=True):
+        """
+        Close the journal, removing it from disk together with the autosave file if requested.
+        :type discard: bool
+        """
+        if self.stream:
+            self.stream.close()
+            self.stream = None
+        if discard and self.path:
+            fremove(self.journalPath(self.path))
+            fremove(self.autosavePath(self.path))
+        self.compactionPending = False
+
+    def compact(self):
+        """
+        Compact the journal into the autosave file, using a background thread.
+        A compaction requested while another one is running is performed once it terminates.
+        """
+        if not self.path:
+            return
+        if self.compaction:
+            self.compactionPending = True
+            return
+        self.compactionPending = False
+        # THE PREVIOUS COMPACTION THREAD STAYS REGISTERED UNTIL ITS FINISHED SIGNAL IS
+        # DELIVERED, AND startThread WOULD SILENTLY DISCARD THE NEW WORKER IN THE MEANTIME
+        self.session.stopThread('ProjectJournalCompaction')
+        exporter = GrapholIRIProjectExporter(self.project, self.session, self.autosavePath(self.path))
+        worker = GrapholIRIProjectSaveWorker(exporter)
+        self.compaction = (self.seq, worker.path)
+        connect(worker.sgnCompleted, self.onCompactionCompleted)
+        connect(worker.sgnErrored, self.onCompactionErrored)
+        self.session.startThread('ProjectJournalCompaction', worker)
+
+    def compactPending(self):
+        """
+        Perform the compaction requested while the previous one was running, if any, unless
+        all the entries recorded in the meantime have already been stored in the project file.
+        """
+        if self.compactionPending and self.seq > self.baseSeq:
+            self.compact()
+        else:
+            self.compactionPending = False
+
+    def element(self, func, *args):
+        """
+        Returns the Graphol XML serialization of the element generated by the given exporter function.
+        :type func: callable
+        :rtype: str
+        """
+        self.exporter.document = QtXml.QDomDocument()
+        self.exporter.document.appendChild(func(*args))
+        try:
+            return self.exporter.document.toString(-1)
+        finally:
+            self.exporter.document = None
+
+    @classmethod
+    def exists(cls, path):
+        """
+        Returns True if there are edits to recover for the project stored at the given path.
+        :type path: str
+        :rtype: bool
+        """
+        journal = cls.journalPath(path)
+        return fexists(cls.autosavePath(path)) or (fexists(journal) and os.path.getsize(journal) > 0)
+
+    @staticmethod
+    def journalPath(path):
+        """
+        Returns the path of the journal of the project stored at the given path.
+        :type path: str
+        :rtype: str
+        """
+        directory, filename = os.path.split(path)
+        return os.path.join(directory, '.{0}.journal'.format(os.path.splitext(filename)[0]))
+
+    def open(self):
+        """
+        Open the journal of the project, if the project is stored on disk.
+        The journal is moved only once the project is saved to a different path.
+        :rtype: bool
+        """
+        if not self.path:
+            self.path = self.project.path
+        if not self.stream and self.path:
+            self.stream = open(self.journalPath(self.path), 'a', encoding='utf-8')
+        return self.stream is not None
+
+    def rebase(self, seq, path=None):
+        """
+        Drop the entries preceding the given sequence number, which are now stored in the
+        project file (if a path is given) or in the autosave file (otherwise).
+        :type seq: int
+        :type path: str
+        """
+        previous = self.path
+        if self.stream:
+            self.stream.close()
+            self.stream = None
+        if seq < self.baseSeq:
+            # THE AUTOSAVE FILE IS NEWER THAN THE SAVE: KEEP IT, FOLLOWING THE PROJECT PATH
+            if path and previous and path != previous:
+                for func in (self.journalPath, self.autosavePath):
+                    if fexists(func(previous)):
+                        frename(func(previous), func(path))
+                self.path = path
+            return
+        self.baseSeq = seq
+        entries = []
+        if previous and fexists(self.journalPath(previous)):
+            for line in fread(self.journalPath(previous)).splitlines():
+                try:
+                    if json.loads(line)['seq'] >= seq:
+                        entries.append(line + '\n')
+                except (ValueError, KeyError):
+                    break
+        if path:
+            if previous:
+                fremove(self.journalPath(previous))
+                fremove(self.autosavePath(previous))
+            self.path = path
+        if self.path:
+            fwrite(''.join(entries), self.journalPath(self.path))
+
+    def record(self, commands):
+        """
+        Append to the journal the effects of the given commands, as found in the project.
+        :type commands: list
+        """
+        if not self.open():
+            return
+        items = set()
+        iris = set()
+        diagrams = set()
+        journaled = all(self.collect(command, items, iris, diagrams) for command in commands)
+        entry = {'seq': self.seq}
+        if journaled:
+            entry['items'] = self.serializeItems(items, diagrams)
+            entry['iris'] = [[str(iri), self.element(self.exporter.getIriDomElement, iri)]
+                             for iri in iris]
+            journaled = entry['items'] is not None
+        if not journaled:
+            entry = {'seq': self.seq, 'unjournaled': True}
+        self.stream.write(json.dumps(entry))
+        self.stream.write('\n')
+        self.stream.flush()
+        self.seq += 1
+        if not journaled or self.seq - self.baseSeq >= self.CompactionThreshold:
+            self.compact()
+
+    def collect(self, command, items, iris, diagrams):
+        """
+        Collect the items, IRIs and diagrams affected by the given command.
+        Returns False if the command effects cannot be journaled.
+        :type command: QUndoCommand
+        :type items: set
+        :type iris: set
+        :type diagrams: set
+        :rtype: bool
+        """
+        children = [command.child(i) for i in range(command.childCount())]
+        if not isinstance(command, self.JournaledCommands):
+            if not children:
+                return False
+        else:
+            values = list(vars(command).values())
+            while values:
+                value = values.pop()
+                if isinstance(value, dict):
+                    values.extend(value.keys())
+                    values.extend(value.values())
+                elif isinstance(value, (list, set, tuple)):
+                    values.extend(value)
+                elif isinstance(value, AbstractItem):
+                    if value.isNode() or value.isEdge():
+                        items.add(value)
+                    if value.isNode():
+                        items.update(value.edges)
+                        if isinstance(getattr(value, 'iri', None), IRI):
+                            iris.add(value.iri)
+                elif isinstance(value, IRI):
+                    iris.add(value)
+                elif isinstance(value, AnnotationAssertion) and isinstance(value.subject, IRI):
+                    iris.add(value.subject)
+                elif isinstance(value, Diagram):
+                    diagrams.add(value)
+        return all(self.collect(child, items, iris, diagrams) for child in children)
+
+    def serializeItems(self, items, diagrams):
+        """
+        Serialize the given items as journal entries, or return None if it's not possible to
+        determine the diagram of a removed item.
+        :type items: set
+        :type diagrams: set
+        :rtype: list
+        """
+        entries = []
+        for item in sorted(items, key=lambda i: i.id):
+            diagram = item.diagram
+            if diagram:
+                func = self.exporter.exportFuncForItem[item.type()]
+                entries.append([diagram.name, item.id, self.element(func, item)])
+            elif len(diagrams) == 1:
+                entries.append([next(iter(diagrams)).name, item.id, None])
+            else:
+                return None
+        return entries
+
+    @classmethod
+    def recover(cls, path):
+        """
+        Replay the journal of the project stored at the given path onto its last save,
+        writing the result in the autosave file, whose path is returned, and emptying the journal.
+        Replay stops at the first unjournaled or incomplete entry.
+        :type path: str
+        :rtype: str
+        """
+        autosave = cls.autosavePath(path)
+        document = QtXml.QDomDocument()
+        if not document.setContent(fread(autosave if fexists(autosave) else path)):
+            raise ValueError('could not parse project file: {0}'.format(path))
+        projectEl = document.documentElement().firstChildElement('project')
+        irisEl = projectEl.firstChildElement('ontology').firstChildElement('iris')
+        iris = {}
+        iriEl = irisEl.firstChildElement('iri')
+        while not iriEl.isNull():
+            iris[iriEl.firstChildElement('value').text()] = iriEl
+            iriEl = iriEl.nextSiblingElement('iri')
+        diagrams = {}
+        diagramEl = projectEl.firstChildElement('diagrams').firstChildElement('diagram')
+        while not diagramEl.isNull():
+            elements = {}
+            itemEl = diagramEl.firstChildElement()
+            while not itemEl.isNull():
+                elements[itemEl.attribute('id')] = itemEl
+                itemEl = itemEl.nextSiblingElement()
+            diagrams[diagramEl.attribute('name')] = (diagramEl, elements)
+            diagramEl = diagramEl.nextSiblingElement('diagram')
+
+        def parse(xml):
+            fragment = QtXml.QDomDocument()
+            fragment.setContent(xml)
+            return document.importNode(fragment.documentElement(), True).toElement()
+
+        count = 0
+        journal = cls.journalPath(path)
+        for line in fread(journal).splitlines() if fexists(journal) else []:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                break
+            if entry.get('unjournaled'):
+                break
+            for name, id, xml in entry['items']:
+                if name not in diagrams:
+                    continue
+                diagramEl, elements = diagrams[name]
+                element = parse(xml) if xml else None
+                if id in elements:
+                    current = elements.pop(id)
+                    if element:
+                        diagramEl.replaceChild(element, current)
+                    else:
+                        diagramEl.removeChild(current)
+                elif element and element.tagName() == 'node':
+                    # NODES MUST PRECEDE EDGES FOR THE LOADER TO CONNECT THEM
+                    diagramEl.insertBefore(element, diagramEl.firstChildElement('edge'))
+                elif element:
+                    diagramEl.appendChild(element)
+                if element:
+                    elements[id] = element
+            for value, xml in entry['iris']:
+                element = parse(xml)
+                if value in iris:
+                    irisEl.replaceChild(element, iris[value])
+                else:
+                    irisEl.appendChild(element)
+                iris[value] = element
+            count += 1
+        fwrite(document.toString(2), autosave)
+        fwrite('', journal)
+        LOGGER.info('Recovered %s journaled edit(s) of project %s', count, path)
+        return autosave
@@ -35,6 +35,8 @@
 """This module is a thin wrapper around JNI libraries and is intended to abstract the API related to the JVM support"""
 
 import os
+import threading
+import weakref
 from abc import ABCMeta
 from enum import unique
 
@@ -49,6 +51,8 @@ from eddy.core.output import getLogger
 _jvmLibraries = []
 _jvmClasspath = []
 _jvmOptions = []
+_owlOntologyManagers = {}
+_owlOntologyManagersLock = threading.Lock()
 
 LOGGER = getLogger()
 
@@ -149,6 +153,54 @@ def getJavaVM(jnilib=None):
         raise JVMError('No such JNI library \'{0}\''.format(jnilib))
 
 
+def getOWLOntologyManager(owner):
+    """
+    Returns the long-lived OWLOntologyManager shared by all the workers operating on
+    the given owner (usually a Project), creating it if needed. The manager is thread
+    safe, and lives as long as the owner does, so that ontologies loaded into it (e.g.
+    imported ontologies) need not be parsed again by each worker.
+    The calling thread must be attached to the JVM.
+
+    :type owner: object
+    :rtype: OWLOntologyManager
+    """
+    with _owlOntologyManagersLock:
+        # MANAGERS ARE KEYED BY IDENTITY SINCE PROJECTS ARE NOT HASHABLE
+        manager = _owlOntologyManagers.get(id(owner))
+        if manager is None:
+            OWLManager = getJavaVM().getJavaClass('org.semanticweb.owlapi.apibinding.OWLManager')
+            manager = OWLManager.createConcurrentOWLOntologyManager()
+            _owlOntologyManagers[id(owner)] = manager
+            weakref.finalize(owner, _owlOntologyManagers.pop, id(owner), None)
+        return manager
+
+
+def shareOWLOntologies(owner, manager, replace=False):
+    """
+    Move the ontologies loaded in the given OWLOntologyManager into the shared manager
+    of the given owner. Ontologies the shared manager already contains are skipped,
+    unless replace is True, in which case the stale copy is replaced by the new one
+    (e.g. when the ontology document has been parsed again after it changed).
+    The calling thread must be attached to the JVM.
+
+    :type owner: object
+    :type manager: OWLOntologyManager
+    :type replace: bool
+    """
+    OntologyCopy = getJavaVM().getJavaClass('org.semanticweb.owlapi.model.parameters.OntologyCopy')
+    shared = getOWLOntologyManager(owner)
+    for ontology in list(manager.getOntologies()):
+        ontologyID = ontology.getOntologyID()
+        try:
+            if shared.contains(ontologyID):
+                if not replace:
+                    continue
+                shared.removeOntology(ontologyID)
+            shared.copyOntology(ontology, OntologyCopy.MOVE)
+        except Exception as e:
+            LOGGER.debug('Could not share ontology %s: %s', ontologyID, e)
+
+
 def findJavaHome():
     """
     Locate and return the path to a valid JRE installation,
@@ -204,6 +256,7 @@ class JavaVM(object):
         """
         self.classpath = getattr(self, 'classpath', [])
         self.options = getattr(self, 'options', [])
+        self.classes = getattr(self, 'classes', {})
 
     def __new__(cls, *args, **kwargs):
         if not cls._instance:
@@ -223,6 +276,20 @@ class JavaVM(object):
     def getJavaClass(self, cname: str) -> object:
         """
         Returns a wrapper object representing the Java class identified by the canonical name `cname`.
+        Wrappers are resolved once per process and then served from a cache, so that workers can
+        cheaply look up the Java classes they use. Raises an error if called before initializing the JVM.
+
+        :type cname: str
+        :rtype: object
+        """
+        try:
+            return self.classes[cname]
+        except KeyError:
+            return self.classes.setdefault(cname, self.loadJavaClass(cname))
+
+    def loadJavaClass(self, cname: str) -> object:
+        """
+        Resolves the wrapper object representing the Java class identified by the canonical name `cname`.
         Raises an error if called before initializing the JVM.
 
         :type cname: str
@@ -412,9 +479,9 @@ try:
             except BaseException as e:
                 raise JVMError('jnius: Error initializing JVM instance: {0}'.format(e))
 
-        def getJavaClass(self, cname: str) -> object:
+        def loadJavaClass(self, cname: str) -> object:
             """
-            Returns a wrapper object representing the Java class identified by the canonical name `cname`.
+            Resolves the wrapper object representing the Java class identified by the canonical name `cname`.
             Raises an error if called before initializing the JVM.
 
             :type cname: str
@@ -580,9 +647,9 @@ try:
             """
             return self.initialized and self.jpype.isJVMStarted()
 
-        def getJavaClass(self, cname: str):
+        def loadJavaClass(self, cname: str):
             """
-            Returns a wrapper object representing the Java class identified by the canonical name `cname`.
+            Resolves the wrapper object representing the Java class identified by the canonical name `cname`.
             Raises an error if the JVM if called before initializing the JVM.
 
             :type cname: str
@@ -165,15 +165,11 @@ class TemplateLoader(AbstractOntologyLoader):
                             if item.iri not in processed:
                                 if item.isNode() and item.type() == types[
                                     type] and item.iri is assertionSub:
-                                    existing = []
-                                    # LOOK FOR ANNOTATION PROPERTY
-                                    for prop, assertsList in item.iri.annotationAssertionMapItems:
-                                        if prop is assertionProp:
-                                            # LOOK FOR LANGUAGE
-                                            currList = assertsList
-                                            for assertion in currList:
-                                                if assertion.language == assertionLang:
-                                                    existing.append(assertion)
+                                    # LOOK FOR ANNOTATION PROPERTY AND LANGUAGE
+                                    existing = [
+                                        assertion for assertion in item.iri.getAnnotationAssertions(assertionProp)
+                                        if assertion.language == assertionLang
+                                    ]
 
                                     # REMOVE  ALL EXISTING ANNOTATION ASSERTIONS
                                     for annAssertion in existing:
@@ -33,9 +33,14 @@
 ##########################################################################
 
 
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import io
+import multiprocessing
 import os
 import textwrap
 from time import time
+from xml.etree import ElementTree
 
 from PyQt5 import (
     QtCore,
@@ -71,6 +76,11 @@ from eddy.core.loaders.common import (
     AbstractOntologyLoader,
     AbstractProjectLoader,
 )
+from eddy.core.loaders.graphol_parser import (
+    elementToRecord,
+    parseDiagram,
+    splitDiagrams,
+)
 from eddy.core.loaders.owl2 import OwlOntologyImportWorker
 from eddy.core.output import getLogger
 from eddy.core.owl import (
@@ -1944,6 +1954,99 @@ class GrapholIRIProjectLoader_v2(AbstractProjectLoader, GrapholProjectIRILoaderM
             self.projectLoaded()
 
 
+class GrapholStreamElement(object):
+    """
+    Wraps a record produced by the Graphol parser (see eddy.core.loaders.graphol_parser)
+    and exposes the subset of the QDomElement interface used by the Graphol v3 import methods.
+    """
+    __slots__ = ('record', 'siblings', 'index')
+
+    def __init__(self, record=None, siblings=(), index=-1):
+        """
+        Initialize the wrapper.
+        :type record: tuple
+        :type siblings: tuple
+        :type index: int
+        """
+        self.record = record
+        self.siblings = siblings
+        self.index = index
+
+    def attribute(self, name, default=''):
+        """
+        Returns the value of the given attribute, or the given default if it is not set.
+        :type name: str
+        :type default: str
+        :rtype: str
+        """
+        if self.record is None:
+            return default
+        return self.record[1].get(name, default)
+
+    def firstChildElement(self, tagName=''):
+        """
+        Returns the first child element with the given tag name.
+        :type tagName: str
+        :rtype: GrapholStreamElement
+        """
+        if self.record is not None:
+            children = self.record[3]
+            for index, child in enumerate(children):
+                if not tagName or child[0] == tagName:
+                    return GrapholStreamElement(child, children, index)
+        return GrapholStreamElement()
+
+    def hasAttribute(self, name):
+        """
+        Returns True if the given attribute is set, False otherwise.
+        :type name: str
+        :rtype: bool
+        """
+        return self.record is not None and name in self.record[1]
+
+    def isNull(self):
+        """
+        Returns True if this wrapper doesn't refer to any element, False otherwise.
+        :rtype: bool
+        """
+        return self.record is None
+
+    def nextSiblingElement(self, tagName=''):
+        """
+        Returns the next sibling element with the given tag name.
+        :type tagName: str
+        :rtype: GrapholStreamElement
+        """
+        for index in range(self.index + 1, len(self.siblings)):
+            sibling = self.siblings[index]
+            if not tagName or sibling[0] == tagName:
+                return GrapholStreamElement(sibling, self.siblings, index)
+        return GrapholStreamElement()
+
+    def tagName(self):
+        """
+        Returns the tag name of the element.
+        :rtype: str
+        """
+        return self.record[0] if self.record is not None else ''
+
+    def text(self):
+        """
+        Returns the text contained in the element and in all its descendants.
+        :rtype: str
+        """
+        return self.record[2] if self.record is not None else ''
+
+    @classmethod
+    def fromElement(cls, element):
+        """
+        Wraps the given ElementTree element.
+        :type element: Element
+        :rtype: GrapholStreamElement
+        """
+        return cls(elementToRecord(element))
+
+
 class GrapholProjectIRILoaderMixin_3(object):
     """
     Mixin which adds the ability to create a project out of a Graphol file.
@@ -1957,6 +2060,11 @@ class GrapholProjectIRILoaderMixin_3(object):
         self.buffer = dict()
         self.document = None
         self.nproject = None
+        self.streaming = QtCore.QSettings().value('project/load/streaming', False, bool)
+        self.parallel = QtCore.QSettings().value('project/load/parallel', False, bool)
+        self.parallelThreshold = 1 << 20
+        self.eventsBudget = 0.05
+        self.eventsProcessed = 0.0
 
         self.itemFromXml = {
             'attribute': Item.AttributeNode,
@@ -2031,6 +2139,143 @@ class GrapholProjectIRILoaderMixin_3(object):
         if version != 3:
             raise ProjectVersionError('project version mismatch: %s != 3' % version)
 
+    #############################################
+    #   STREAMING
+    #################################
+    def createProjectFromStream(self, source=None):
+        """
+        Create the Project, its IRIs and its diagrams by incrementally parsing the Graphol file.
+        Each element is imported as soon as it has been completely read and then dropped
+        from the parse tree, so that the whole document is never kept in memory.
+        :type source: BinaryIO
+        """
+        if source is None:
+            if not fexists(self.path):
+                raise ProjectNotFoundError('missing project ontology: %s' % self.path)
+            source = self.path
+        stack = []
+        diagram = None
+        pending = []
+        filters = None
+        counter = 1
+        try:
+            for event, element in ElementTree.iterparse(source, events=('start', 'end')):
+                if event == 'start':
+                    parent = stack[-1] if stack else None
+                    stack.append(element)
+                    if parent is None:
+                        version = int(element.get('version', '3'))
+                        if version != 3:
+                            raise ProjectVersionError('project version mismatch: %s != 3' % version)
+                    elif element.tag in {'iris', 'diagrams'} and filters is None:
+                        ## ALL THE ONTOLOGY HEADER ELEMENTS PRECEDE THE IRI TABLE AND THE DIAGRAMS
+                        projectEl = GrapholStreamElement.fromElement(stack[1])
+                        ontologyEl = projectEl.firstChildElement('ontology')
+                        filters = self.createProjectFromElement(projectEl, ontologyEl)
+                    elif element.tag == 'diagram' and parent.tag == 'diagrams':
+                        diagram = self.createDiagram(GrapholStreamElement.fromElement(element), counter)
+                else:
+                    stack.pop()
+                    parent = stack[-1] if stack else None
+                    if parent is None:
+                        continue
+                    if element.tag == 'iri' and parent.tag == 'iris':
+                        try:
+                            self.getIri(GrapholStreamElement.fromElement(element), *filters)
+                        except Exception as e:
+                            LOGGER.exception('Failed to import iri element [{}]'.format(e))
+                        parent.remove(element)
+                    elif element.tag == 'node' and parent.tag == 'diagram':
+                        self.importDiagramNode(diagram, GrapholStreamElement.fromElement(element))
+                        parent.remove(element)
+                    elif element.tag == 'edge' and parent.tag == 'diagram':
+                        ## EDGES CAN ONLY BE IMPORTED ONCE BOTH THEIR ENDPOINTS ARE AVAILABLE
+                        nodes = self.buffer[diagram.name]
+                        if element.get('source') in nodes and element.get('target') in nodes:
+                            self.importDiagramEdge(diagram, GrapholStreamElement.fromElement(element))
+                            parent.remove(element)
+                        else:
+                            pending.append(element)
+                    elif element.tag == 'diagram' and parent.tag == 'diagrams':
+                        for edgeElement in pending:
+                            self.importDiagramEdge(diagram, GrapholStreamElement.fromElement(edgeElement))
+                        self.nproject.addDiagram(self.completeDiagram(diagram))
+                        parent.remove(element)
+                        diagram = None
+                        pending.clear()
+                        counter += 1
+        except ElementTree.ParseError as e:
+            raise ProjectNotValidError('invalid project ontology supplied: %s [%s]' % (self.path, e))
+        if self.nproject is None:
+            raise ProjectNotValidError('invalid project ontology supplied: %s' % self.path)
+
+    #############################################
+    #   PIPELINE
+    #################################
+    def createProjectFromPipeline(self):
+        """
+        Create the Project using a two stages pipeline: diagrams are parsed into plain records
+        by worker processes while the GUI thread loads the ontology header, and then each
+        diagram is materialized in the GUI thread as soon as its record is available.
+        """
+        if not fexists(self.path):
+            raise ProjectNotFoundError('missing project ontology: %s' % self.path)
+        with open(self.path, 'rb') as file:
+            data = file.read()
+        skeleton, fragments = splitDiagrams(data)
+        executor = None
+        records = None
+        if len(fragments) > 1 and len(data) >= self.parallelThreshold and (os.cpu_count() or 1) > 1:
+            try:
+                executor = ProcessPoolExecutor(
+                    max_workers=min(len(fragments), os.cpu_count()),
+                    mp_context=multiprocessing.get_context('spawn'))
+                records = executor.map(parseDiagram, fragments)
+            except (OSError, BrokenProcessPool) as e:
+                LOGGER.warning('Failed to start diagram parsing workers, parsing serially: %s', e)
+                if executor:
+                    executor.shutdown(wait=False)
+                executor = None
+        try:
+            self.createProjectFromStream(io.BytesIO(skeleton))
+            for counter, record in enumerate(self.createDiagramRecords(fragments, records), 1):
+                self.nproject.addDiagram(self.importDiagram(GrapholStreamElement(record), counter))
+        except ElementTree.ParseError as e:
+            raise ProjectNotValidError('invalid project ontology supplied: %s [%s]' % (self.path, e))
+        finally:
+            if executor:
+                executor.shutdown(wait=False, cancel_futures=True)
+
+    def createDiagramRecords(self, fragments, records=None):
+        """
+        Yields the records of the given diagram fragments, in document order. Records are taken
+        from the given results of the parsing workers, if any: when a worker fails (or the pool
+        breaks) the remaining fragments are parsed serially, and when a fragment cannot be
+        parsed on its own the remaining diagrams are taken from a parse of the whole document.
+        :type fragments: list
+        :type records: iterable
+        :rtype: generator
+        """
+        parsed = 0
+        if records is not None:
+            try:
+                for record in records:
+                    parsed += 1
+                    yield record
+                return
+            except Exception as e:
+                LOGGER.warning('Failed to parse diagram %s in a worker process, parsing serially: %s', parsed + 1, e)
+        try:
+            for fragment in fragments[parsed:]:
+                record = parseDiagram(fragment)
+                parsed += 1
+                yield record
+        except ElementTree.ParseError as e:
+            LOGGER.warning('Failed to parse diagram %s on its own, parsing the whole document: %s', parsed + 1, e)
+            diagrams = ElementTree.parse(self.path).getroot().find('project/diagrams')
+            for element in diagrams.findall('diagram')[parsed:]:
+                yield elementToRecord(element)
+
     #############################################
     #   PROJECT (Prefixes,OntologyIRI)
     #################################
@@ -2039,9 +2284,28 @@ class GrapholProjectIRILoaderMixin_3(object):
         Create the Project by reading data from the parsed QDomDocument.
         """
         projectEl = self.document.documentElement().firstChildElement('project')
+        ontologyEl = projectEl.firstChildElement('ontology')
+        datatypes, facets, annotationProperties = self.createProjectFromElement(projectEl, ontologyEl)
+        irisEl = ontologyEl.firstChildElement('iris')
+        iriEl = irisEl.firstChildElement('iri')
+        while not iriEl.isNull():
+            try:
+                self.getIri(iriEl, datatypes,facets,annotationProperties)
+            except Exception as e:
+                LOGGER.exception('Failed to import iri element [{}]'.format(e))
+            finally:
+                iriEl = iriEl.nextSiblingElement('iri')
+
+    def createProjectFromElement(self, projectEl, ontologyEl):
+        """
+        Create the Project using the information found in the given 'project' and 'ontology' elements.
+        Returns the sets of datatypes, facets and annotation properties IRIs declared in the ontology.
+        :type projectEl: QDomElement
+        :type ontologyEl: QDomElement
+        :rtype: tuple
+        """
         projectVersion = projectEl.attribute('version')
         projectName = projectEl.attribute('name')
-        ontologyEl = projectEl.firstChildElement('ontology')
         ontologyIri = ontologyEl.attribute('iri')
         ontologyPrefix =  ontologyEl.attribute('prefix',None) if ontologyEl.hasAttribute('prefix') else None
         labelBoolean = False
@@ -2077,18 +2341,7 @@ class GrapholProjectIRILoaderMixin_3(object):
             addLabelFromUserInput=labelUserInputBoolean,
         )
         LOGGER.info('Loaded ontology: %s...', self.nproject.name)
-
-        irisEl = ontologyEl.firstChildElement('iris')
-        iriEl = irisEl.firstChildElement('iri')
-        while not iriEl.isNull():
-            try:
-                self.getIri(iriEl, datatypes,facets,annotationProperties)
-            except Exception as e:
-                LOGGER.exception('Failed to import iri element [{}]'.format(e))
-            finally:
-                iriEl = iriEl.nextSiblingElement('iri')
-
-
+        return datatypes, facets, annotationProperties
 
     def getIri(self,iriEl,datatypes,facets,annotationProperties):
         iriString = iriEl.firstChildElement('value').text()
@@ -2270,6 +2523,13 @@ class GrapholProjectIRILoaderMixin_3(object):
             QtWidgets.QApplication.processEvents()
             item.updateEdgeOrNode()
 
+    def scheduleProjectRender(self):
+        """
+        Defer the rendering of the elements in the Project ontology: each diagram
+        is rendered when first displayed or exported, or in the background when idle.
+        """
+        self.nproject.scheduleRender()
+
     #############################################
     #   DIAGRAM
     #################################
@@ -2292,6 +2552,27 @@ class GrapholProjectIRILoaderMixin_3(object):
         :type i: int
         :rtype: Diagram
         """
+        diagram = self.createDiagram(diagramElement, i)
+        ## LOAD DIAGRAM NODES
+        nodeElement = diagramElement.firstChildElement('node')
+        while not nodeElement.isNull():
+            self.importDiagramNode(diagram, nodeElement)
+            nodeElement = nodeElement.nextSiblingElement('node')
+        ## LOAD DIAGRAM EDGES
+        edgeElement = diagramElement.firstChildElement('edge')
+        while not edgeElement.isNull():
+            self.importDiagramEdge(diagram, edgeElement)
+            edgeElement = edgeElement.nextSiblingElement('edge')
+        ## RETURN GENERATED DIAGRAM
+        return self.completeDiagram(diagram)
+
+    def createDiagram(self, diagramElement, i):
+        """
+        Create an empty diagram using the attributes of the given QDomElement.
+        :type diagramElement: QDomElement
+        :type i: int
+        :rtype: Diagram
+        """
         QtWidgets.QApplication.processEvents()
         ## PARSE DIAGRAM INFORMATION
         name = diagramElement.attribute('name', 'diagram_{0}'.format(i))
@@ -2300,39 +2581,50 @@ class GrapholProjectIRILoaderMixin_3(object):
         LOGGER.info('Loading diagram: %s', name)
         diagram = Diagram.create(name, size, self.nproject)
         self.buffer[diagram.name] = dict()
-        ## LOAD DIAGRAM NODES
-        nodeElement = diagramElement.firstChildElement('node')
-        while not nodeElement.isNull():
-            try:
-                QtWidgets.QApplication.processEvents()
-                item = self.itemFromXmlNode(nodeElement)
-                func = self.importFuncForItem[item]
-                node = func(diagram, nodeElement)
-            except Exception as e:
-                LOGGER.exception('Failed to create node {}. [{}]'.format(nodeElement.attribute('id'), e))
-            else:
-                diagram.addItem(node)
-                diagram.guid.update(node.id)
-                self.buffer[diagram.name][node.id] = node
-            finally:
-                nodeElement = nodeElement.nextSiblingElement('node')
+        return diagram
 
-        ## LOAD DIAGRAM EDGES
-        edgeElement = diagramElement.firstChildElement('edge')
-        while not edgeElement.isNull():
-            try:
-                QtWidgets.QApplication.processEvents()
-                item = self.itemFromXmlNode(edgeElement)
-                func = self.importFuncForItem[item]
-                edge = func(diagram, edgeElement)
-            except Exception as e:
-                LOGGER.exception('Failed to create edge {}. [{}]'.format(edgeElement.attribute('id'), e))
-            else:
-                diagram.addItem(edge)
-                diagram.guid.update(edge.id)
-                self.buffer[diagram.name][edge.id] = edge
-            finally:
-                edgeElement = edgeElement.nextSiblingElement('edge')
+    def importDiagramNode(self, diagram, nodeElement):
+        """
+        Create a node from the given QDomElement and add it to the given diagram.
+        :type diagram: Diagram
+        :type nodeElement: QDomElement
+        """
+        try:
+            self.processEvents()
+            item = self.itemFromXmlNode(nodeElement)
+            func = self.importFuncForItem[item]
+            node = func(diagram, nodeElement)
+        except Exception as e:
+            LOGGER.exception('Failed to create node {}. [{}]'.format(nodeElement.attribute('id'), e))
+        else:
+            diagram.addItem(node)
+            diagram.guid.update(node.id)
+            self.buffer[diagram.name][node.id] = node
+
+    def importDiagramEdge(self, diagram, edgeElement):
+        """
+        Create an edge from the given QDomElement and add it to the given diagram.
+        :type diagram: Diagram
+        :type edgeElement: QDomElement
+        """
+        try:
+            self.processEvents()
+            item = self.itemFromXmlNode(edgeElement)
+            func = self.importFuncForItem[item]
+            edge = func(diagram, edgeElement)
+        except Exception as e:
+            LOGGER.exception('Failed to create edge {}. [{}]'.format(edgeElement.attribute('id'), e))
+        else:
+            diagram.addItem(edge)
+            diagram.guid.update(edge.id)
+            self.buffer[diagram.name][edge.id] = edge
+
+    def completeDiagram(self, diagram):
+        """
+        Run node identification on the given diagram and connect its signals to the Project.
+        :type diagram: Diagram
+        :rtype: Diagram
+        """
         ## IDENTIFY NEUTRAL NODES
         nodes = [x for x in diagram.items(edges=False) if Identity.Neutral in x.identities()]
         if nodes:
@@ -2343,7 +2635,6 @@ class GrapholProjectIRILoaderMixin_3(object):
         connect(diagram.sgnItemAdded, self.nproject.doAddItem)
         connect(diagram.sgnItemRemoved, self.nproject.doRemoveItem)
         connect(diagram.selectionChanged, self.session.doUpdateState)
-        ## RETURN GENERATED DIAGRAM
         return diagram
 
     #############################################
@@ -2634,6 +2925,15 @@ class GrapholProjectIRILoaderMixin_3(object):
     #   AUXILIARY METHODS
     #################################
 
+    def processEvents(self):
+        """
+        Process pending GUI events if more than the configured time budget elapsed since the last run.
+        """
+        now = time()
+        if now - self.eventsProcessed >= self.eventsBudget:
+            QtWidgets.QApplication.processEvents()
+            self.eventsProcessed = time()
+
     def itemFromXmlNode(self, e):
         """
         Returns the item matching the given Graphol XML node.
@@ -2793,15 +3093,21 @@ class GrapholOntologyIRILoader_v3(AbstractOntologyLoader, GrapholProjectIRILoade
     Extends AbstractOntologyLoader with facilities to load ontologies from Graphol file format and merge them with current project
     """
 
-    def __init__(self, path, project, session):
+    def __init__(self, path, project, session, streaming=None, parallel=None):
         """
         Initialize the Graphol importer.
         :type path: str
         :type project: Project
         :type session: Session
+        :type streaming: bool
+        :type parallel: bool
         """
         super().__init__(expandPath(path), project, session)
         self._owlOntologyImportErrors = set()
+        if streaming is not None:
+            self.streaming = streaming
+        if parallel is not None:
+            self.parallel = parallel
 
     @property
     def owlOntologyImportErrors(self):
@@ -2836,9 +3142,14 @@ class GrapholOntologyIRILoader_v3(AbstractOntologyLoader, GrapholProjectIRILoade
         """
         Perform ontology import from Graphol file format and merge the loaded ontology with the current project.
         """
-        self.createDomDocument()
-        self.createProject()
-        self.createDiagrams()
+        if self.parallel:
+            self.createProjectFromPipeline()
+        elif self.streaming:
+            self.createProjectFromStream()
+        else:
+            self.createDomDocument()
+            self.createProject()
+            self.createDiagrams()
         self.projectRender()
         self.projectMerge()
 
@@ -2848,16 +3159,22 @@ class GrapholIRIProjectLoader_v3(AbstractProjectLoader, GrapholProjectIRILoaderM
     Extends AbstractProjectLoader with facilities to load Graphol projects.
     """
 
-    def __init__(self, path, session):
+    def __init__(self, path, session, streaming=None, parallel=None):
         """
         Initialize the Project loader.
         :type path: str
         :type session: Session
+        :type streaming: bool
+        :type parallel: bool
         """
         path = expandPath(path)
         #path = os.path.join(path, os.path.basename(path))
         #path = postfix(path, File.Graphol.extension)
         super().__init__(path, session)
+        if streaming is not None:
+            self.streaming = streaming
+        if parallel is not None:
+            self.parallel = parallel
 
     def createLegacyProject(self):
         """
@@ -2891,13 +3208,19 @@ class GrapholIRIProjectLoader_v3(AbstractProjectLoader, GrapholProjectIRILoaderM
         Perform project import.
         """
         try:
-            self.createDomDocument()
+            if self.parallel:
+                self.createProjectFromPipeline()
+            elif self.streaming:
+                self.createProjectFromStream()
+            else:
+                self.createDomDocument()
         except (ProjectNotFoundError, ProjectVersionError):
             self.createLegacyProject()
         else:
-            self.createProject()
-            self.createDiagrams()
-            self.projectRender()
+            if not (self.parallel or self.streaming):
+                self.createProject()
+                self.createDiagrams()
+            self.scheduleProjectRender()
             self.projectLoaded()
 
 
@@ -2974,27 +3297,27 @@ class ProjectIRIMergeWorker_v3(QtCore.QObject):
                 self.worker = OwlOntologyImportWorker(self.currImpOnt.docLocation, self.session, isLocalImport=self.currImpOnt.isLocalDocument)
                 connect(self.worker.sgnCompleted, self.onImportCompleted)
                 connect(self.worker.sgnErrored, self.onImportError)
-                connect(self.worker.sgnClassFetched, self.onClassFetched)
-                connect(self.worker.sgnObjectPropertyFetched, self.onObjectPropertyFetched)
-                connect(self.worker.sgnDataPropertyFetched, self.onDataPropertyFetched)
-                connect(self.worker.sgnIndividualFetched, self.onIndividualFetched)
+                connect(self.worker.sgnClassesFetched, self.onClassesFetched)
+                connect(self.worker.sgnObjectPropertiesFetched, self.onObjectPropertiesFetched)
+                connect(self.worker.sgnDataPropertiesFetched, self.onDataPropertiesFetched)
+                connect(self.worker.sgnIndividualsFetched, self.onIndividualsFetched)
                 self.worker.run()
 
-    @QtCore.pyqtSlot(str)
-    def onClassFetched(self, iri):
-        self.currImpOnt.addClass(self.project.getIRI(iri, imported=True))
+    @QtCore.pyqtSlot(list)
+    def onClassesFetched(self, iris):
+        self.currImpOnt.addClasses(self.project.getIRIs(iris, imported=True))
 
-    @QtCore.pyqtSlot(str)
-    def onObjectPropertyFetched(self, iri):
-        self.currImpOnt.addObjectProperty(self.project.getIRI(iri, imported=True))
+    @QtCore.pyqtSlot(list)
+    def onObjectPropertiesFetched(self, iris):
+        self.currImpOnt.addObjectProperties(self.project.getIRIs(iris, imported=True))
 
-    @QtCore.pyqtSlot(str)
-    def onDataPropertyFetched(self, iri):
-        self.currImpOnt.addDataProperty(self.project.getIRI(iri, imported=True))
+    @QtCore.pyqtSlot(list)
+    def onDataPropertiesFetched(self, iris):
+        self.currImpOnt.addDataProperties(self.project.getIRIs(iris, imported=True))
 
-    @QtCore.pyqtSlot(str)
-    def onIndividualFetched(self, iri):
-        self.currImpOnt.addIndividual(self.project.getIRI(iri, imported=True))
+    @QtCore.pyqtSlot(list)
+    def onIndividualsFetched(self, iris):
+        self.currImpOnt.addIndividuals(self.project.getIRIs(iris, imported=True))
 
     @QtCore.pyqtSlot()
     def onImportCompleted(self):
@@ -3002,10 +3325,10 @@ class ProjectIRIMergeWorker_v3(QtCore.QObject):
         self.commands.append(command)
         disconnect(self.worker.sgnCompleted, self.onImportCompleted)
         disconnect(self.worker.sgnErrored, self.onImportError)
-        disconnect(self.worker.sgnClassFetched, self.onClassFetched)
-        disconnect(self.worker.sgnObjectPropertyFetched, self.onObjectPropertyFetched)
-        disconnect(self.worker.sgnDataPropertyFetched, self.onDataPropertyFetched)
-        disconnect(self.worker.sgnIndividualFetched, self.onIndividualFetched)
+        disconnect(self.worker.sgnClassesFetched, self.onClassesFetched)
+        disconnect(self.worker.sgnObjectPropertiesFetched, self.onObjectPropertiesFetched)
+        disconnect(self.worker.sgnDataPropertiesFetched, self.onDataPropertiesFetched)
+        disconnect(self.worker.sgnIndividualsFetched, self.onIndividualsFetched)
         self.currImpOnt = None
         self.worker = None
 
@@ -3017,10 +3340,10 @@ class ProjectIRIMergeWorker_v3(QtCore.QObject):
         self.currImpOnt = None
         disconnect(self.worker.sgnCompleted, self.onImportCompleted)
         disconnect(self.worker.sgnErrored, self.onImportError)
-        disconnect(self.worker.sgnClassFetched, self.onClassFetched)
-        disconnect(self.worker.sgnObjectPropertyFetched, self.onObjectPropertyFetched)
-        disconnect(self.worker.sgnDataPropertyFetched, self.onDataPropertyFetched)
-        disconnect(self.worker.sgnIndividualFetched, self.onIndividualFetched)
+        disconnect(self.worker.sgnClassesFetched, self.onClassesFetched)
+        disconnect(self.worker.sgnObjectPropertiesFetched, self.onObjectPropertiesFetched)
+        disconnect(self.worker.sgnDataPropertiesFetched, self.onDataPropertiesFetched)
+        disconnect(self.worker.sgnIndividualsFetched, self.onIndividualsFetched)
         self.sgnErrorManagingOWLOntologyImport.emit(location, exc)
 
     def mergeDiagrams(self):
@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+##########################################################################
+#                                                                        #
+#  Eddy: a graphical editor for the specification of Graphol ontologies  #
+#  Copyright (C) 2015 Daniele Pantaleone <danielepantaleone@me.com>      #
+#                                                                        #
+#  This program is free software: you can redistribute it and/or modify  #
+#  it under the terms of the GNU General Public License as published by  #
+#  the Free Software Foundation, either version 3 of the License, or     #
+#  (at your option) any later version.                                   #
+#                                                                        #
+#  This program is distributed in the hope that it will be useful,       #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of        #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the          #
+#  GNU General Public License for more details.                          #
+#                                                                        #
+#  You should have received a copy of the GNU General Public License     #
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.  #
+#                                                                        #
+#  #####################                          #####################  #
+#                                                                        #
+#  Graphol is developed by members of the DASI-lab group of the          #
+#  Dipartimento di Ingegneria Informatica, Automatica e Gestionale       #
+#  A.Ruberti at Sapienza University of Rome: http://www.dis.uniroma1.it  #
+#                                                                        #
+#     - Domenico Lembo <lembo@dis.uniroma1.it>                           #
+#     - Valerio Santarelli <santarelli@dis.uniroma1.it>                  #
+#     - Domenico Fabio Savo <savo@dis.uniroma1.it>                       #
+#     - Daniele Pantaleone <pantaleone@dis.uniroma1.it>                  #
+#     - Marco Console <console@dis.uniroma1.it>                          #
+#                                                                        #
+##########################################################################
+
+
+"""
+Qt-free parsing helpers for the Graphol file format.
+
+Functions in this module only depend on the standard library so that they can be
+executed in worker processes, converting Graphol XML fragments into plain nested
+tuples that can be cheaply transferred back to the GUI thread.
+"""
+
+import re
+from xml.etree import ElementTree
+
+# MATCHES A SINGLE <diagram> ELEMENT (INCLUDING EMPTY ONES) INSIDE A GRAPHOL DOCUMENT
+RE_DIAGRAM = re.compile(rb'<diagram\b[^>]*?(?:/>|>.*?</diagram>)', re.DOTALL)
+# MATCHES THE OPENING TAG OF THE <diagrams> SECTION AT THE END OF THE DATA PRECEDING THE FIRST DIAGRAM
+RE_DIAGRAMS_START = re.compile(rb'<diagrams\s*>\s*$')
+# MATCHES THE CLOSING TAG OF THE <diagrams> SECTION AT THE BEGINNING OF THE DATA FOLLOWING THE LAST DIAGRAM
+RE_DIAGRAMS_END = re.compile(rb'\s*</diagrams\s*>')
+
+
+def elementToRecord(element):
+    """
+    Convert the given element into a record of the form (tag, attributes, text, children),
+    where text is the concatenation of the text of the element and of all its descendants.
+    :type element: Element
+    :rtype: tuple
+    """
+    return (
+        element.tag,
+        dict(element.attrib),
+        ''.join(element.itertext()),
+        tuple(elementToRecord(child) for child in element),
+    )
+
+
+def parseDiagram(data):
+    """
+    Parse the XML of a single Graphol diagram into a record.
+    :type data: bytes
+    :rtype: tuple
+    """
+    return elementToRecord(ElementTree.fromstring(data))
+
+
+def splitDiagrams(data):
+    """
+    Split the given Graphol document in its skeleton (the document stripped of the
+    content of the 'diagrams' section) and the list of its diagram XML fragments.
+    The fragments must be the only content of the 'diagrams' section, separated by
+    whitespace: when they are not (e.g. because a comment or a CDATA section contains
+    a diagram tag) the whole document is returned as skeleton, with no fragment.
+    :type data: bytes
+    :rtype: tuple
+    """
+    matches = list(RE_DIAGRAM.finditer(data))
+    if not matches:
+        return data, []
+    head = data[:matches[0].start()]
+    tail = data[matches[-1].end():]
+    if not RE_DIAGRAMS_START.search(head) or not RE_DIAGRAMS_END.match(tail):
+        return data, []
+    for previous, match in zip(matches, matches[1:]):
+        if data[previous.end():match.start()].strip():
+            return data, []
+    return head + tail, [match.group(0) for match in matches]
@@ -33,10 +33,18 @@
 ##########################################################################
 
 
+import hashlib
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
 from PyQt5 import QtCore
 
 from eddy.core.datatypes.system import File
-from eddy.core.jvm import getJavaVM
+from eddy.core.functions.fsystem import fread, fwrite, mkdir
+from eddy.core.functions.misc import chunks
+from eddy.core.functions.path import expandPath
+from eddy.core.jvm import getJavaVM, shareOWLOntologies
 from eddy.core.loaders.common import AbstractProjectLoader
 from eddy.core.output import getLogger
 from eddy.core.owl import ImportedOntology
@@ -136,13 +144,14 @@ class OwlOntologyImportWorker(AbstractWorker):
     sgnStepPerformed = QtCore.pyqtSignal(int)
 
     sgnOntologyDocumentLoaded = QtCore.pyqtSignal(str, str, str, bool)
-    sgnClassFetched = QtCore.pyqtSignal(str)
-    sgnObjectPropertyFetched = QtCore.pyqtSignal(str)
-    sgnDataPropertyFetched = QtCore.pyqtSignal(str)
-    sgnIndividualFetched = QtCore.pyqtSignal(str)
+    sgnClassesFetched = QtCore.pyqtSignal(list)
+    sgnObjectPropertiesFetched = QtCore.pyqtSignal(list)
+    sgnDataPropertiesFetched = QtCore.pyqtSignal(list)
+    sgnIndividualsFetched = QtCore.pyqtSignal(list)
 
     sgnMissingOntologyImportFound = QtCore.pyqtSignal(str, str)
 
+    FETCH_BATCH_SIZE = 5000
     TOTAL_STEP_COUNT = 5
 
     def __init__(self, location, session, isLocalImport=True, isReloadAttempt=False):
@@ -177,6 +186,15 @@ class OwlOntologyImportWorker(AbstractWorker):
         self.MissingImportHandlingStrategy = self.vm.getJavaClass(
             'org.semanticweb.owlapi.model.MissingImportHandlingStrategy')
 
+    def fetch(self, signal, iris):
+        """
+        Emit the given signal once for every batch of at most FETCH_BATCH_SIZE IRI strings.
+        :type signal: pyqtBoundSignal
+        :type iris: iterable
+        """
+        for batch in chunks(iris, self.FETCH_BATCH_SIZE):
+            signal.emit(batch)
+
     @QtCore.pyqtSlot()
     def run(self):
         try:
@@ -232,26 +250,32 @@ class OwlOntologyImportWorker(AbstractWorker):
 
             self.sgnStepPerformed.emit(1)
 
-            for cls in ontology.getClassesInSignature():
-                if not (cls.isOWLThing() or cls.isOWLNothing()):
-                    self.sgnClassFetched.emit(cls.getIRI().toString())
+            # SIGNATURE IRIS ARE DELIVERED IN BATCHES TO AVOID FLOODING
+            # THE RECEIVER EVENT QUEUE WITH ONE EVENT PER ENTITY
+            self.fetch(self.sgnClassesFetched, (
+                cls.getIRI().toString() for cls in ontology.getClassesInSignature()
+                if not (cls.isOWLThing() or cls.isOWLNothing())))
             self.sgnStepPerformed.emit(2)
 
-            for prop in ontology.getObjectPropertiesInSignature():
-                if not prop.isOWLTopObjectProperty() and not prop.isOWLBottomObjectProperty():
-                    self.sgnObjectPropertyFetched.emit(prop.getIRI().toString())
+            self.fetch(self.sgnObjectPropertiesFetched, (
+                prop.getIRI().toString() for prop in ontology.getObjectPropertiesInSignature()
+                if not prop.isOWLTopObjectProperty() and not prop.isOWLBottomObjectProperty()))
             self.sgnStepPerformed.emit(3)
 
-            for prop in ontology.getDataPropertiesInSignature():
-                if not prop.isOWLTopDataProperty() and not prop.isOWLBottomDataProperty():
-                    self.sgnDataPropertyFetched.emit(prop.getIRI().toString())
+            self.fetch(self.sgnDataPropertiesFetched, (
+                prop.getIRI().toString() for prop in ontology.getDataPropertiesInSignature()
+                if not prop.isOWLTopDataProperty() and not prop.isOWLBottomDataProperty()))
             self.sgnStepPerformed.emit(4)
 
-            for ind in ontology.getIndividualsInSignature():
-                if not ind.isAnonymous():
-                    self.sgnIndividualFetched.emit(ind.getIRI().toString())
+            self.fetch(self.sgnIndividualsFetched, (
+                ind.getIRI().toString() for ind in ontology.getIndividualsInSignature()
+                if not ind.isAnonymous()))
             self.sgnStepPerformed.emit(5)
 
+            # THE DOCUMENT IS PARSED IN A PRIVATE MANAGER SO THAT REJECTED DOCUMENTS NEVER
+            # REACH THE SHARED ONE: ONCE ACCEPTED, THE FRESH COPY REPLACES ANY PREVIOUS ONE
+            shareOWLOntologies(self.project, self.ontologyManager, replace=True)
+
         except Exception as e:
             LOGGER.exception('OWL 2 import could not be completed')
             self.sgnErrored.emit(self.location, e)
@@ -262,24 +286,108 @@ class OwlOntologyImportWorker(AbstractWorker):
             self.sgnFinished.emit()
 
 
+class ImportedOntologySignatureCache(object):
+    """
+    Persistent on-disk cache of the signature of imported ontologies.
+    Entries are keyed by ontology IRI, version IRI and document location and, for
+    documents on the local file system, are only valid as long as the size and the
+    modification time of the document do not change.
+    """
+    VERSION = 1
+
+    def __init__(self, path='@cache/imports/'):
+        """
+        Initialize the cache.
+        :type path: str
+        """
+        self.path = expandPath(path)
+
+    def entryPath(self, ont):
+        """
+        Returns the path of the cache entry of the given imported ontology.
+        :type ont: ImportedOntology
+        :rtype: str
+        """
+        key = '\n'.join(str(x or '') for x in (ont.ontologyIRI, ont.versionIRI, ont.docLocation))
+        digest = hashlib.sha1(key.encode('utf-8')).hexdigest()
+        return os.path.join(self.path, '{0}.json'.format(digest))
+
+    @staticmethod
+    def fingerprint(ont):
+        """
+        Returns the fingerprint of the document of the given imported ontology.
+        :type ont: ImportedOntology
+        :rtype: list
+        """
+        if ont.isLocalDocument:
+            stat = os.stat(expandPath(ont.docLocation))
+            return [stat.st_size, stat.st_mtime_ns]
+        return None
+
+    def load(self, ont, path=None):
+        """
+        Returns the cached signature of the given imported ontology, or None if no valid entry exists.
+        The entry is read from the given path, if any, rather than from the one matching the ontology.
+        :type ont: ImportedOntology
+        :type path: str
+        :rtype: dict
+        """
+        try:
+            entry = json.loads(fread(path or self.entryPath(ont)))
+            if entry['version'] == self.VERSION and entry['fingerprint'] == self.fingerprint(ont):
+                return entry['signature']
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+        return None
+
+    def store(self, ont, signature, path=None):
+        """
+        Store the signature of the given imported ontology.
+        The entry is written to the given path, if any, rather than to the one matching the ontology.
+        :type ont: ImportedOntology
+        :type signature: dict
+        :type path: str
+        """
+        try:
+            mkdir(self.path)
+            fwrite(json.dumps({
+                'version': self.VERSION,
+                'fingerprint': self.fingerprint(ont),
+                'signature': signature,
+            }), path or self.entryPath(ont))
+        except OSError as e:
+            LOGGER.warning('Could not cache the signature of the ontology located in %s: %s',
+                           ont.docLocation, e)
+
+
 class OwlOntologyImportSetWorker(AbstractWorker):
     """
-    Expose facilities to load a set of OWL ontologies starting from import declarations
+    Expose facilities to load a set of OWL ontologies starting from import declarations.
+    When a signature cache is given, the imports having a valid cache entry are loaded
+    from it without parsing the ontology document, and are collected in `cachedImports`
+    so that they can be revalidated later with an OwlOntologyImportRevalidationWorker.
+    Ontology documents are parsed concurrently by a pool of JVM-attached threads.
     """
     sgnCompleted = QtCore.pyqtSignal(int, int)
     sgnErrored = QtCore.pyqtSignal(ImportedOntology, Exception)
     sgnStarted = QtCore.pyqtSignal()
     sgnFinished = QtCore.pyqtSignal()
+    sgnStepPerformed = QtCore.pyqtSignal(int)
 
-    def __init__(self, project, toBeLoaded=None):
+    def __init__(self, project, toBeLoaded=None, cache=None):
         """
         Initialize the OwlOntologyImportChecker worker.
         :type project: Project
+        :type toBeLoaded: list
+        :type cache: ImportedOntologySignatureCache
         """
         super().__init__()
         self.imports = project.importedOntologies
         self.project = project
         self.toBeLoaded = toBeLoaded
+        self.cache = cache
+        self.cachedImports = []
+        self.replaceShared = False
 
         self.vm = getJavaVM()
         if not self.vm.isRunning():
@@ -289,9 +397,10 @@ class OwlOntologyImportSetWorker(AbstractWorker):
         self.File = self.vm.getJavaClass('java.io.File')
         self.IRI = self.vm.getJavaClass('org.semanticweb.owlapi.model.IRI')
         self.OWLManager = self.vm.getJavaClass('org.semanticweb.owlapi.apibinding.OWLManager')
-        self.ontologyManager = None
+        self.maxWorkers = os.cpu_count() or 1
         self._owlOntologyImportErrors = set()
         self._loadCount = 0
+        self._stepCount = 0
 
     @property
     def importSize(self):
@@ -309,67 +418,153 @@ class OwlOntologyImportSetWorker(AbstractWorker):
     def onImportError(self, location, exc):
         self._owlOntologyImportErrors.update([(location, str(exc))])
 
+    def loadSignature(self, ont, manager):
+        """
+        Parse the document of the given imported ontology using the given ontology manager and
+        returns its ontology IRI, its version IRI and its signature, as lists of IRI strings
+        grouped by entity type.
+        :type ont: ImportedOntology
+        :type manager: OWLOntologyManager
+        :rtype: tuple
+        """
+        if ont.isLocalDocument:
+            file = self.File(ont.docLocation)
+            ontology = manager.loadOntologyFromOntologyDocument(file)
+        else:
+            iriInstance = self.IRI.create(ont.docLocation)
+            ontology = manager.loadOntology(iriInstance)
+        ontologyId = ontology.getOntologyID()
+        ontologyIRI = None
+        optionalOntologyIRI = ontologyId.getOntologyIRI()
+        if optionalOntologyIRI.isPresent():
+            ontologyIRI = optionalOntologyIRI.get().toString()
+        versionIRI = None
+        optionalVersionIRI = ontologyId.getVersionIRI()
+        if optionalVersionIRI.isPresent():
+            versionIRI = optionalVersionIRI.get().toString()
+
+        signature = {
+            'classes': [
+                c.getIRI().toString() for c in ontology.getClassesInSignature()
+                if not (c.isOWLThing() or c.isOWLNothing())],
+            'objectProperties': [
+                prop.getNamedProperty().getIRI().toString()
+                for prop in ontology.getObjectPropertiesInSignature()
+                if not (prop.isOWLTopObjectProperty() or prop.isOWLBottomObjectProperty())],
+            'dataProperties': [
+                prop.getIRI().toString() for prop in ontology.getDataPropertiesInSignature()
+                if not (prop.isOWLTopDataProperty() or prop.isOWLBottomDataProperty())],
+            'individuals': [
+                ind.getIRI().toString() for ind in ontology.getIndividualsInSignature()
+                if not ind.isAnonymous()],
+        }
+        return ontologyIRI, versionIRI, signature
+
+    def loadSharedSignature(self, ont):
+        """
+        Parse the document of the given imported ontology using a dedicated ontology manager,
+        so that documents can be loaded concurrently, and then hand over the loaded ontologies
+        to the ontology manager shared by the project workers, so that they are parsed only once.
+        When replaceShared is True, the copies previously shared are replaced by the new ones.
+        :type ont: ImportedOntology
+        :rtype: tuple
+        """
+        manager = self.OWLManager.createOWLOntologyManager()
+        result = self.loadSignature(ont, manager)
+        # NEVER REPLACE THE PROJECT ONTOLOGY (I.E. THE OWL 2 MIRROR) WITH A DOCUMENT CLAIMING ITS IRI
+        replace = self.replaceShared and result[0] != str(self.project.ontologyIRI)
+        shareOWLOntologies(self.project, manager, replace)
+        return result
+
+    def loadSignatureInThread(self, ont):
+        """
+        Parse the document of the given imported ontology from a pool thread.
+        :type ont: ImportedOntology
+        :rtype: tuple
+        """
+        self.vm.attachThreadToJVM()
+        try:
+            return self.loadSharedSignature(ont)
+        finally:
+            self.vm.detachThreadFromJVM()
+
+    def loadSignatures(self, imports):
+        """
+        Generator which parses the documents of the given imported ontologies and yields,
+        as soon as each one is done, a tuple made of the imported ontology, the result of
+        loadSignature and the exception raised, if any. When more than one document needs
+        to be parsed, documents are parsed concurrently by at most maxWorkers threads.
+        :type imports: list
+        :rtype: generator
+        """
+        if len(imports) > 1 and self.maxWorkers > 1:
+            with ThreadPoolExecutor(max_workers=min(len(imports), self.maxWorkers)) as executor:
+                futures = {executor.submit(self.loadSignatureInThread, ont): ont for ont in imports}
+                for future in as_completed(futures):
+                    exc = future.exception()
+                    yield futures[future], None if exc else future.result(), exc
+        else:
+            for ont in imports:
+                try:
+                    result, exc = self.loadSharedSignature(ont), None
+                except Exception as e:
+                    result, exc = None, e
+                yield ont, result, exc
+
+    def completeImport(self, ont, signature, exc=None):
+        """
+        Populate the given imported ontology with the given signature, or mark it as not
+        correctly loaded if the given exception is not None.
+        :type ont: ImportedOntology
+        :type signature: dict
+        :type exc: Exception
+        """
+        if exc is None:
+            try:
+                ont.addSignature(signature, self.project)
+            except Exception as e:
+                exc = e
+        if exc is not None:
+            LOGGER.error('The ontology located in {} cannot be correctly '
+                         'loaded'.format(ont.docLocation), exc_info=exc)
+            ont.correctlyLoaded = False
+            self.sgnErrored.emit(ont, exc)
+        else:
+            self._loadCount += 1
+            ont.correctlyLoaded = True
+        self._stepCount += 1
+        self.sgnStepPerformed.emit(self._stepCount)
+
     @QtCore.pyqtSlot()
     def run(self):
         try:
             self.sgnStarted.emit()
             self.vm.attachThreadToJVM()
-            self.ontologyManager = self.OWLManager.createOWLOntologyManager()
+            pending = []
+            entries = {}
             for ont in self.imports:
                 if not self.toBeLoaded or ont.ontologyIRI in self.toBeLoaded:
-                    try:
-                        if ont.isLocalDocument:
-                            file = self.File(ont.docLocation)
-                            ontology = self.ontologyManager.loadOntologyFromOntologyDocument(file)
-                        else:
-                            iriInstance = self.IRI.create(ont.docLocation)
-                            ontology = self.ontologyManager.loadOntology(iriInstance)
-                        ontologyId = ontology.getOntologyID()
-                        ontologyIRI = None
-                        optionalOntologyIRI = ontologyId.getOntologyIRI()
-                        if optionalOntologyIRI.isPresent():
-                            ontologyIRI = optionalOntologyIRI.get().toString()
-                        versionIRI = None
-                        optionalVersionIRI = ontologyId.getVersionIRI()
-                        if optionalVersionIRI.isPresent():
-                            versionIRI = optionalOntologyIRI.get().toString()
-
-                        if ontologyIRI:
-                            ont.ontologyIRI = ontologyIRI
-                        if versionIRI:
-                            ont.versionIRI = versionIRI
-
-                        setClasses = ontology.getClassesInSignature()
-                        for c in setClasses:
-                            if not (c.isOWLThing() or c.isOWLNothing()):
-                                iri = self.project.getIRI(c.getIRI().toString(), imported=True)
-                                ont.addClass(iri)
-
-                        for prop in ontology.getObjectPropertiesInSignature():
-                            if prop.isOWLTopObjectProperty() or prop.isOWLBottomObjectProperty():
-                                continue
-                            iri = self.project.getIRI(prop.getNamedProperty().getIRI().toString(),
-                                                      imported=True)
-                            ont.addObjectProperty(iri)
-
-                        for prop in ontology.getDataPropertiesInSignature():
-                            if prop.isOWLTopDataProperty() or prop.isOWLBottomDataProperty():
-                                continue
-                            iri = self.project.getIRI(prop.getIRI().toString(), imported=True)
-                            ont.addDataProperty(iri)
-
-                        for ind in ontology.getIndividualsInSignature():
-                            if not ind.isAnonymous():
-                                iri = self.project.getIRI(ind.getIRI().toString(), imported=True)
-                                ont.addIndividual(iri)
-                    except Exception as e:
-                        LOGGER.exception('The ontology located in {} cannot be correctly '
-                                         'loaded'.format(ont.docLocation))
-                        ont.correctlyLoaded = False
-                        self.sgnErrored.emit(ont, e)
+                    signature = None
+                    if self.cache:
+                        ## THE ENTRY IS LOOKED UP USING THE DECLARED IRIS, WHICH PARSING MAY OVERWRITE
+                        entries[id(ont)] = self.cache.entryPath(ont)
+                        signature = self.cache.load(ont, entries[id(ont)])
+                    if signature is not None:
+                        self.cachedImports.append(ont)
+                        self.completeImport(ont, signature)
                     else:
-                        self._loadCount += 1
-                        ont.correctlyLoaded = True
+                        pending.append(ont)
+            for ont, result, exc in self.loadSignatures(pending):
+                signature = None
+                if result:
+                    ontologyIRI, versionIRI, signature = result
+                    if ontologyIRI:
+                        ont.ontologyIRI = ontologyIRI
+                    if versionIRI:
+                        ont.versionIRI = versionIRI
+                    if self.cache:
+                        self.cache.store(ont, signature, entries[id(ont)])
+                self.completeImport(ont, signature, exc)
         except Exception as e:
             LOGGER.exception('Fatal exception while resolving ontology imports: %s', e)
         else:
@@ -379,3 +574,49 @@ class OwlOntologyImportSetWorker(AbstractWorker):
         finally:
             self.vm.detachThreadFromJVM()
             self.sgnFinished.emit()
+
+
+class OwlOntologyImportRevalidationWorker(OwlOntologyImportSetWorker):
+    """
+    Expose facilities to check, in the background, that the signature of a set of imported
+    ontologies loaded from the signature cache still matches the ontology documents.
+    The cache is refreshed and sgnSignatureChanged is emitted for each stale import.
+    """
+    sgnSignatureChanged = QtCore.pyqtSignal(ImportedOntology, dict)
+
+    def __init__(self, project, imports, cache):
+        """
+        Initialize the OwlOntologyImportRevalidationWorker worker.
+        :type project: Project
+        :type imports: list
+        :type cache: ImportedOntologySignatureCache
+        """
+        super().__init__(project, cache=cache)
+        self.imports = list(imports)
+        self.replaceShared = True
+
+    @QtCore.pyqtSlot()
+    def run(self):
+        try:
+            self.sgnStarted.emit()
+            self.vm.attachThreadToJVM()
+            for ont, result, exc in self.loadSignatures(self.imports):
+                if exc:
+                    LOGGER.warning('The ontology located in %s could not be revalidated: %s',
+                                   ont.docLocation, exc)
+                else:
+                    _, _, signature = result
+                    if signature != self.cache.load(ont):
+                        self.cache.store(ont, signature)
+                        self.sgnSignatureChanged.emit(ont, signature)
+                    self._loadCount += 1
+                self._stepCount += 1
+                self.sgnStepPerformed.emit(self._stepCount)
+        except Exception as e:
+            LOGGER.exception('Fatal exception while revalidating ontology imports: %s', e)
+        else:
+            self.sgnCompleted.emit(self._loadCount, len(self.imports))
+        finally:
+            self.vm.detachThreadFromJVM()
+            self.sgnFinished.emit()
+            self.finished.emit()
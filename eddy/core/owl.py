@@ -33,9 +33,12 @@
 ##########################################################################
 
 
-from collections import defaultdict
 from enum import unique
+from functools import lru_cache
+import inspect
 import re
+from sys import intern
+import weakref
 
 from PyQt5 import (
     QtCore,
@@ -47,12 +50,14 @@ from rfc3987 import (
     resolve,
 )
 
+from eddy.core.datatypes.collections import StringTrie
 from eddy.core.datatypes.common import Enum_
 from eddy.core.datatypes.owl import Namespace
 from eddy.core.functions.signals import (
     connect,
     disconnect,
 )
+from eddy.core.qt import sip
 
 K_FUNCTIONAL = 'functional'
 K_ASYMMETRIC = 'asymmetric'
@@ -63,6 +68,236 @@ K_SYMMETRIC = 'symmetric'
 K_TRANSITIVE = 'transitive'
 K_DEPRECATED = 'deprecated'
 
+# COMMON http(s)://host/path#local AND urn:nid:nss SHAPES MADE OF ASCII CHARACTERS ONLY:
+# ANY STRING MATCHING THIS EXPRESSION IS BOTH A VALID IRI AND A VALID URI REFERENCE
+RE_IRI_FAST = re.compile(r"""
+    (?:
+        https?://[A-Za-z0-9._~-]+(?::[0-9]*)?(?:/(?:[A-Za-z0-9._~!$&'()*+,;=:@/-]|%[0-9A-Fa-f]{2})*)?
+      | urn:[A-Za-z0-9][A-Za-z0-9-]{0,31}:(?:[A-Za-z0-9._~!$&'()*+,;=:@/-]|%[0-9A-Fa-f]{2})+
+    )
+    (?:\?(?:[A-Za-z0-9._~!$&'()*+,;=:@/?-]|%[0-9A-Fa-f]{2})*)?
+    (?:\#(?:[A-Za-z0-9._~!$&'()*+,;=:@/?-]|%[0-9A-Fa-f]{2})*)?
+    \Z""", re.VERBOSE)
+
+
+@lru_cache(maxsize=8192)
+def matchesRule(string, rule='IRI_reference'):
+    """
+    Returns `True` if the given string matches the given RFC 3987 grammar rule, and `False` otherwise.
+    Common IRI shapes are recognized without running the full grammar, and results are cached.
+    :type string: str
+    :type rule: str
+    :rtype: bool
+    """
+    if rule in {'IRI', 'IRI_reference', 'URI_reference'} and RE_IRI_FAST.match(string):
+        return True
+    try:
+        return parse(string, rule=rule) is not None
+    except ValueError:
+        return False
+
+
+@lru_cache(maxsize=8192)
+def parseComponents(string):
+    """
+    Returns the RFC 3987 components of the given IRI reference. Results are cached,
+    hence the returned dictionary must not be modified.
+    :type string: str
+    :rtype: dict
+    """
+    return parse(string, rule='IRI_reference')
+
+
+class EventBus(QtCore.QObject):
+    """
+    Dispatches the change notifications of IRIs and annotation assertions.
+    Observers interested in every IRI connect to the signals of the bus, which carry the
+    modified IRI as first argument, while observers interested in a single object connect to
+    the signals declared on the object itself, whose connections are stored by the bus.
+    """
+    sgnIRIModified = QtCore.pyqtSignal(object, str)
+    sgnAnnotationAdded = QtCore.pyqtSignal(object, object)
+    sgnAnnotationRemoved = QtCore.pyqtSignal(object, object)
+    sgnAnnotationModified = QtCore.pyqtSignal(object, object)
+
+    sgnIRIPropModified = QtCore.pyqtSignal(object)
+    sgnFunctionalModified = QtCore.pyqtSignal(object)
+    sgnInverseFunctionalModified = QtCore.pyqtSignal(object)
+
+    _instance = None
+
+    def __init__(self, parent=None):
+        """
+        Initialize the event bus.
+        :type parent: QObject
+        """
+        super().__init__(parent)
+        self._sources = []
+        self._subscriptions = {} # {id(source): {name: [(ref, count)]}}
+        self._finalizers = {} # {id(source): weakref.finalize}
+
+    @classmethod
+    def instance(cls):
+        """
+        Returns the event bus shared by all the projects.
+        :rtype: EventBus
+        """
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    #############################################
+    #   INTERFACE
+    #################################
+
+    def publish(self, source, name, broadcast, *args):
+        """
+        Notify the slots connected to the signal `name` of `source`, and the observers
+        connected to the signal of the bus with the same name if `broadcast` is True.
+        :type source: object
+        :type name: str
+        :type broadcast: bool
+        :type args: mixed
+        """
+        self._sources.append(source)
+        try:
+            if broadcast:
+                getattr(self, name).emit(source, *args)
+            slots = self._subscriptions.get(id(source), {}).get(name)
+            for connection in tuple(slots or ()):
+                ref, count = connection
+                slot = ref()
+                receiver = getattr(slot, '__self__', None)
+                if slot is None or (isinstance(receiver, sip.simplewrapper) and sip.isdeleted(receiver)):
+                    if connection in slots:
+                        slots.remove(connection)
+                    continue
+                slot(*args[:count])
+        finally:
+            self._sources.pop()
+
+    def source(self):
+        """
+        Returns the object whose signal is being dispatched, or None outside of a dispatch.
+        This is the counterpart of QObject.sender() for the signals stored by the bus.
+        :rtype: object
+        """
+        return self._sources[-1] if self._sources else None
+
+    def subscribe(self, source, name, slot):
+        """
+        Connect `slot` to the signal `name` of `source`. Bound methods are referenced weakly,
+        so that a connection does not keep its receiver alive. As with pyqtSignal, extra
+        signal arguments are not handed over to slots accepting fewer arguments.
+        :type source: object
+        :type name: str
+        :type slot: callable
+        """
+        if hasattr(slot, '__func__'):
+            ref = weakref.WeakMethod(slot)
+        else:
+            ref = lambda: slot
+        try:
+            params = inspect.signature(slot).parameters.values()
+        except (TypeError, ValueError):
+            count = None
+        else:
+            if any(p.kind is p.VAR_POSITIONAL for p in params):
+                count = None
+            else:
+                count = sum(1 for p in params if p.kind in (p.POSITIONAL_ONLY, p.POSITIONAL_OR_KEYWORD))
+        key = id(source)
+        if key not in self._subscriptions:
+            # Subscriptions are keyed by id(), so that they do not keep their source alive and are
+            # released by the finalizer. Annotation assertions compare (and hash) by content, which
+            # changes when they are modified, so they cannot be used as keys themselves.
+            self._subscriptions[key] = {}
+            self._finalizers[key] = weakref.finalize(source, self._release, key)
+        self._subscriptions[key].setdefault(name, []).append((ref, count))
+
+    def unsubscribe(self, source, name, slot=None):
+        """
+        Disconnect `slot`, or every slot if None is given, from the signal `name` of `source`.
+        Raises TypeError if `slot` is not connected to the signal, like pyqtSignal does.
+        :type source: object
+        :type name: str
+        :type slot: callable
+        """
+        key = id(source)
+        signals = self._subscriptions.get(key, {})
+        slots = signals.get(name, [])
+        if slot is None:
+            slots.clear()
+        else:
+            for connection in slots:
+                if connection[0]() == slot:
+                    slots.remove(connection)
+                    break
+            else:
+                raise TypeError('{} is not connected to {}'.format(slot, name))
+        if not slots:
+            signals.pop(name, None)
+        if not signals and key in self._subscriptions:
+            self._finalizers.pop(key).detach()
+            self._release(key)
+
+    def _release(self, key):
+        """
+        Drop the subscriptions stored for the object with the given identity.
+        :type key: int
+        """
+        self._subscriptions.pop(key, None)
+        self._finalizers.pop(key, None)
+
+
+class EventSignal(object):
+    """
+    Declares a signal on a plain python class. The connections of the signal are stored
+    by the EventBus, hence instances nobody observes carry no connection state at all.
+    """
+    __slots__ = ('name', 'broadcast')
+
+    def __init__(self, broadcast=True):
+        """
+        Initialize the signal.
+        :type broadcast: bool
+        """
+        self.name = None
+        self.broadcast = broadcast
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        return BoundEventSignal(self, instance)
+
+
+class BoundEventSignal(object):
+    """
+    Exposes the pyqtSignal interface for the EventSignal of a given instance.
+    """
+    __slots__ = ('signal', 'source')
+
+    def __init__(self, signal, source):
+        """
+        Initialize the bound signal.
+        :type signal: EventSignal
+        :type source: object
+        """
+        self.signal = signal
+        self.source = source
+
+    def connect(self, slot):
+        EventBus.instance().subscribe(self.source, self.signal.name, slot)
+
+    def disconnect(self, slot=None):
+        EventBus.instance().unsubscribe(self.source, self.signal.name, slot)
+
+    def emit(self, *args):
+        EventBus.instance().publish(self.source, self.signal.name, self.signal.broadcast, *args)
+
 
 class Literal(QtCore.QObject):
     """
@@ -333,13 +568,15 @@ class Annotation(QtCore.QObject):
         return str(self)
 
 
-class AnnotationAssertion(QtCore.QObject):
+class AnnotationAssertion(object):
     """
     Represents Annotation Assertions
     """
-    sgnAnnotationModified = QtCore.pyqtSignal()
+    __slots__ = ('_subject', '_property', '_value', '_datatype', '_language', '__weakref__')
+
+    sgnAnnotationModified = EventSignal(broadcast=False)
 
-    def __init__(self, subject, property, value, type=None, language=None, parent=None):
+    def __init__(self, subject, property, value, type=None, language=None):
         """
         :type subject:IRI
         :type property:IRI
@@ -347,7 +584,6 @@ class AnnotationAssertion(QtCore.QObject):
         :type type:IRI
         :type language:str
         """
-        super().__init__(parent)
         self._subject = subject
         self._property = property
         if not (isinstance(value, IRI) or isinstance(value, str)):
@@ -373,7 +609,7 @@ class AnnotationAssertion(QtCore.QObject):
     def assertionProperty(self, prop):
         if isinstance(prop, IRI):
             self._property = prop
-            self.sgnAnnotationModified.emit()
+            self.notifyModified()
 
     @property
     def subject(self):
@@ -387,7 +623,7 @@ class AnnotationAssertion(QtCore.QObject):
     def datatype(self, type):
         if isinstance(type, IRI):
             self._datatype = type
-            self.sgnAnnotationModified.emit()
+            self.notifyModified()
 
     @property
     def value(self):
@@ -396,7 +632,7 @@ class AnnotationAssertion(QtCore.QObject):
     @value.setter
     def value(self, val):
         self._value = val
-        self.sgnAnnotationModified.emit()
+        self.notifyModified()
 
     @property
     def language(self):
@@ -405,14 +641,23 @@ class AnnotationAssertion(QtCore.QObject):
     @language.setter
     def language(self, lang):
         self._language = lang
-        self.sgnAnnotationModified.emit()
+        self.notifyModified()
 
     def refactor(self,refDict):
         self._property=refDict['assertionProperty']
         self._value=refDict['value']
         self._datatype=refDict['datatype']
         self._language=refDict['language']
+        self.notifyModified()
+
+    def notifyModified(self):
+        """
+        Notify the observers of this assertion, and the subject holding it, that the assertion changed.
+        """
         self.sgnAnnotationModified.emit()
+        subject = self._subject
+        if isinstance(subject, IRI) and subject.annotationAssertions.holds(self):
+            subject.onAnnotationAssertionModified(self)
 
     def getObjectResourceString(self, prefixedForm):
         """
@@ -479,29 +724,239 @@ class AnnotationAssertion(QtCore.QObject):
         return str(self)
 
 
-class IRI(QtCore.QObject):
+class AnnotationAssertionStore(object):
+    """
+    Insertion ordered collection of annotation assertions, indexed by property and by (property, language).
+    Membership follows the equality of annotation assertions, and is tested in constant time.
+    Assertions are stored by identity in insertion order, and positional access goes through
+    a sequence built on first use and dropped whenever an assertion is added or removed.
+    Most entities hold a handful of assertions: stores holding no more than IndexThreshold
+    assertions are scanned, and build their indices only once they grow past it.
+    """
+    IndexThreshold = 8
+
+    __slots__ = ('_assertions', '_sequence', '_keys', '_equal', '_byProperty', '_byLanguage')
+
+    def __init__(self):
+        """
+        Initialize the store.
+        """
+        self._assertions = {}
+        self._sequence = None
+        self._keys = None
+        self._equal = None
+        self._byProperty = None
+        self._byLanguage = None
+
+    #############################################
+    #   INTERFACE
+    #################################
+
+    def add(self, assertion):
+        """
+        Add the given assertion, unless an equal one is already stored.
+        Returns True if the assertion has been added, False otherwise.
+        :type assertion: AnnotationAssertion
+        :rtype: bool
+        """
+        if self.find(assertion) is not None:
+            return False
+        self._assertions[id(assertion)] = assertion
+        self._sequence = None
+        if self._keys is not None:
+            self.index(assertion)
+        elif len(self._assertions) > AnnotationAssertionStore.IndexThreshold:
+            self._keys, self._equal, self._byProperty, self._byLanguage = {}, {}, {}, {}
+            for stored in self._assertions.values():
+                self.index(stored)
+        return True
+
+    def assertions(self, property, language=None):
+        """
+        Returns the assertions for the given property, optionally restricted to the given language.
+        :type property: IRI
+        :type language: str
+        :rtype: list
+        """
+        if self._keys is None:
+            return [x for x in self._assertions.values() if x.assertionProperty == property
+                    and (not language or x.language == language)]
+        if language:
+            return list(self._byLanguage.get((property, language), {}).values())
+        return list(self._byProperty.get(property, {}).values())
+
+    @staticmethod
+    def equalityKey(assertion):
+        """
+        Returns the key identifying the assertions equal to the given one.
+        :type assertion: AnnotationAssertion
+        :rtype: tuple
+        """
+        return (
+            assertion.assertionProperty, assertion.subject,
+            assertion.value, assertion.datatype, assertion.language,
+        )
+
+    def find(self, assertion):
+        """
+        Returns the first stored assertion equal to the given one, or None if there is no such assertion.
+        :type assertion: AnnotationAssertion
+        :rtype: AnnotationAssertion
+        """
+        equality = AnnotationAssertionStore.equalityKey(assertion)
+        if self._keys is None:
+            for stored in self._assertions.values():
+                if AnnotationAssertionStore.equalityKey(stored) == equality:
+                    return stored
+            return None
+        keys = self._equal.get(equality)
+        return self._assertions[keys[0]] if keys else None
+
+    def first(self, property, language=None):
+        """
+        Returns the first assertion for the given property and language, falling back
+        to the first assertion for the given property, or None if there is no such assertion.
+        :type property: IRI
+        :type language: str
+        :rtype: AnnotationAssertion
+        """
+        if self._keys is None:
+            fallback = None
+            for x in self._assertions.values():
+                if x.assertionProperty == property:
+                    if not language or x.language == language:
+                        return x
+                    fallback = fallback or x
+            return fallback
+        bucket = None
+        if language:
+            bucket = self._byLanguage.get((property, language))
+        if not bucket:
+            bucket = self._byProperty.get(property)
+        return next(iter(bucket.values())) if bucket else None
+
+    def holds(self, assertion):
+        """
+        Returns True if the given assertion object, rather than an equal one, is stored.
+        :type assertion: AnnotationAssertion
+        :rtype: bool
+        """
+        return self._assertions.get(id(assertion)) is assertion
+
+    def index(self, assertion):
+        """
+        Index the given stored assertion.
+        :type assertion: AnnotationAssertion
+        """
+        key = id(assertion)
+        equality = AnnotationAssertionStore.equalityKey(assertion)
+        property, language = assertion.assertionProperty, assertion.language
+        self._keys[key] = (equality, property, language)
+        self._equal.setdefault(equality, []).append(key)
+        self._byProperty.setdefault(property, {})[key] = assertion
+        self._byLanguage.setdefault((property, language), {})[key] = assertion
+
+    def items(self):
+        """
+        Returns an iterable over (property, assertions) pairs.
+        :rtype: generator
+        """
+        if self._keys is None:
+            buckets = {}
+            for x in self._assertions.values():
+                buckets.setdefault(x.assertionProperty, []).append(x)
+            yield from buckets.items()
+        else:
+            for property, bucket in self._byProperty.items():
+                yield property, list(bucket.values())
+
+    def reindex(self, assertion):
+        """
+        Update the indices after the given stored assertion has been modified.
+        :type assertion: AnnotationAssertion
+        """
+        if self._keys is not None and id(assertion) in self._assertions:
+            self.unindex(assertion)
+            self.index(assertion)
+
+    def remove(self, assertion):
+        """
+        Remove the first stored assertion equal to the given one.
+        Returns the removed assertion, or None if no assertion has been removed.
+        :type assertion: AnnotationAssertion
+        :rtype: AnnotationAssertion
+        """
+        stored = self.find(assertion)
+        if stored is None:
+            return None
+        del self._assertions[id(stored)]
+        self._sequence = None
+        if self._keys is not None:
+            self.unindex(stored)
+        return stored
+
+    def unindex(self, assertion):
+        """
+        Remove the given assertion from the indices.
+        :type assertion: AnnotationAssertion
+        """
+        key = id(assertion)
+        equality, property, language = self._keys.pop(key)
+        self._equal[equality].remove(key)
+        if not self._equal[equality]:
+            del self._equal[equality]
+        for index, k in ((self._byProperty, property), (self._byLanguage, (property, language))):
+            del index[k][key]
+            if not index[k]:
+                del index[k]
+
+    def __bool__(self):
+        return bool(self._assertions)
+
+    def __contains__(self, assertion):
+        return self.find(assertion) is not None
+
+    def __getitem__(self, item):
+        if self._sequence is None:
+            self._sequence = tuple(self._assertions.values())
+        return self._sequence[item]
+
+    def __iter__(self):
+        return iter(self._assertions.values())
+
+    def __len__(self):
+        return len(self._assertions)
+
+
+class IRI(object):
     """
     Represents International Resource Identifiers (https://www.ietf.org/rfc/rfc3987.txt)
     """
+    __slots__ = (
+        '_namespace', '_suffix', '_components', '_iriString', '_manager',
+        '_isFunctional', '_isInverseFunctional', '_isSymmetric', '_isAsymmetric',
+        '_isReflexive', '_isIrreflexive', '_isTransitive',
+        '_annotationAssertions', '__weakref__',
+    )
 
-    sgnIRIModified = QtCore.pyqtSignal(str)
-    sgnAnnotationAdded = QtCore.pyqtSignal(AnnotationAssertion)
-    sgnAnnotationRemoved = QtCore.pyqtSignal(AnnotationAssertion)
-    sgnAnnotationModified = QtCore.pyqtSignal(AnnotationAssertion)
+    sgnIRIModified = EventSignal()
+    sgnAnnotationAdded = EventSignal()
+    sgnAnnotationRemoved = EventSignal()
+    sgnAnnotationModified = EventSignal()
 
-    sgnIRIPropModified = QtCore.pyqtSignal()
-    sgnFunctionalModified = QtCore.pyqtSignal()
-    sgnInverseFunctionalModified = QtCore.pyqtSignal()
+    sgnIRIPropModified = EventSignal()
+    sgnFunctionalModified = EventSignal()
+    sgnInverseFunctionalModified = EventSignal()
 
-    def __init__(self, namespace,suffix=None, functional=False, invFuctional=False, symmetric=False, asymmetric=False,reflexive=False,irreflexive=False,transitive=False, parent=None):
+    def __init__(self, namespace,suffix=None, functional=False, invFuctional=False, symmetric=False, asymmetric=False,reflexive=False,irreflexive=False,transitive=False):
         """
         Create a new IRI
         """
-        super().__init__(parent)
         if not IRI.isValidNamespace(namespace):
             raise IllegalNamespaceError('The inserted string "{}" is not a legal namespace'.format(namespace))
         self._namespace = str(namespace)
         self._suffix = suffix
+        self._components = None
         self._isFunctional = functional
         self._isInverseFunctional = invFuctional
         self._isSymmetric = symmetric
@@ -510,9 +965,9 @@ class IRI(QtCore.QObject):
         self._isIrreflexive = irreflexive
         self._isTransitive = transitive
         self._manager = None
-        self.components = parse(IRI.concat(self._namespace, self._suffix))
-        self._annotationAssertionsMap = defaultdict(list)
-        self._annotationAssertions = []
+        self._iriString = None
+        self.setIRIString(IRI.concat(self._namespace, self._suffix))
+        self._annotationAssertions = AnnotationAssertionStore()
 
     @staticmethod
     def concat(namespace, suffix):
@@ -534,9 +989,14 @@ class IRI(QtCore.QObject):
     #   SLOTS
     #################################
 
-    @QtCore.pyqtSlot()
-    def onAnnotationAssertionModified(self):
-        annotation = self.sender()
+    def onAnnotationAssertionModified(self, annotation=None):
+        """
+        Executed when an annotation assertion held by this IRI changes.
+        :type annotation: AnnotationAssertion
+        """
+        annotation = annotation or EventBus.instance().source()
+        self._annotationAssertions.reindex(annotation)
+        self.invalidateRendering()
         self.sgnAnnotationModified.emit(annotation)
 
     # @QtCore.pyqtSlot('IRI')
@@ -556,6 +1016,25 @@ class IRI(QtCore.QObject):
         if isinstance(manager,IRIManager):
             self._manager = manager
 
+    @property
+    def components(self):
+        """
+        Returns the rfc3987 components of this IRI, parsing them on first access.
+        :rtype: dict
+        """
+        if self._components is None:
+            self._components = parseComponents(self._iriString)
+        return self._components
+
+    @components.setter
+    def components(self, value):
+        """
+        Set the rfc3987 components of this IRI, recomputing its canonical string form.
+        :type value: dict
+        """
+        self._components = value
+        self._iriString = intern(compose(**value))
+
     @property
     def namespace(self):
         return self._namespace
@@ -564,9 +1043,10 @@ class IRI(QtCore.QObject):
     def namespace(self, value):
         if not IRI.isValidNamespace(value):
             raise IllegalNamespaceError(value)
-        oldIRIStr = compose(**self.components)
+        oldIRIStr = self._iriString
         self._namespace = value
-        self.components = parse(IRI.concat(self._namespace, self._suffix))
+        self.setIRIString(IRI.concat(self._namespace, self._suffix))
+        self.invalidateRendering()
         self.sgnIRIModified.emit(oldIRIStr)
 
     @property
@@ -682,10 +1162,8 @@ class IRI(QtCore.QObject):
         Returns `True` whenever this IRI has been deprecated.
         :rtype: bool
         """
-        return len([x for x in self.annotationAssertions if
-                    x.assertionProperty == AnnotationAssertionProperty.Deprecated.value and
-                    x.value == 'true' and
-                    x.datatype == OWL2Datatype.boolean.value]) > 0
+        return any(x.value == 'true' and x.datatype == OWL2Datatype.boolean.value
+                   for x in self.getAnnotationAssertions(AnnotationAssertionProperty.Deprecated.value))
 
     @deprecated.setter
     def deprecated(self, depr):
@@ -699,7 +1177,7 @@ class IRI(QtCore.QObject):
                 self, AnnotationAssertionProperty.Deprecated.value,
                 'true', OWL2Datatype.boolean.value))
         elif not depr and self.deprecated:
-            for ann in self.annotationAssertions[:]:
+            for ann in self.getAnnotationAssertions(AnnotationAssertionProperty.Deprecated.value):
                 if (ann.assertionProperty == AnnotationAssertionProperty.Deprecated.value
                     and ann.value == 'true'
                     and ann.datatype == OWL2Datatype.boolean.value):
@@ -707,11 +1185,15 @@ class IRI(QtCore.QObject):
 
     @property
     def annotationAssertions(self):
+        """
+        Returns the annotation assertions regarding this IRI, in insertion order.
+        :rtype: AnnotationAssertionStore
+        """
         return self._annotationAssertions
 
     @property
     def annotationAssertionMapItems(self):
-        return self._annotationAssertionsMap.items()
+        return self._annotationAssertions.items()
 
     @property
     def authority(self):
@@ -756,6 +1238,17 @@ class IRI(QtCore.QObject):
     #############################################
     #   INTERFACE
     #################################
+    def setIRIString(self, value):
+        """
+        Set the canonical string form of this IRI, deferring the parsing of its components.
+        Raises ValueError if the given string is not a valid IRI reference.
+        :type value: str
+        """
+        if not matchesRule(value):
+            raise ValueError('{!r} is not a valid {!r}.'.format(value, 'IRI_reference'))
+        self._iriString = intern(value)
+        self._components = None
+
     def setMetaProperties(self, metaDict):
         """
         :type: metaDict: dict
@@ -839,10 +1332,7 @@ class IRI(QtCore.QObject):
         return True
 
     def getAllLabelAnnotationAssertions(self):
-        if AnnotationAssertionProperty.Label.value in self._annotationAssertionsMap:
-            currList = self._annotationAssertionsMap[AnnotationAssertionProperty.Label.value]
-            return currList
-        return None
+        return self._annotationAssertions.assertions(AnnotationAssertionProperty.Label.value) or None
 
     def getLabelAnnotationAssertion(self, lang=None):
         """
@@ -852,78 +1342,81 @@ class IRI(QtCore.QObject):
         return self.getAnnotationAssertion(AnnotationAssertionProperty.Label.value, lang=lang)
 
     def getAnnotationAssertion(self, annotationProperty, lang=None):
-        if annotationProperty in self._annotationAssertionsMap:
-            currList = self._annotationAssertionsMap[annotationProperty]
-            if lang:
-                for annotation in currList:
-                    if annotation.language == lang:
-                        return annotation
-            return currList[0]
-        return None
+        """
+        Returns the first assertion for the given property in the given language, falling back
+        to the first assertion for the given property in any language.
+        :type annotationProperty: IRI
+        :type lang: str
+        :rtype: AnnotationAssertion
+        """
+        return self._annotationAssertions.first(annotationProperty, lang)
+
+    def getAnnotationAssertions(self, annotationProperty, lang=None):
+        """
+        Returns the assertions for the given property, optionally restricted to the given language.
+        :type annotationProperty: IRI
+        :type lang: str
+        :rtype: list
+        """
+        return self._annotationAssertions.assertions(annotationProperty, lang)
 
     def addAnnotationAssertion(self, annotation):
         """
         Add an annotation assertion regarding self
         :type: annotation: AnnotationAssertion
         """
-        if annotation not in self._annotationAssertions:
-            self._annotationAssertions.append(annotation)
-            self._annotationAssertionsMap[annotation.assertionProperty].append(annotation)
+        if self._annotationAssertions.add(annotation):
+            self.invalidateRendering()
             self.sgnAnnotationAdded.emit(annotation)
-            connect(annotation.sgnAnnotationModified, self.onAnnotationAssertionModified)
+            if annotation.subject is not self:
+                connect(annotation.sgnAnnotationModified, self.onAnnotationAssertionModified)
 
     def removeAnnotationAssertion(self, annotation):
         """
         Remove an annotation assertion regarding self
         :type: annotation: AnnotationAssertion
         """
-        if annotation in self._annotationAssertions:
-            self.annotationAssertions.remove(annotation)
-            self._annotationAssertionsMap[annotation.assertionProperty].remove(annotation)
-            if not self._annotationAssertionsMap[annotation.assertionProperty]:
-                del self._annotationAssertionsMap[annotation.assertionProperty]
+        stored = self._annotationAssertions.remove(annotation)
+        if stored:
+            self.invalidateRendering()
             self.sgnAnnotationRemoved.emit(annotation)
-            disconnect(annotation.sgnAnnotationModified, self.onAnnotationAssertionModified)
+            if stored.subject is not self:
+                disconnect(stored.sgnAnnotationModified, self.onAnnotationAssertionModified)
+
+    def invalidateRendering(self):
+        """
+        Invalidates the label memoized for this IRI by the rendering service of its manager.
+        """
+        if self._manager:
+            self._manager.renderer.invalidate(self)
 
     def isAbsolute(self):
         """
         Returns `True` if this object represents an absolute IRI, and `False` otherwise
         :rtype: bool
         """
-        try:
-            return parse(str(self), rule='absolute_IRI') is not None
-        except ValueError:
-            return False
+        return matchesRule(self._iriString, 'absolute_IRI')
 
     def isRelative(self):
         """
         Returns `True if this object represents a relative IRI, and `False` otherwise
         :rtype: bool
         """
-        try:
-            return parse(str(self), rule='relative_ref') is not None
-        except ValueError:
-            return False
+        return matchesRule(self._iriString, 'relative_ref')
 
     def isURI(self):
         """
         Returns `True` if this object represents a valid URI, and `False` otherwise
         :return:
         """
-        try:
-            return parse(str(self), rule='URI_reference') is not None
-        except ValueError:
-            return False
+        return matchesRule(self._iriString, 'URI_reference')
 
     def isValid(self):
         """
         Returns `True` if this object represents a valid IRI, and `False` otherwise
         :rtype: bool
         """
-        try:
-            return parse(str(self), rule='IRI') is not None
-        except ValueError:
-            return False
+        return matchesRule(self._iriString, 'IRI')
 
     @staticmethod
     def isValidNamespace(namespace):
@@ -932,10 +1425,7 @@ class IRI(QtCore.QObject):
         :type namespace: str
         :rtype: bool
         """
-        try:
-            return namespace and (parse(namespace, rule='IRI_reference') is not None)
-        except ValueError:
-            return False
+        return bool(namespace) and matchesRule(str(namespace))
 
     def resolve(self, other):
         """
@@ -947,7 +1437,7 @@ class IRI(QtCore.QObject):
             other = IRI(other)
         if other.isAbsolute():
             return other
-        return IRI(resolve(str(self), str(other)))
+        return IRI(resolve(self._iriString, str(other)))
 
     def __eq__(self, other):
         """
@@ -960,30 +1450,30 @@ class IRI(QtCore.QObject):
         return False
 
     def __getitem__(self, item):
-        return str(self)[item]
+        return self._iriString[item]
 
     def __hash__(self):
         return super().__hash__()
 
     def __iter__(self):
-        return str(self).__iter__()
+        return self._iriString.__iter__()
 
     def __len__(self):
-        return len(str(self))
+        return len(self._iriString)
 
     def __str__(self):
-        return compose(**self.components)
+        return self._iriString
 
     def __repr__(self):
-        return str(self)
+        return self._iriString
 
-class PrefixedIRI(QtCore.QObject):
+class PrefixedIRI(object):
     """
     Represents prefixed forms of International Resource Identifiers (https://www.ietf.org/rfc/rfc3987.txt)
     """
+    __slots__ = ('_prefix', '_suffix')
 
-    def __init__(self, prefix, suffix, parent=None):
-        super().__init__(parent)
+    def __init__(self, prefix, suffix):
         self._prefix = prefix
         self._suffix = suffix
 
@@ -1079,6 +1569,10 @@ class ImportedOntology(QtCore.QObject):
         self._classes.add(iri)
         self._iris.add(iri)
 
+    def addClasses(self, iris):
+        self._classes.update(iris)
+        self._iris.update(iris)
+
     @property
     def objectProperties(self):
         return self._objProps
@@ -1087,6 +1581,10 @@ class ImportedOntology(QtCore.QObject):
         self._objProps.add(iri)
         self._iris.add(iri)
 
+    def addObjectProperties(self, iris):
+        self._objProps.update(iris)
+        self._iris.update(iris)
+
     @property
     def dataProperties(self):
         return self._dataProps
@@ -1095,6 +1593,10 @@ class ImportedOntology(QtCore.QObject):
         self._dataProps.add(iri)
         self._iris.add(iri)
 
+    def addDataProperties(self, iris):
+        self._dataProps.update(iris)
+        self._iris.update(iris)
+
     @property
     def individuals(self):
         return self._individuals
@@ -1103,6 +1605,21 @@ class ImportedOntology(QtCore.QObject):
         self._individuals.add(iri)
         self._iris.add(iri)
 
+    def addIndividuals(self, iris):
+        self._individuals.update(iris)
+        self._iris.update(iris)
+
+    def addSignature(self, signature, manager):
+        """
+        Add the IRIs of the given signature, grouped by entity type, resolving them through the given manager.
+        :type signature: dict
+        :type manager: IRIManager
+        """
+        self.addClasses(manager.getIRIs(signature['classes'], imported=True))
+        self.addObjectProperties(manager.getIRIs(signature['objectProperties'], imported=True))
+        self.addDataProperties(manager.getIRIs(signature['dataProperties'], imported=True))
+        self.addIndividuals(manager.getIRIs(signature['individuals'], imported=True))
+
     def resetSignature(self):
         self._iris = set()
         self._classes = set()
@@ -1173,6 +1690,15 @@ class IRIManager(QtCore.QObject):
         super().__init__(parent)
         self.iris = set()
         self.stringToIRI = {}
+        self._namespaceTrie = StringTrie()
+        self._prefixedFormCache = {}
+        connect(self.sgnPrefixAdded, self.onPrefixMapChanged)
+        connect(self.sgnPrefixRemoved, self.onPrefixMapChanged)
+        connect(self.sgnPrefixModified, self.onPrefixMapChanged)
+        connect(self.sgnPrefixMapCleared, self.onPrefixMapChanged)
+        connect(self.sgnIRIManagerReset, self.onPrefixMapChanged)
+        connect(self.events.sgnIRIModified, self.onIRIModified)
+        self.renderer = IRILabelRenderer(self)
         if not prefixMap:
             self.prefix2namespaceMap = {}
             self.setDefaultPrefixes()
@@ -1232,6 +1758,29 @@ class IRIManager(QtCore.QObject):
         self.converttCamel = convertCamel
         self.converttSnake = convertSnake
 
+    #############################################
+    #   PROPERTIES
+    #################################
+
+    @property
+    def events(self):
+        """
+        Returns the event bus dispatching the change notifications of the IRIs of this `IRIManager`.
+        :rtype: EventBus
+        """
+        return EventBus.instance()
+
+    #############################################
+    #   SLOTS
+    #################################
+
+    @QtCore.pyqtSlot()
+    def onPrefixMapChanged(self):
+        """
+        Executed whenever the prefix map changes: invalidates the prefixed forms cache.
+        """
+        self._prefixedFormCache.clear()
+
     #############################################
     #   IMPORTED ONTOLOGIES
     #################################
@@ -1329,11 +1878,11 @@ class IRIManager(QtCore.QObject):
     #############################################
     #   SLOTS
     #################################
-    @QtCore.pyqtSlot(str)
-    def onIRIModified(self,oldIRIStr):
-        iri = self.sender()
-        self.stringToIRI.pop(oldIRIStr,None)
-        self.stringToIRI[str(iri)] = iri
+    @QtCore.pyqtSlot(object, str)
+    def onIRIModified(self, iri, oldIRIStr):
+        if iri.manager is self:
+            self.stringToIRI.pop(oldIRIStr,None)
+            self.stringToIRI[str(iri)] = iri
 
 
     @QtCore.pyqtSlot(ImportedOntology)
@@ -1400,7 +1949,7 @@ class IRIManager(QtCore.QObject):
                 self.addIRI(iri)
             return iri
         else:
-            iri = IRI(iriString, parent=self)
+            iri = IRI(iriString)
             iri.manager = self
             self.addIRI(iri, imported)
 
@@ -1423,10 +1972,30 @@ class IRIManager(QtCore.QObject):
                     annAss = AnnotationAssertion(iri, AnnotationAssertionProperty.Label.value, userInput,
                                                  OWL2Datatype.PlainLiteral.value, labelLang)
                     iri.addAnnotationAssertion(annAss)
-            connect(iri.sgnIRIModified,self.onIRIModified)
-            connect(self.sgnAnnotationPropertyRemoved, iri.onAnnotationPropertyRemoved)
             return iri
 
+    def getIRIs(self, iriStrings, imported=False):
+        """
+        Returns the list of IRI objects identified by the given strings, creating and adding to the index
+        the ones that do not exist yet. This is the bulk counterpart of getIRI, used when registering
+        the signature of an ontology, and never adds label annotations.
+        :type iriStrings: iterable
+        :type imported: bool
+        :rtype: list
+        """
+        iris = []
+        stringToIRI = self.stringToIRI
+        for iriString in iriStrings:
+            iri = stringToIRI.get(iriString)
+            if iri is None:
+                iri = IRI(iriString)
+                iri.manager = self
+                self.addIRI(iri, imported)
+            elif not (imported or iri in self.iris):
+                self.addIRI(iri)
+            iris.append(iri)
+        return iris
+
     def getLabelAnnotationFromSimpleName(self,iri,lang):
         """
         :type iri: IRI
@@ -1436,11 +2005,11 @@ class IRIManager(QtCore.QObject):
         annAss = AnnotationAssertion(iri,AnnotationAssertionProperty.Label.value,simpleName,OWL2Datatype.PlainLiteral.value,lang)
         return annAss
 
-    @QtCore.pyqtSlot(str)
-    def onIRIModified(self,oldIRIStr):
-        iri = self.sender()
-        self.stringToIRI.pop(oldIRIStr,None)
-        self.stringToIRI[str(iri)] = iri
+    @QtCore.pyqtSlot(object, str)
+    def onIRIModified(self, iri, oldIRIStr):
+        if iri.manager is self:
+            self.stringToIRI.pop(oldIRIStr,None)
+            self.stringToIRI[str(iri)] = iri
 
     def isValidIdentifier(self, iriStr):
         iri = IRI(iriStr)
@@ -1690,7 +2259,7 @@ class IRIManager(QtCore.QObject):
             suffix = prefixedIRI[idx + 1:]
             namespace = self.getPrefixResolution(prefix)
             if namespace:
-                return IRI(namespace, suffix, parent=self)
+                return IRI(namespace, suffix)
         return None
 
     def areSameIRI(self, iri, otherIRI):
@@ -1705,13 +2274,13 @@ class IRIManager(QtCore.QObject):
             if not iri.prefix in self.prefix2namespaceMap:
                 raise KeyError('Cannot find prefix {}'.format(iri.prefix))
             ns = self.prefix2namespaceMap[iri.prefix]
-            first = IRI(ns, suffix=iri.suffix, parent=self)
+            first = IRI.concat(ns, iri.suffix)
         second = otherIRI
         if isinstance(otherIRI, PrefixedIRI):
             if not otherIRI.prefix in self.prefix2namespaceMap:
                 raise KeyError('Cannot find prefix {}'.format(otherIRI.prefix))
             ns = self.prefix2namespaceMap[otherIRI.prefix]
-            second = IRI(ns, suffix=otherIRI.suffix, parent=self)
+            second = IRI.concat(ns, otherIRI.suffix)
         return str(first) == str(second)
 
     def isFromReservedVocabulary(self, iri):
@@ -1731,6 +2300,24 @@ class IRIManager(QtCore.QObject):
         return result
 
     ##Prefixes
+    @property
+    def prefix2namespaceMap(self):
+        """
+        Returns the prefix name to namespace associations of this `IRIManager`.
+        :rtype: dict
+        """
+        return self._prefix2namespaceMap
+
+    @prefix2namespaceMap.setter
+    def prefix2namespaceMap(self, prefixMap):
+        """
+        Replaces the prefix name to namespace associations of this `IRIManager`.
+        :type prefixMap: dict
+        """
+        self._prefix2namespaceMap = prefixMap
+        self._namespaceTrie = StringTrie((ns, prefix) for prefix, ns in prefixMap.items())
+        self._prefixedFormCache.clear()
+
     @property
     def ontologyPrefix(self):
         return self._ontologyPrefix
@@ -1757,17 +2344,11 @@ class IRIManager(QtCore.QObject):
 
     def getMatchingPrefixes(self, iri):
         """
-        Returns the prefix name for `namespace` if it exists, or `None` otherwise.
-        :type namespace: IRI
+        Returns the prefix names (and their namespaces) whose namespace is a prefix of `iri`.
+        :type iri: IRI|str
         :rtype: dict
         """
-        result = {}
-        if not isinstance(iri, IRI):
-            namespace = IRI(str(iri), parent=self)
-        for prefix, value in self.prefix2namespaceMap.items():
-            if str(namespace).startswith(value):
-                result[prefix] = value
-        return result
+        return {prefix: ns for ns, prefix in self._namespaceTrie.match(str(iri))}
 
     def getPrefixedForms(self, iri):
         """
@@ -1776,33 +2357,28 @@ class IRIManager(QtCore.QObject):
         :type iri: IRI
         :rtype: list
         """
-        result = list()
-        if not isinstance(iri, IRI):
-            iri = IRI(str(iri), parent=self)
-        matchingPrefixes = self.getMatchingPrefixes(iri._namespace)
-        if matchingPrefixes:
-            for prefix, ns in matchingPrefixes.items():
-                nsLength = len(ns)
-                suffix = str(iri)[nsLength:]
-                prefixed = PrefixedIRI(prefix, suffix, self)
-                result.append(prefixed)
-        return result
+        iri = str(iri)
+        return [PrefixedIRI(prefix, iri[len(ns):]) for ns, prefix in self._namespaceTrie.match(iri)]
 
     def getShortestPrefixedForm(self, iri):
         """
         Returns the prefixed form with shortest prefix+suffix for `iri`, or None if `iri` doesn't match any of the namespaces
-        managed by this `IRIManager`.
+        managed by this `IRIManager`. Results are cached until the prefix map changes.
         :type iri: IRI
         :rtype: PrefixedIRI
         """
-        matchingList = self.getPrefixedForms(iri)
-        result = None
-        minLength = -1
-        for prefixed in matchingList:
-            length = len(prefixed.prefix) + len(prefixed.suffix)
-            if minLength < 0 or length < minLength:
-                result = prefixed
-        return result
+        iri = str(iri)
+        try:
+            return self._prefixedFormCache[iri]
+        except KeyError:
+            result = None
+            matches = list(self._namespaceTrie.match(iri))
+            if matches:
+                # SHORTEST PREFIX+SUFFIX, THEN LONGEST NAMESPACE, THEN PREFIX NAME
+                ns, prefix = min(matches, key=lambda m: (len(m[1]) - len(m[0]), -len(m[0]), m[1]))
+                result = PrefixedIRI(prefix, iri[len(ns):])
+            self._prefixedFormCache[iri] = result
+            return result
 
     def getShortestPrefixPrefixedForm(self, iri):
         """
@@ -1900,9 +2476,12 @@ class IRIManager(QtCore.QObject):
         if not IRI.isValidNamespace(namespace):
             raise IllegalNamespaceError(namespace)
         if prefix in self.prefix2namespaceMap:
+            self._namespaceTrie.remove(self.prefix2namespaceMap[prefix], prefix)
+            self._namespaceTrie.add(namespace, prefix)
             self.prefix2namespaceMap[prefix] = namespace
             self.sgnPrefixModified.emit(prefix, namespace)
         else:
+            self._namespaceTrie.add(namespace, prefix)
             self.prefix2namespaceMap[prefix] = namespace
             self.sgnPrefixAdded.emit(prefix, namespace)
 
@@ -1927,6 +2506,7 @@ class IRIManager(QtCore.QObject):
         if self.ontologyPrefix==prefix:
             self.ontologyPrefix = None
         if ns:
+            self._namespaceTrie.remove(ns, prefix)
             self.sgnPrefixRemoved.emit(prefix)
         return ns
 
@@ -1947,6 +2527,7 @@ class IRIManager(QtCore.QObject):
         for prefix, ns in list(self.prefix2namespaceMap.items()):
             if ns == namespace:
                 del self.prefix2namespaceMap[prefix]
+                self._namespaceTrie.remove(ns, prefix)
                 self.sgnPrefixRemoved.emit(prefix)
 
     def __contains__(self, item):
@@ -2009,14 +2590,20 @@ class IRIRender(Enum_):
 
     @staticmethod
     def iriLabelString(iri):
+        if iri.manager:
+            return iri.manager.renderer.render(iri)
         settings = QtCore.QSettings()
         rendering = settings.value('ontology/iri/render', IRIRender.PREFIX.value)
+        return IRIRender.renderAs(iri, rendering)
+
+    @staticmethod
+    def renderAs(iri, rendering, lang=None):
         if rendering == IRIRender.FULL.value or rendering == IRIRender.FULL:
             return IRIRender.renderByFullIRI(iri)
         elif rendering == IRIRender.PREFIX.value or rendering == IRIRender.PREFIX:
             return IRIRender.renderByPrefixedIRI(iri)
         elif rendering == IRIRender.LABEL.value or rendering == IRIRender.LABEL:
-            return IRIRender.renderByLabel(iri)
+            return IRIRender.renderByLabel(iri, lang)
         elif rendering == IRIRender.SIMPLE_NAME.value or rendering == IRIRender.SIMPLE_NAME:
             return IRIRender.renderBySimpleName(iri)
 
@@ -2037,8 +2624,10 @@ class IRIRender(Enum_):
 
     @staticmethod
     def renderByLabel(iri, lang=None):
-        settings = QtCore.QSettings()
-        if not lang:
+        if not lang and iri.manager:
+            lang = iri.manager.renderer.language()
+        elif not lang:
+            settings = QtCore.QSettings()
             lang = settings.value('ontology/iri/render/language', 'it')
         labelAssertion = iri.getLabelAnnotationAssertion(lang)
         if labelAssertion:
@@ -2052,6 +2641,177 @@ class IRIRender(Enum_):
         return simple if simple else IRIRender.renderByPrefixedIRI(iri)
 
 
+class IRILabelRenderer(QtCore.QObject):
+    """
+    Extends QtCore.QObject providing the IRI label rendering service of an `IRIManager`.
+    The rendering mode and language are read from the settings only once and kept
+    in memory, while rendered labels are memoized per IRI and invalidated only for
+    the IRIs affected by annotation, IRI or prefix changes.
+    Labels invalidated by prefix changes are checked again in a single deferred batch,
+    emitting sgnLabelChanged only for the IRIs whose rendering actually changed.
+    """
+    sgnLabelChanged = QtCore.pyqtSignal(IRI)
+
+    def __init__(self, manager):
+        """
+        Initialize the renderer.
+        :type manager: IRIManager
+        """
+        super().__init__(manager)
+        settings = QtCore.QSettings()
+        self._rendering = settings.value('ontology/iri/render', IRIRender.PREFIX.value, str)
+        self._language = settings.value('ontology/iri/render/language', 'it', str)
+        self._cache = {}
+        self._pending = {}
+        self._timer = QtCore.QTimer(self)
+        self._timer.setInterval(0)
+        self._timer.setSingleShot(True)
+        connect(self._timer.timeout, self.doCheckPendingLabels)
+        connect(manager.sgnIRIRemoved, self.invalidate)
+        connect(manager.sgnIRIManagerReset, self.clear)
+        connect(manager.sgnPrefixAdded, self.onPrefixAdded)
+        connect(manager.sgnPrefixRemoved, self.onPrefixRemoved)
+        connect(manager.sgnPrefixModified, self.onPrefixModified)
+        connect(manager.sgnPrefixMapCleared, self.onPrefixMapCleared)
+
+    #############################################
+    #   SLOTS
+    #################################
+
+    @QtCore.pyqtSlot()
+    def doCheckPendingLabels(self):
+        """
+        Render again the labels invalidated by prefix changes, notifying the ones that changed.
+        """
+        pending, self._pending = self._pending, {}
+        for iri, label in pending.items():
+            if self.render(iri) != label:
+                self.sgnLabelChanged.emit(iri)
+
+    @QtCore.pyqtSlot(str, str)
+    def onPrefixAdded(self, _, namespace):
+        """
+        Executed when a prefix is added: invalidates the labels of IRIs in its namespace.
+        :type namespace: str
+        """
+        self.invalidateNamespace(namespace)
+
+    @QtCore.pyqtSlot(str, str)
+    def onPrefixModified(self, prefix, namespace):
+        """
+        Executed when a prefix is modified: invalidates the labels of IRIs
+        rendered using the prefix, and the ones in its new namespace.
+        :type prefix: str
+        :type namespace: str
+        """
+        self.invalidatePrefix(prefix)
+        self.invalidateNamespace(namespace)
+
+    @QtCore.pyqtSlot()
+    def onPrefixMapCleared(self):
+        """
+        Executed when the prefix map is cleared: invalidates all the labels.
+        """
+        self.invalidateAll(list(self._cache))
+
+    @QtCore.pyqtSlot(str)
+    def onPrefixRemoved(self, prefix):
+        """
+        Executed when a prefix is removed: invalidates the labels of IRIs rendered using the prefix.
+        :type prefix: str
+        """
+        self.invalidatePrefix(prefix)
+
+    #############################################
+    #   INTERFACE
+    #################################
+
+    @QtCore.pyqtSlot()
+    def clear(self):
+        """
+        Invalidates all the memoized labels.
+        """
+        self._cache.clear()
+        self._pending.clear()
+
+    @QtCore.pyqtSlot(IRI)
+    def invalidate(self, iri):
+        """
+        Invalidates the memoized label of the given IRI.
+        :type iri: IRI
+        """
+        self._cache.pop(iri, None)
+        self._pending.pop(iri, None)
+
+    def invalidateAll(self, iris):
+        """
+        Invalidates the memoized labels of the given IRIs, scheduling a deferred
+        check of their rendering (see `doCheckPendingLabels`).
+        :type iris: list
+        """
+        for iri in iris:
+            _, label = self._cache.pop(iri)
+            self._pending.setdefault(iri, label)
+        if self._pending:
+            self._timer.start()
+
+    def invalidateNamespace(self, namespace):
+        """
+        Invalidates the memoized labels of the IRIs belonging to the given namespace.
+        :type namespace: str
+        """
+        self.invalidateAll([k for k, v in self._cache.items() if v[0].startswith(namespace)])
+
+    def invalidatePrefix(self, prefix):
+        """
+        Invalidates the memoized labels rendered using the given prefix.
+        :type prefix: str
+        """
+        pattern = '{}:'.format(prefix)
+        self.invalidateAll([k for k, v in self._cache.items() if v[1].startswith(pattern)])
+
+    def language(self):
+        """
+        Returns the language used to render labels.
+        :rtype: str
+        """
+        return self._language
+
+    def render(self, iri):
+        """
+        Returns the label of the given IRI according to the current rendering mode.
+        :type iri: IRI
+        :rtype: str
+        """
+        try:
+            return self._cache[iri][1]
+        except KeyError:
+            label = IRIRender.renderAs(iri, self._rendering, self._language)
+            self._cache[iri] = (str(iri), label)
+            return label
+
+    def rendering(self):
+        """
+        Returns the current rendering mode.
+        :rtype: str
+        """
+        return self._rendering
+
+    def setRendering(self, rendering, language=None):
+        """
+        Set the rendering mode (and language for label rendering), persisting it in the settings.
+        :type rendering: str
+        :type language: str
+        """
+        settings = QtCore.QSettings()
+        settings.setValue('ontology/iri/render', rendering)
+        self._rendering = rendering
+        if language:
+            settings.setValue('ontology/iri/render/language', language)
+            self._language = language
+        self.clear()
+
+
 @unique
 class OWL2Profiles(Enum_):
     """
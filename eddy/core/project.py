@@ -34,9 +34,12 @@
 
 from __future__ import annotations
 
+from collections import Counter
+from itertools import chain
 from typing import (
     cast,
     Any,
+    Iterable,
     Optional,
     Set,
     TYPE_CHECKING,
@@ -105,12 +108,20 @@ K_DATATYPE_OCCURRENCES = 'datatype_occurrences'
 K_OBJ_PROP_OCCURRENCES = 'obj_prop_occurrences'
 K_DATA_PROP_OCCURRENCES = 'data_prop_occurrences'
 K_INDIVIDUAL_OCCURRENCES = 'individual_occurrences'
+K_DIAGRAM_OCCURRENCES = 'diagram_occurrences'
 
 K_IRI_CLASS = 'IRI_CLASS'
 K_IRI_OBJ_PROP = 'IRI_OBJ_PROP'
 K_IRI_DATA_PROP = 'IRI_DATA_PROP'
 K_IRI_INDIVIDUAL = 'IRI_INDIVIDUAL'
 K_IRI_DATATYPE = "IRI_DATATYPE"
+K_IRI_OCCURRENCES = {
+    K_IRI_CLASS: K_CLASS_OCCURRENCES,
+    K_IRI_DATATYPE: K_DATATYPE_OCCURRENCES,
+    K_IRI_OBJ_PROP: K_OBJ_PROP_OCCURRENCES,
+    K_IRI_DATA_PROP: K_DATA_PROP_OCCURRENCES,
+    K_IRI_INDIVIDUAL: K_INDIVIDUAL_OCCURRENCES,
+}
 #TODO END ADDED
 
 # PROJECT MERGE
@@ -133,6 +144,7 @@ class Project(IRIManager):
     * sgnDiagramRemoved: whenever a Diagram is removed from the Project.
     * sgnItemAdded: whenever an item is added to the Project.
     * sgnItemRemoved: whenever an item is removed from the Project.
+    * sgnItemUpdated: whenever the IRI (or IRI data) of a predicate node in the Project changes.
     * sgnMetaAdded: whenever predicate metadata are added to the Project.
     * sgnMetaRemoved: whenever predicate metadata are removed from the Project.
     * sgnUpdated: whenever the Project is updated in any of its parts.
@@ -141,6 +153,7 @@ class Project(IRIManager):
     sgnDiagramRemoved = QtCore.pyqtSignal(QtWidgets.QGraphicsScene)
     sgnItemAdded = QtCore.pyqtSignal(QtWidgets.QGraphicsScene, QtWidgets.QGraphicsItem)
     sgnItemRemoved = QtCore.pyqtSignal(QtWidgets.QGraphicsScene, QtWidgets.QGraphicsItem)
+    sgnItemUpdated = QtCore.pyqtSignal(QtWidgets.QGraphicsScene, QtWidgets.QGraphicsItem)
     sgnUpdated = QtCore.pyqtSignal()
 
     sgnIRIRemovedFromAllDiagrams = QtCore.pyqtSignal(IRI)
@@ -148,6 +161,8 @@ class Project(IRIManager):
     sgnIRIChanged = QtCore.pyqtSignal(QtWidgets.QGraphicsItem, IRI)
     sgnIRIRefactor = QtCore.pyqtSignal(IRI, IRI)
 
+    RenderBudget = 0.02
+
     def __init__(
         self,
         name: str = None,
@@ -173,6 +188,12 @@ class Project(IRIManager):
         connect(self.sgnIRIRemovedFromAllDiagrams,self.onIRIRemovedFromAllDiagrams)
         connect(self.sgnIRIChanged, self.doSingleSwitchIRI)
         connect(self.sgnIRIRefactor, self.doSwitchIRI)
+        connect(self.renderer.sgnLabelChanged, self.doUpdateNodeLabels)
+
+        self.renderTimer = QtCore.QTimer(self)
+        self.renderTimer.setInterval(0)
+        self.renderTimer.setSingleShot(True)
+        connect(self.renderTimer.timeout, self.doRenderPendingDiagrams)
 
     #############################################
     #   PROPERTIES
@@ -226,6 +247,13 @@ class Project(IRIManager):
         """
         return self.index.edges(diagram)
 
+    def edgeCount(self, diagram: Diagram = None) -> int:
+        """
+        Returns the number of edges in the given diagram.
+        If no diagram is supplied, the counting is extended to the whole Project.
+        """
+        return self.index.edgeCount(diagram)
+
     def isEmpty(self) -> bool:
         """
         Returns True if the Project contains no element, False otherwise.
@@ -245,6 +273,13 @@ class Project(IRIManager):
         """
         return self.index.itemNum(item, diagram)
 
+    def itemCount(self, diagram: Diagram = None) -> int:
+        """
+        Returns the number of items in the given diagram.
+        If no diagram is supplied, the counting is extended to the whole Project.
+        """
+        return self.index.itemCount(diagram)
+
     def items(self, diagram: Diagram = None) -> Set[AbstractItem]:
         """
         Returns a collection with all the items in the given diagram.
@@ -252,6 +287,27 @@ class Project(IRIManager):
         """
         return self.index.items(diagram)
 
+    def iterEdges(self, diagram: Diagram = None) -> Iterable[AbstractEdge]:
+        """
+        Returns an iterator over the edges in the given diagram (or in the whole Project),
+        without copying them. The Project must not be modified during the iteration.
+        """
+        return self.index.iterEdges(diagram)
+
+    def iterItems(self, diagram: Diagram = None) -> Iterable[AbstractItem]:
+        """
+        Returns an iterator over the items in the given diagram (or in the whole Project),
+        without copying them. The Project must not be modified during the iteration.
+        """
+        return self.index.iterItems(diagram)
+
+    def iterNodes(self, diagram: Diagram = None) -> Iterable[AbstractNode]:
+        """
+        Returns an iterator over the nodes in the given diagram (or in the whole Project),
+        without copying them. The Project must not be modified during the iteration.
+        """
+        return self.index.iterNodes(diagram)
+
     def node(self, diagram: Diagram, nid: str) -> Optional[AbstractNode]:
         """
         Returns the node matching the given id or None if no node is found.
@@ -265,17 +321,19 @@ class Project(IRIManager):
         """
         return self.index.nodes(diagram)
 
-    '''
-    def predicateNum(self, item, diagram=None):
+    def nodeCount(self, diagram: Diagram = None) -> int:
+        """
+        Returns the number of nodes in the given diagram.
+        If no diagram is supplied, the counting is extended to the whole Project.
+        """
+        return self.index.nodeCount(diagram)
+
+    def predicateNum(self, item: Item, diagram: Diagram = None) -> int:
         """
         Returns the number of predicates of the given type which are defined in the given diagram.
         If no diagram is supplied, the counting is extended to the whole Project.
-        :type item: Item
-        :type diagram: Diagram
-        :rtype: int
         """
         return self.index.predicateNum(item, diagram)
-    '''
 
     def iriOccurrences(
         self,
@@ -313,6 +371,15 @@ class Project(IRIManager):
             self.sgnDiagramRemoved.emit(diagram)
             self.sgnUpdated.emit()
 
+    def scheduleRender(self) -> None:
+        """
+        Defer the rendering of all the diagrams in the Project. Each diagram is rendered
+        as soon as it is displayed or exported, and in the background during idle time.
+        """
+        for diagram in self.diagrams():
+            diagram.scheduleRender()
+        self.renderTimer.start()
+
     #############################################
     #   IRI
     #################################
@@ -320,6 +387,9 @@ class Project(IRIManager):
     def isDLCompliant(self) -> bool:
         return self.index.isDLCompliant()
 
+    def nonDLCompliantIRIs(self) -> Set[IRI]:
+        return self.index.nonDLCompliantIRIs()
+
     def itemIRIs(self,item, diagram=None) -> Set[IRI]:
         return self.index.itemIRIs(item, diagram)
 
@@ -370,6 +440,30 @@ class Project(IRIManager):
         else:
             self.sgnSingleNodeSwitchIRI.emit(node, oldIri)
 
+    @QtCore.pyqtSlot()
+    def doRenderPendingDiagrams(self) -> None:
+        """
+        Executed when the event loop is idle and some diagram rendering has been deferred.
+        This slot will render items for at most RenderBudget seconds before yielding.
+        """
+        if not self.session.isVisible():
+            # THE SESSION HAS BEEN CLOSED: ITEMS LEFT ARE RENDERED IF DISPLAYED OR EXPORTED
+            return
+        pending =[d for d in self.diagrams() if d.hasPendingRender()]
+        if pending:
+            pending[0].renderPendingItems(budget=Project.RenderBudget)
+            if len(pending) > 1 or pending[0].hasPendingRender():
+                self.renderTimer.start()
+
+    @QtCore.pyqtSlot(IRI)
+    def doUpdateNodeLabels(self, iri: IRI) -> None:
+        """
+        Executed whenever the rendered label of the given IRI changes.
+        This slot will update the label of all the nodes identified by the IRI.
+        """
+        for node in self.iriOccurrences(iri=iri):
+            node.doUpdateNodeLabel()
+
 
 class ProjectIndex(dict):
     """
@@ -386,6 +480,7 @@ class ProjectIndex(dict):
         self[K_ITEMS] = dict()
         self[K_NODE] = dict()
         self[K_TYPE] = dict()
+        self.counts = Counter()
         self.project = project
 
     def addDiagram(self, diagram):
@@ -444,15 +539,19 @@ class ProjectIndex(dict):
                 self[K_TYPE][diagram.name] = dict()
             if i not in self[K_TYPE][diagram.name]:
                 self[K_TYPE][diagram.name][i] = set()
-            self[K_TYPE][diagram.name][i] |= {item}
+            self[K_TYPE][diagram.name][i].add(item)
+            self.counts[K_ITEMS] += 1
+            self.counts[i] += 1
             if item.isNode():
                 if diagram.name not in self[K_NODE]:
                     self[K_NODE][diagram.name] = dict()
                 self[K_NODE][diagram.name][item.id] = item
+                self.counts[K_NODE] += 1
             if item.isEdge():
                 if diagram.name not in self[K_EDGE]:
                     self[K_EDGE][diagram.name] = dict()
                 self[K_EDGE][diagram.name][item.id] = item
+                self.counts[K_EDGE] += 1
             return True
         return False
 
@@ -475,22 +574,25 @@ class ProjectIndex(dict):
         :type diagram: Diagram
         :rtype: set
         """
-        try:
-            if not diagram:
-                return set.union(*(set(self[K_EDGE][i].values()) for i in self[K_EDGE]))
-            return set(self[K_EDGE][diagram.name].values())
-        except (KeyError, TypeError):
-            return set()
+        return set(self.iterEdges(diagram))
+
+    def edgeCount(self, diagram=None):
+        """
+        Returns the number of edges in the given diagram.
+        If no diagram is supplied, the counting is extended to the whole Project Index.
+        :type diagram: Diagram
+        :rtype: int
+        """
+        if not diagram:
+            return self.counts[K_EDGE]
+        return len(self[K_EDGE].get(diagram.name, ()))
 
     def isEmpty(self):
         """
         Returns True if the Project Index contains no element, False otherwise.
         :rtype: bool
         """
-        for i in self[K_ITEMS]:
-            for _ in self[K_ITEMS][i]:
-                return False
-        return True
+        return self.counts[K_ITEMS] == 0
 
     def item(self, diagram, iid):
         """
@@ -512,14 +614,24 @@ class ProjectIndex(dict):
         :type diagram: Diagram
         :rtype: int
         """
+        if not diagram:
+            return self.counts[item]
         try:
-            subdict = self[K_TYPE]
-            if not diagram:
-                return len(set.union(*(subdict[i][item] for i in subdict if item in subdict[i])))
-            return len(subdict[diagram.name][item])
-        except (KeyError, TypeError):
+            return len(self[K_TYPE][diagram.name][item])
+        except KeyError:
             return 0
 
+    def itemCount(self, diagram=None):
+        """
+        Returns the number of items in the given diagram.
+        If no diagram is supplied, the counting is extended to the whole Project Index.
+        :type diagram: Diagram
+        :rtype: int
+        """
+        if not diagram:
+            return self.counts[K_ITEMS]
+        return len(self[K_ITEMS].get(diagram.name, ()))
+
     def items(self, diagram=None):
         """
         Returns a collection with all the items in the given diagram.
@@ -527,12 +639,48 @@ class ProjectIndex(dict):
         :type diagram: Diagram
         :rtype: set
         """
-        try:
-            if not diagram:
-                return set.union(*(set(self[K_ITEMS][i].values()) for i in self[K_ITEMS]))
-            return set(self[K_ITEMS][diagram.name].values())
-        except (KeyError, TypeError):
-            return set()
+        return set(self.iterItems(diagram))
+
+    def iterEdges(self, diagram=None):
+        """
+        Returns an iterator over the edges in the given diagram, without copying them.
+        If no diagram is supplied the iteration is extended to the whole Project Index.
+        The index must not be modified while the iteration is in progress.
+        :type diagram: Diagram
+        :rtype: iterable
+        """
+        return self.iterSection(K_EDGE, diagram)
+
+    def iterItems(self, diagram=None):
+        """
+        Returns an iterator over the items in the given diagram, without copying them.
+        If no diagram is supplied the iteration is extended to the whole Project Index.
+        The index must not be modified while the iteration is in progress.
+        :type diagram: Diagram
+        :rtype: iterable
+        """
+        return self.iterSection(K_ITEMS, diagram)
+
+    def iterNodes(self, diagram=None):
+        """
+        Returns an iterator over the nodes in the given diagram, without copying them.
+        If no diagram is supplied the iteration is extended to the whole Project Index.
+        The index must not be modified while the iteration is in progress.
+        :type diagram: Diagram
+        :rtype: iterable
+        """
+        return self.iterSection(K_NODE, diagram)
+
+    def iterSection(self, key, diagram=None):
+        """
+        Returns an iterator over the items stored in the given section of the index.
+        :type key: str
+        :type diagram: Diagram
+        :rtype: iterable
+        """
+        if not diagram:
+            return chain.from_iterable(x.values() for x in self[key].values())
+        return iter(self[key].get(diagram.name, {}).values())
 
     def node(self, diagram, nid):
         """
@@ -542,7 +690,7 @@ class ProjectIndex(dict):
         :rtype: AbstractNode
         """
         try:
-            return self[K_EDGE][diagram.name][nid]
+            return self[K_NODE][diagram.name][nid]
         except KeyError:
             return None
 
@@ -553,12 +701,18 @@ class ProjectIndex(dict):
         :type diagram: Diagram
         :rtype: set
         """
-        try:
-            if not diagram:
-                return set.union(*(set(self[K_NODE][i].values()) for i in self[K_NODE]))
-            return set(self[K_NODE][diagram.name].values())
-        except (KeyError, TypeError):
-            return set()
+        return set(self.iterNodes(diagram))
+
+    def nodeCount(self, diagram=None):
+        """
+        Returns the number of nodes in the given diagram.
+        If no diagram is supplied, the counting is extended to the whole Project Index.
+        :type diagram: Diagram
+        :rtype: int
+        """
+        if not diagram:
+            return self.counts[K_NODE]
+        return len(self[K_NODE].get(diagram.name, ()))
 
     def removeItem(self, diagram, item):
         """
@@ -571,11 +725,13 @@ class ProjectIndex(dict):
         if diagram.name in self[K_ITEMS]:
             if item.id in self[K_ITEMS][diagram.name]:
                 del self[K_ITEMS][diagram.name][item.id]
+                self.counts[K_ITEMS] -= 1
                 if not self[K_ITEMS][diagram.name]:
                     del self[K_ITEMS][diagram.name]
             if diagram.name in self[K_TYPE]:
-                if i in self[K_TYPE][diagram.name]:
-                    self[K_TYPE][diagram.name][i] -= {item}
+                if item in self[K_TYPE][diagram.name].get(i, ()):
+                    self[K_TYPE][diagram.name][i].discard(item)
+                    self.counts[i] -= 1
                     if not self[K_TYPE][diagram.name][i]:
                         del self[K_TYPE][diagram.name][i]
                         if not self[K_TYPE][diagram.name]:
@@ -584,12 +740,14 @@ class ProjectIndex(dict):
                 if diagram.name in self[K_NODE]:
                     if item.id in self[K_NODE][diagram.name]:
                         del self[K_NODE][diagram.name][item.id]
+                        self.counts[K_NODE] -= 1
                         if not self[K_NODE][diagram.name]:
                             del self[K_NODE][diagram.name]
             if item.isEdge():
                 if diagram.name in self[K_EDGE]:
                     if item.id in self[K_EDGE][diagram.name]:
                         del self[K_EDGE][diagram.name][item.id]
+                        self.counts[K_EDGE] -= 1
                         if not self[K_EDGE][diagram.name]:
                             del self[K_EDGE][diagram.name]
             return True
@@ -611,6 +769,10 @@ class ProjectIRIIndex(ProjectIndex):
         self[K_OBJ_PROP_OCCURRENCES] = dict()
         self[K_DATA_PROP_OCCURRENCES] = dict()
         self[K_INDIVIDUAL_OCCURRENCES] = dict()
+        self[K_DIAGRAM_OCCURRENCES] = {k: dict() for k in (
+            K_OCCURRENCES, K_CLASS_OCCURRENCES, K_DATATYPE_OCCURRENCES,
+            K_OBJ_PROP_OCCURRENCES, K_DATA_PROP_OCCURRENCES, K_INDIVIDUAL_OCCURRENCES,
+        )}
 
         self[K_IRI_CLASS] = dict()
         self[K_IRI_OBJ_PROP] = dict()
@@ -739,6 +901,7 @@ class ProjectIRIIndex(ProjectIndex):
             currSet.add(node)
             currDict[diagram.name] = currSet
             self[K_OCCURRENCES][iri] = currDict
+        self.addDiagramOccurrence(diagram, node, K_OCCURRENCES)
 
         '''
         if diagram.name in self[K_NODE]:
@@ -789,6 +952,7 @@ class ProjectIRIIndex(ProjectIndex):
             currSet.add(node)
             currDict[diagram.name] = currSet
             self[k_metatype][iri] = currDict
+        self.addDiagramOccurrence(diagram, node, k_metatype)
 
         if diagram.name in self[k_iri_metatype]:
             self[k_iri_metatype][diagram.name].add(iri)
@@ -832,6 +996,7 @@ class ProjectIRIIndex(ProjectIndex):
         if iri in self[K_OCCURRENCES]:
             if diagram.name in self[K_OCCURRENCES][iri]:
                 self[K_OCCURRENCES][iri][diagram.name].remove(node)
+                self.removeDiagramOccurrence(diagram, node, K_OCCURRENCES)
                 if not self[K_OCCURRENCES][iri][diagram.name]:
                     self[K_OCCURRENCES][iri].pop(diagram.name)
                     if not self[K_OCCURRENCES][iri]:
@@ -839,6 +1004,28 @@ class ProjectIRIIndex(ProjectIndex):
                         return True
         return False
 
+    def addDiagramOccurrence(self, diagram, node, k_metatype):
+        """
+        Add node to the view of the occurrences of type k_metatype in diagram.
+        :type diagram: Diagram
+        :type node: PredicateNodeMixin
+        :type k_metatype: str
+        """
+        self[K_DIAGRAM_OCCURRENCES][k_metatype].setdefault(diagram.name, set()).add(node)
+
+    def removeDiagramOccurrence(self, diagram, node, k_metatype):
+        """
+        Remove node from the view of the occurrences of type k_metatype in diagram.
+        :type diagram: Diagram
+        :type node: PredicateNodeMixin
+        :type k_metatype: str
+        """
+        view = self[K_DIAGRAM_OCCURRENCES][k_metatype]
+        if diagram.name in view:
+            view[diagram.name].discard(node)
+            if not view[diagram.name]:
+                del view[diagram.name]
+
     def removeTypedIRIOccurenceFromDiagram(self, diagram, node, k_metatype, k_iri_metatype):
         """
         Remove node as typed occurrence of node.iri in diagram
@@ -850,6 +1037,7 @@ class ProjectIRIIndex(ProjectIndex):
         if iri in self[k_metatype]:
             if diagram.name in self[k_metatype][iri]:
                 self[k_metatype][iri][diagram.name].remove(node)
+                self.removeDiagramOccurrence(diagram, node, k_metatype)
                 if not self[k_metatype][iri][diagram.name]:
                     self[k_metatype][iri].pop(diagram.name)
                     if node.iri in self[k_iri_metatype][diagram.name]:
@@ -881,15 +1069,38 @@ class ProjectIRIIndex(ProjectIndex):
             elif item is Item.ValueDomainNode:
                 k_metatype = K_IRI_DATATYPE
             if not diagram:
-                result = set()
-                for diag,diagSet in self[k_metatype].items():
-                    result = result|diagSet
-                return result
+                return set(self[K_IRI_OCCURRENCES[k_metatype]])
             else:
                 return self[k_metatype][diagram.name]
         except (KeyError, TypeError):
             return set()
 
+    def predicateNum(self, item, diagram=None):
+        """
+        Returns the number of IRIs occurring as item in the given diagram.
+        If no diagram is supplied, the counting is extended to the whole Project Index.
+        :type item: Item
+        :type diagram: Diagram
+        :rtype: int
+        """
+        if not diagram:
+            k_metatype = {
+                Item.ConceptNode: K_CLASS_OCCURRENCES,
+                Item.RoleNode: K_OBJ_PROP_OCCURRENCES,
+                Item.AttributeNode: K_DATA_PROP_OCCURRENCES,
+                Item.IndividualNode: K_INDIVIDUAL_OCCURRENCES,
+                Item.ValueDomainNode: K_DATATYPE_OCCURRENCES,
+            }.get(item)
+            return len(self[k_metatype]) if k_metatype else 0
+        k_metatype = {
+            Item.ConceptNode: K_IRI_CLASS,
+            Item.RoleNode: K_IRI_OBJ_PROP,
+            Item.AttributeNode: K_IRI_DATA_PROP,
+            Item.IndividualNode: K_IRI_INDIVIDUAL,
+            Item.ValueDomainNode: K_IRI_DATATYPE,
+        }.get(item)
+        return len(self[k_metatype].get(diagram.name, ())) if k_metatype else 0
+
     def iriOccurrences(self,item=None, iri=None,diagram=None):
         """
         Returns a collection of nodes of type k_metatype identified by the given IRI belonging to the given diagram.
@@ -912,18 +1123,17 @@ class ProjectIRIIndex(ProjectIndex):
                     k_metatype = K_DATA_PROP_OCCURRENCES
                 elif item is Item.IndividualNode:
                     k_metatype = K_INDIVIDUAL_OCCURRENCES
+                elif item is Item.ValueDomainNode:
+                    k_metatype = K_DATATYPE_OCCURRENCES
             if not k_metatype:
                 k_metatype = K_OCCURRENCES
             result = set()
             if not iri:
+                view = self[K_DIAGRAM_OCCURRENCES][k_metatype]
                 if not diagram:
-                    for occIRI in self[k_metatype]:
-                        for diag in self[k_metatype][occIRI]:
-                            result.update(self[k_metatype][occIRI][diag])
+                    result.update(*view.values())
                 else:
-                    for occIRI in self[k_metatype]:
-                        if diagram.name in self[k_metatype][occIRI]:
-                            result.update(self[k_metatype][occIRI][diagram.name])
+                    result.update(view.get(diagram.name, ()))
             else:
                 if not diagram:
                     if iri in self[k_metatype]:
@@ -973,29 +1183,30 @@ class ProjectIRIIndex(ProjectIndex):
             return False
 
     def isDLCompliant(self):
-        objPropNodes = self.iriOccurrences(item=Item.RoleNode)
-        dataPropNodes = self.iriOccurrences(item=Item.AttributeNode)
-        for objPropNode in objPropNodes:
-            objPropIri = objPropNode.iri
-            if not (objPropIri.isTopObjectProperty or objPropIri.isBottomObjectProperty) and self.project.isFromReservedVocabulary(objPropIri):
-                return False
-            for dataPropNode in dataPropNodes:
-                dataPropIri = dataPropNode.iri
-                if not (dataPropIri.isTopDataProperty or dataPropIri.isBottomDataProperty) and self.project.isFromReservedVocabulary(dataPropIri):
-                    return False
-                if dataPropIri==objPropIri:
-                    return False
-
-        classNodes = self.iriOccurrences(item=Item.ConceptNode)
-        datatypeNodes = self.iriOccurrences(item=Item.ValueDomainNode)
-        for classNode in classNodes:
-            classIri = classNode.iri
-            if not (classIri.isOwlThing or classIri.isOwlNothing) and self.project.isFromReservedVocabulary(classIri):
-                return False
-            for datatypeNode in datatypeNodes:
-                if datatypeNode.iri == classIri:
-                    return False
-        return True
+        """
+        Returns True if the IRIs occurring in the Project satisfy the OWL 2 DL typing constraints.
+        :rtype: bool
+        """
+        return not self.nonDLCompliantIRIs()
+
+    def nonDLCompliantIRIs(self):
+        """
+        Returns the IRIs violating the OWL 2 DL typing constraints, i.e. IRIs used both as object
+        and data property, IRIs used both as class and datatype, and IRIs from the reserved vocabulary
+        used as class or property (other than the top and bottom entities).
+        The check runs over the distinct IRIs of each type rather than over their occurrences.
+        :rtype: set
+        """
+        classes = self[K_CLASS_OCCURRENCES].keys()
+        objProps = self[K_OBJ_PROP_OCCURRENCES].keys()
+        dataProps = self[K_DATA_PROP_OCCURRENCES].keys()
+        datatypes = self[K_DATATYPE_OCCURRENCES].keys()
+        result = (objProps & dataProps) | (classes & datatypes)
+        isReserved = self.project.isFromReservedVocabulary
+        result.update(iri for iri in classes if isReserved(iri) and not (iri.isOwlThing() or iri.isOwlNothing()))
+        result.update(iri for iri in objProps if isReserved(iri) and not (iri.isTopObjectProperty() or iri.isBottomObjectProperty()))
+        result.update(iri for iri in dataProps if isReserved(iri) and not (iri.isTopDataProperty() or iri.isBottomDataProperty()))
+        return result
 
 
 class ProjectNotFoundError(RuntimeError):
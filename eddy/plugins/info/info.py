@@ -804,10 +804,10 @@ class ProjectInfo(AbstractInfo):
         #         self.profileField.setCurrentIndex(i)
         #         break
 
-        self.attributesField.setValue(len(project.itemIRIs(Item.AttributeNode)))
-        self.conceptsField.setValue(len(project.itemIRIs(Item.ConceptNode)))
-        self.rolesField.setValue(len(project.itemIRIs(Item.RoleNode)))
-        self.individualsField.setValue(len(project.itemIRIs(Item.IndividualNode)))
+        self.attributesField.setValue(project.predicateNum(Item.AttributeNode))
+        self.conceptsField.setValue(project.predicateNum(Item.ConceptNode))
+        self.rolesField.setValue(project.predicateNum(Item.RoleNode))
+        self.individualsField.setValue(project.predicateNum(Item.IndividualNode))
         # self.inclusionsField.setValue(project.itemNum(Item.InclusionEdge))
         # self.membershipField.setValue(project.itemNum(Item.MembershipEdge))
 
@@ -49,6 +49,7 @@ from eddy.core.items.nodes.common.base import (
 )
 from eddy.core.owl import (
     AnnotationAssertion,
+    EventBus,
     ImportedOntology,
     IRI,
     IRIRender,
@@ -93,7 +94,7 @@ class OntologyExplorerPlugin(AbstractPlugin):
         for impOnt in self.project.importedOntologies:
             self.sgnFakeImportedOntologyAdded.emit(impOnt)
         connect(self.sgnFakeItemAdded, widget.doAddNode)
-        for node in self.project.nodes():
+        for node in self.project.iterNodes():
             self.sgnFakeItemAdded.emit(node.diagram, node)
         widget.doFilterItem('')
         disconnect(self.sgnFakeItemAdded, widget.doAddNode)
@@ -331,43 +332,40 @@ class OntologyExplorerWidget(QtWidgets.QWidget):
 
     @QtCore.pyqtSlot(str, str)
     def onPrefixAdded(self, _prefix: str, _ns: str):
-        settings = QtCore.QSettings()
-        rendering = settings.value('ontology/iri/render', IRIRender.PREFIX.value, str)
+        rendering = self.project.renderer.rendering()
         if rendering == IRIRender.PREFIX.value or rendering == IRIRender.LABEL.value:
             self.redrawIRIItem()
 
     @QtCore.pyqtSlot(str)
     def onPrefixRemoved(self, _: str):
-        settings = QtCore.QSettings()
-        rendering = settings.value('ontology/iri/render', IRIRender.PREFIX.value, str)
+        rendering = self.project.renderer.rendering()
         if rendering == IRIRender.PREFIX.value or rendering == IRIRender.LABEL.value:
             self.redrawIRIItem()
 
     @QtCore.pyqtSlot(str)
     def onPrefixModified(self, _: str):
-        settings = QtCore.QSettings()
-        rendering = settings.value('ontology/iri/render', IRIRender.PREFIX.value, str)
+        rendering = self.project.renderer.rendering()
         if rendering == IRIRender.PREFIX.value or rendering == IRIRender.LABEL.value:
             self.redrawIRIItem()
 
     @QtCore.pyqtSlot(str)
     def onIRIModified(self, _: str):
-        iri = self.sender()
+        iri = EventBus.instance().source()
         self.redrawIRIItem(iri)
 
     @QtCore.pyqtSlot(AnnotationAssertion)
     def onIRIAnnotationAssertionAdded(self, _):
-        iri = self.sender()
+        iri = EventBus.instance().source()
         self.redrawIRIItem(iri)
 
     @QtCore.pyqtSlot(AnnotationAssertion)
     def onIRIAnnotationAssertionRemoved(self, _):
-        iri = self.sender()
+        iri = EventBus.instance().source()
         self.redrawIRIItem(iri)
 
     @QtCore.pyqtSlot(AnnotationAssertion)
     def onIRIAnnotationAssertionModified(self, _):
-        iri = self.sender()
+        iri = EventBus.instance().source()
         self.redrawIRIItem(iri)
 
     @QtCore.pyqtSlot()
@@ -4,7 +4,7 @@ from PyQt5 import QtWidgets
 
 from eddy.core.common import HasWidgetSystem, HasThreadingSystem
 from eddy.core.datatypes.owl import OWLAxiom
-from eddy.core.exporters.owl2 import OWLOntologyExporterWorker
+from eddy.core.exporters.owl2 import getOWLOntologyMirror
 from eddy.core.functions.signals import connect
 from eddy.core.jvm import getJavaVM
 from eddy.core.output import getLogger
@@ -869,46 +869,21 @@ class AxiomsByEntityWorker(AbstractWorker):
         self.vm.attachThreadToJVM()
         self.IRIClass = self.vm.getJavaClass('org.semanticweb.owlapi.model.IRI')
         self.OWLManagerClass = self.vm.getJavaClass('org.semanticweb.owlapi.apibinding.OWLManager')
-        self.IRIMapperClass = self.vm.getJavaClass('org.semanticweb.owlapi.util.SimpleIRIMapper')
         self.OWLClassClass = self.vm.getJavaClass('org.semanticweb.owlapi.model.OWLClass')
         self.OWLImportsEnum = self.vm.getJavaClass('org.semanticweb.owlapi.model.parameters.Imports')
+        self.mirror = getOWLOntologyMirror(project)
         self.df = None
 
-    def loadImportedOntologiesIntoManager(self):
-        LOGGER.debug('Loading declared imports into the OWL 2 Manager')
-        self.status_bar.showMessage('Loading declared imports into the OWL 2 Manager')
-        for impOnt in self.project.importedOntologies:
-            try:
-                docObj = None
-                if impOnt.isLocalDocument:
-                    docObj = self.JavaFileClass(impOnt.docLocation)
-                else:
-                    docObj = self.URIClass(impOnt.docLocation)
-                docLocationIRI = self.IRIClass.create(docObj)
-                impOntIRI = self.IRIClass.create(impOnt.ontologyIRI)
-                iriMapper = self.IRIMapperClass(impOntIRI, docLocationIRI)
-                self.manager.getIRIMappers().add(iriMapper)
-                loaded = self.manager.loadOntology(impOntIRI)
-            except Exception as e:
-                LOGGER.exception(
-                    'The imported ontology <{}> cannot be loaded.\nError:{}'.format(impOnt, str(e)))
-            else:
-                LOGGER.debug('Ontology ({}) correctly loaded.'.format(impOnt))
-                self.status_bar.showMessage('Ontology ({}) correctly loaded.'.format(impOnt))
-
     def initializeOWLManager(self, ontology):
         self.status_bar.showMessage('Initializing the OWL 2 Manager')
         self.manager = ontology.getOWLOntologyManager()
         self.df = self.manager.getOWLDataFactory()
-        #self.loadImportedOntologiesIntoManager()
         self.status_bar.showMessage('OWL 2 Manager initialized')
 
     def initializeOWLOntology(self):
         self.status_bar.showMessage('Fetching the OWL 2 ontology')
-        worker = OWLOntologyExporterWorker(self.project, axioms={axiom for axiom in OWLAxiom})
-        worker.run()
+        self.ontology = self.mirror.getOntology()
         self.status_bar.showMessage('OWL 2 ontology fetched')
-        self.ontology = worker.ontology
         self.initializeOWLManager(self.ontology)
 
     def getAxiomsAsClass(self):
@@ -1169,8 +1144,9 @@ class AxiomsByEntityWorker(AbstractWorker):
         try:
             self.sgnStarted.emit()
             # self.vm.attachThreadToJVM()
-            self.initializeOWLOntology()
-            self.computeAxioms()
+            with self.mirror.lockOntology():
+                self.initializeOWLOntology()
+                self.computeAxioms()
         except Exception as e:
             LOGGER.exception('Fatal error while computing axioms.\nError:{}'.format(str(e)))
             self.sgnError.emit(e)
@@ -39,7 +39,7 @@ from PyQt5 import QtWidgets
 from eddy.core.common import HasThreadingSystem
 from eddy.core.datatypes.graphol import Item
 from eddy.core.datatypes.owl import OWLAxiom
-from eddy.core.exporters.owl2 import OWLOntologyExporterWorker
+from eddy.core.exporters.owl2 import getOWLOntologyMirror
 from eddy.core.functions.signals import connect
 from eddy.core.jvm import getJavaVM
 from eddy.core.output import getLogger
@@ -326,6 +326,7 @@ class OntologyReasoningTasksWorker(AbstractWorker):
         self.InconsistentOntologyExplanationGeneratorFactory = self.vm.getJavaClass(
             'org.semanticweb.owl.explanation.impl.blackbox.checker.InconsistentOntologyExplanationGeneratorFactory')
 
+        self.mirror = getOWLOntologyMirror(project)
         self.reasonerInstance = None
         self._isOntologyConsistent = None
         self.javaBottomClassNode=None
@@ -358,29 +359,9 @@ class OntologyReasoningTasksWorker(AbstractWorker):
         """
         return {axiom for axiom in OWLAxiom}
 
-    def loadImportedOntologiesIntoManager(self):
-        LOGGER.debug('Loading declared imports into the OWL 2 Manager')
-        for impOnt in self.project.importedOntologies:
-            try:
-                docObj = None
-                if impOnt.isLocalDocument:
-                    docObj = self.JavaFileClass(impOnt.docLocation)
-                else:
-                    docObj = self.URIClass(impOnt.docLocation)
-                docLocationIRI = self.IRIClass.create(docObj)
-                impOntIRI = self.IRIClass.create(impOnt.ontologyIRI)
-                iriMapper = self.IRIMapperClass(impOntIRI, docLocationIRI)
-                self.manager.getIRIMappers().add(iriMapper)
-                loaded = self.manager.loadOntology(impOntIRI)
-            except Exception as e:
-                LOGGER.exception('The imported ontology <{}> cannot be loaded.\nError:{}'.format(impOnt, str(e)))
-            else:
-                LOGGER.debug('Ontology ({}) correctly loaded.'.format(impOnt))
-
     def initializeOWLManagerAndReasoner(self, ontology):
         self.manager = ontology.getOWLOntologyManager()
         self.df = self.manager.getOWLDataFactory()
-        self.loadImportedOntologiesIntoManager()
         self.reasonerInstance = self.ReasonerClass(self.ReasonerConfigurationClass(), ontology)
         #TODO se si usano metodi factory di Hermit, oggetto 'ontology' non viene riconosciuto come istanza di OWLReasoner
         #self.reasonerInstance = self.ReasonerFactoryClass.createReasoner(ontology, self.ReasonerConfigurationClass())
@@ -433,13 +414,12 @@ class OntologyReasoningTasksWorker(AbstractWorker):
 
     def runReasoningTasks(self):
         #TODO VALUTA REINSERIMENTO EXPLANATIONS TRAMITE BOOLEANO self.computeExplanations
-        worker = OWLOntologyExporterWorker(self.project,axioms=self.axioms())
-        worker.run()
-        self.initializeOWLManagerAndReasoner(worker.ontology)
+        ontology = self.mirror.getOntology()
+        self.initializeOWLManagerAndReasoner(ontology)
         if not self.isConsistent():
             factory = self.ReasonerFactoryClass()
             ecf = self.InconsistentOntologyExplanationGeneratorFactory(factory, 0)
-            generator = ecf.createExplanationGenerator(worker.ontology)
+            generator = ecf.createExplanationGenerator(ontology)
 
             thingISANothing = self.df.getOWLSubClassOfAxiom(self.df.getOWLThing(),self.df.getOWLNothing())
 
@@ -468,11 +448,14 @@ class OntologyReasoningTasksWorker(AbstractWorker):
         try:
             self.sgnStarted.emit()
             #self.vm.attachThreadToJVM()
-            self.runReasoningTasks()
+            with self.mirror.lockOntology():
+                self.runReasoningTasks()
         except Exception as e:
             LOGGER.exception('Fatal error while executing reasoning tasks.\nError:{}'.format(str(e)))
             self.sgnError.emit(e)
         finally:
+            if self.reasonerInstance:
+                self.reasonerInstance.dispose()
             self.vm.detachThreadFromJVM()
             self.finished.emit()
 
@@ -522,35 +505,15 @@ class EmptyEntityExplanationWorker(AbstractWorker):
         self.SilentExplanationProgressMonitor = self.vm.getJavaClass(
             'com.clarkparsia.owlapi.explanation.util.SilentExplanationProgressMonitor')
         self.DefaultExplanationGenerator = self.vm.getJavaClass('com.clarkparsia.owlapi.explanation.DefaultExplanationGenerator')
+        self.mirror = getOWLOntologyMirror(project)
+        self.reasonerInstance = None
         self.df = None
 
 
-    def loadImportedOntologiesIntoManager(self):
-        LOGGER.debug('Loading declared imports into the OWL 2 Manager')
-        self.status_bar.showMessage('Loading declared imports into the OWL 2 Manager')
-        for impOnt in self.project.importedOntologies:
-            try:
-                docObj = None
-                if impOnt.isLocalDocument:
-                    docObj = self.JavaFileClass(impOnt.docLocation)
-                else:
-                    docObj = self.URIClass(impOnt.docLocation)
-                docLocationIRI = self.IRIClass.create(docObj)
-                impOntIRI = self.IRIClass.create(impOnt.ontologyIRI)
-                iriMapper = self.IRIMapperClass(impOntIRI, docLocationIRI)
-                self.manager.getIRIMappers().add(iriMapper)
-                loaded = self.manager.loadOntology(impOntIRI)
-            except Exception as e:
-                LOGGER.exception('The imported ontology <{}> cannot be loaded.\nError:{}'.format(impOnt, str(e)))
-            else:
-                LOGGER.debug('Ontology ({}) correctly loaded.'.format(impOnt))
-                self.status_bar.showMessage('Ontology ({}) correctly loaded.'.format(impOnt))
-
     def initializeOWLManagerAndReasoner(self, ontology):
         self.status_bar.showMessage('Initializing the OWL 2 Manager')
         self.manager = ontology.getOWLOntologyManager()
         self.df = self.manager.getOWLDataFactory()
-        self.loadImportedOntologiesIntoManager()
         self.status_bar.showMessage('OWL 2 Manager initialized')
         self.status_bar.showMessage('Initializing the OWL 2 reasoner')
         self.reasonerInstance = self.ReasonerClass(self.ReasonerConfigurationClass(), ontology)
@@ -558,10 +521,8 @@ class EmptyEntityExplanationWorker(AbstractWorker):
 
     def initializeOWLOntology(self):
         self.status_bar.showMessage('Fetching the OWL 2 ontology')
-        worker = OWLOntologyExporterWorker(self.project, axioms={axiom for axiom in OWLAxiom})
-        worker.run()
+        self.ontology = self.mirror.getOntology()
         self.status_bar.showMessage('OWL 2 ontology fetched')
-        self.ontology = worker.ontology
         self.initializeOWLManagerAndReasoner(self.ontology)
 
     def getEmptyExpression(self):
@@ -600,12 +561,15 @@ class EmptyEntityExplanationWorker(AbstractWorker):
         try:
             self.sgnStarted.emit()
             #self.vm.attachThreadToJVM()
-            self.initializeOWLOntology()
-            self.computeExplanationAxioms()
+            with self.mirror.lockOntology():
+                self.initializeOWLOntology()
+                self.computeExplanationAxioms()
         except Exception as e:
             LOGGER.exception('Fatal error while computing explanations.\nError:{}'.format(str(e)))
             self.sgnError.emit(e)
         finally:
+            if self.reasonerInstance:
+                self.reasonerInstance.dispose()
             self.vm.detachThreadFromJVM()
             self.finished.emit()
 
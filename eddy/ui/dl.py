@@ -42,7 +42,7 @@ from eddy.core.common import HasThreadingSystem
 from eddy.core.datatypes.graphol import Item
 from eddy.core.datatypes.owl import OWLAxiom
 from eddy.core.datatypes.qt import Font
-from eddy.core.exporters.owl2 import OWLOntologyExporterWorker
+from eddy.core.exporters.owl2 import getOWLOntologyMirror
 from eddy.core.functions.signals import connect
 from eddy.core.items.nodes.literal import LiteralNode
 from eddy.core.jvm import getJavaVM
@@ -303,6 +303,7 @@ class DLSyntaxWorker(AbstractWorker):
         self.URIClass = self.vm.getJavaClass('java.net.URI')
         self.IRIMapperClass = self.vm.getJavaClass('org.semanticweb.owlapi.util.SimpleIRIMapper')
         self.OWLProfileReport = self.vm.getJavaClass('org.semanticweb.owlapi.profiles.OWLProfileReport')
+        self.mirror = getOWLOntologyMirror(project)
         self.reasonerInstance = None
         self._isOntologyConsistent = None
         self.javaBottomClassNode=None
@@ -314,28 +315,8 @@ class DLSyntaxWorker(AbstractWorker):
         self._includeImports = includeImports
         self._computeExplanations = computeExplanations
 
-    def loadImportedOntologiesIntoManager(self):
-        LOGGER.debug('Loading declared imports into the OWL 2 Manager')
-        for impOnt in self.project.importedOntologies:
-            try:
-                docObj = None
-                if impOnt.isLocalDocument:
-                    docObj = self.JavaFileClass(impOnt.docLocation)
-                else:
-                    docObj = self.URIClass(impOnt.docLocation)
-                docLocationIRI = self.IRIClass.create(docObj)
-                impOntIRI = self.IRIClass.create(impOnt.ontologyIRI)
-                iriMapper = self.IRIMapperClass(impOntIRI, docLocationIRI)
-                self.manager.getIRIMappers().add(iriMapper)
-                loaded = self.manager.loadOntology(impOntIRI)
-            except Exception as e:
-                LOGGER.exception('The imported ontology <{}> cannot be loaded.\nError:{}'.format(impOnt, str(e)))
-            else:
-                LOGGER.debug('Ontology ({}) correctly loaded.'.format(impOnt))
-
     def initializeOWLManager(self, ontology):
         self.manager = ontology.getOWLOntologyManager()
-        self.loadImportedOntologiesIntoManager()
 
     def axioms(self):
         """
@@ -346,13 +327,12 @@ class DLSyntaxWorker(AbstractWorker):
 
 
     def runProfileCheck(self):
-        worker = OWLOntologyExporterWorker(self.project,axioms=self.axioms())
-        worker.run()
-        self.initializeOWLManager(worker.ontology)
+        ontology = self.mirror.getOntology()
+        self.initializeOWLManager(ontology)
 
 
         self.dlProfile = self.ProfileClass()
-        self.profileReport = self.dlProfile.checkOntology(worker.ontology)
+        self.profileReport = self.dlProfile.checkOntology(ontology)
 
         if not self.profileReport.isInProfile() :
             self.sgnNotCompliant.emit(self.profileReport.getViolations().size())
@@ -370,7 +350,8 @@ class DLSyntaxWorker(AbstractWorker):
         try:
             self.sgnStarted.emit()
             self.vm.attachThreadToJVM()
-            self.runProfileCheck()
+            with self.mirror.lockOntology():
+                self.runProfileCheck()
         except Exception as e:
             LOGGER.exception('Fatal error while executing reasoning tasks.\nError:{}'.format(str(e)))
             self.sgnError.emit(e)
@@ -160,10 +160,10 @@ class ImportOntologyDialog(QtWidgets.QDialog, HasWidgetSystem, HasThreadingSyste
         connect(self.worker.sgnErrored, self.onImportError)
         connect(self.worker.sgnStepPerformed, self.widgetVerify.progressStep)
         connect(self.worker.sgnOntologyDocumentLoaded, self.onOntologyDocumentLoaded)
-        connect(self.worker.sgnClassFetched, self.onClassFetched)
-        connect(self.worker.sgnObjectPropertyFetched, self.onObjectPropertyFetched)
-        connect(self.worker.sgnDataPropertyFetched, self.onDataPropertyFetched)
-        connect(self.worker.sgnIndividualFetched, self.onIndividualFetched)
+        connect(self.worker.sgnClassesFetched, self.onClassesFetched)
+        connect(self.worker.sgnObjectPropertiesFetched, self.onObjectPropertiesFetched)
+        connect(self.worker.sgnDataPropertiesFetched, self.onDataPropertiesFetched)
+        connect(self.worker.sgnIndividualsFetched, self.onIndividualsFetched)
         connect(self.worker.sgnMissingOntologyImportFound, self.onMissingOntologyImportFound)
         self.redraw()
         self.startThread(self.IMPORT_THREAD_NAME, self.worker)
@@ -176,21 +176,21 @@ class ImportOntologyDialog(QtWidgets.QDialog, HasWidgetSystem, HasThreadingSyste
         if not self.isReloadAttempt:
             self.importedOntology = ImportedOntology(ontIri, docLoc, versionIri, isLocal, self.project)
 
-    @QtCore.pyqtSlot(str)
-    def onClassFetched(self, iri):
-        self.classes.add(self.project.getIRI(iri,imported=True))
+    @QtCore.pyqtSlot(list)
+    def onClassesFetched(self, iris):
+        self.classes.update(self.project.getIRIs(iris, imported=True))
 
-    @QtCore.pyqtSlot(str)
-    def onObjectPropertyFetched(self, iri):
-        self.objectProperties.add(self.project.getIRI(iri, imported=True))
+    @QtCore.pyqtSlot(list)
+    def onObjectPropertiesFetched(self, iris):
+        self.objectProperties.update(self.project.getIRIs(iris, imported=True))
 
-    @QtCore.pyqtSlot(str)
-    def onDataPropertyFetched(self, iri):
-        self.dataProperties.add(self.project.getIRI(iri, imported=True))
+    @QtCore.pyqtSlot(list)
+    def onDataPropertiesFetched(self, iris):
+        self.dataProperties.update(self.project.getIRIs(iris, imported=True))
 
-    @QtCore.pyqtSlot(str)
-    def onIndividualFetched(self, iri):
-        self.individuals.add(self.project.getIRI(iri, imported=True))
+    @QtCore.pyqtSlot(list)
+    def onIndividualsFetched(self, iris):
+        self.individuals.update(self.project.getIRIs(iris, imported=True))
 
     @QtCore.pyqtSlot()
     def accept(self):
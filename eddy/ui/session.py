@@ -123,7 +123,10 @@ from eddy.core.datatypes.system import (
 )
 from eddy.core.diagram import Diagram
 from eddy.core.exporters.graphml import GraphMLDiagramExporter
-from eddy.core.exporters.graphol_iri import GrapholIRIProjectExporter
+from eddy.core.exporters.graphol_iri import (
+    GrapholIRIProjectExporter,
+    GrapholIRIProjectSaveWorker,
+)
 from eddy.core.exporters.graphreferences import GraphReferencesProjectExporter
 from eddy.core.exporters.image import (
     BmpDiagramExporter,
@@ -142,7 +145,10 @@ from eddy.core.factory import (
     MenuFactory,
     PropertyFactory,
 )
-from eddy.core.functions.fsystem import fexists
+from eddy.core.functions.fsystem import (
+    fexists,
+    fremove,
+)
 from eddy.core.functions.misc import (
     first,
     format_exception,
@@ -162,6 +168,7 @@ from eddy.core.items.nodes.common.base import (
 )
 from eddy.core.items.nodes.facet import FacetNode
 from eddy.core.items.nodes.literal import LiteralNode
+from eddy.core.journal import ProjectJournal
 from eddy.core.loaders.annotations import CsvLoader, XlsxLoader
 from eddy.core.loaders.graphml import GraphMLOntologyLoader
 from eddy.core.loaders.graphol_iri import (
@@ -169,6 +176,8 @@ from eddy.core.loaders.graphol_iri import (
     GrapholOntologyIRILoader_v3,
 )
 from eddy.core.loaders.owl2 import (
+    ImportedOntologySignatureCache,
+    OwlOntologyImportRevalidationWorker,
     OwlOntologyImportSetWorker,
     OwlProjectLoader,
 )
@@ -361,6 +370,17 @@ class Session(
         self.emptyEntityExplanations = {}
         self.inconsistentOntologyExplanations = list()
 
+        #############################################
+        # INITIALIZE PROJECT SAVE STATE VARIABLES
+        #################################
+
+        self.projectSavePending = False
+        self.projectSaveIndex = None
+        self.projectSavePath = None
+        self.projectSavePreviousPath = None
+        self.projectSaveJournalSeq = None
+        self.journal = None
+
         #############################################
         # CONFIGURE SESSION
         #################################
@@ -388,8 +408,16 @@ class Session(
         self.owlOntologyImportErrors = None
         if path:
             self.projectFromFile = True
-            worker = self.createProjectLoader(File.Graphol, path, self)
+            loadPath = path
+            settings = QtCore.QSettings()
+            if settings.value('project/autosave', True, bool) and ProjectJournal.exists(path):
+                loadPath = self.recoverProject(path)
+            worker = self.createProjectLoader(File.Graphol, loadPath, self)
             worker.run()
+            if loadPath != path:
+                # THE RECOVERED EDITS ARE NOT STORED IN THE PROJECT FILE YET
+                self.project.path = expandPath(path)
+                self.undostack.resetClean()
         elif owl_path:
             self.projectFromFile = True
             worker = self.createProjectLoader(File.Owl, owl_path, self)
@@ -405,12 +433,26 @@ class Session(
             )
 
         if self.projectFromFile:
-            worker = OwlOntologyImportSetWorker(self.project)
+            cache = ImportedOntologySignatureCache()
+            worker = OwlOntologyImportSetWorker(self.project, cache=cache)
             worker.run()
             self.owlOntologyImportSize = worker.importSize
             self.owlOntologyImportLoadedCount = worker.loadCount
             if self.owlOntologyImportSize > self.owlOntologyImportLoadedCount:
                 self.owlOntologyImportErrors = worker.owlOntologyImportErrors
+            if worker.cachedImports:
+                # IMPORTS LOADED FROM THE SIGNATURE CACHE ARE CHECKED AGAINST THEIR DOCUMENTS
+                worker = OwlOntologyImportRevalidationWorker(self.project, worker.cachedImports, cache)
+                connect(worker.sgnSignatureChanged, self.onImportedOntologySignatureChanged)
+                self.startThread('OwlOntologyImportRevalidation', worker)
+
+        #############################################
+        # START THE AUTOSAVE JOURNAL
+        #################################
+
+        settings = QtCore.QSettings()
+        if settings.value('project/autosave', True, bool):
+            self.journal = ProjectJournal(self)
 
         #############################################
         # CONNECT PROJECT SIGNALS
@@ -1691,6 +1733,17 @@ class Session(
     def onSingleNodeSwitchIRI(self, node: QtWidgets.QGraphicsItem, iri: IRI) -> None:
         self.sgnSingleNodeSwitchIRI.emit(node, iri)
 
+    @QtCore.pyqtSlot(ImportedOntology, dict)
+    def onImportedOntologySignatureChanged(self, impOnt: ImportedOntology, signature: dict) -> None:
+        """
+        Executed when the cached signature of an imported ontology turns out to be stale.
+        """
+        if impOnt in self.project.importedOntologies:
+            impOnt.resetSignature()
+            impOnt.addSignature(signature, self.project)
+            impOnt.correctlyLoaded = True
+            self.project.sgnImportedOntologyLoaded.emit(impOnt)
+
     @QtCore.pyqtSlot()
     def doBringToFront(self) -> None:
         """
@@ -2687,8 +2740,7 @@ class Session(
                 if not dialog.exec_():
                     return
                 self.project.path = expandPath(first(dialog.selectedFiles()))
-            worker = self.createProjectExporter(File.Graphol, self.project, self)
-            worker.run()
+            self.saveProject(currentPath)
         except Exception as e:
             self.project.path = currentPath
             msgbox = QtWidgets.QMessageBox(self)
@@ -2699,9 +2751,6 @@ class Session(
             msgbox.setWindowIcon(QtGui.QIcon(':/icons/128/ic_eddy'))
             msgbox.setWindowTitle('Save failed!')
             msgbox.exec_()
-        else:
-            self.undostack.setClean()
-            self.sgnProjectSaved.emit()
 
     @QtCore.pyqtSlot()
     def doSaveAs(self) -> None:
@@ -2718,8 +2767,7 @@ class Session(
             dialog.setDefaultSuffix(File.Graphol.extension)
             if dialog.exec_():
                 self.project.path = expandPath(first(dialog.selectedFiles()))
-                worker = self.createProjectExporter(File.Graphol, self.project, self)
-                worker.run()
+                self.saveProject(currentPath)
         except Exception as e:
             self.project.path = currentPath
             msgbox = QtWidgets.QMessageBox(self)
@@ -2730,9 +2778,6 @@ class Session(
             msgbox.setWindowIcon(QtGui.QIcon(':/icons/128/ic_eddy'))
             msgbox.setWindowTitle('Save failed!')
             msgbox.exec_()
-        else:
-            self.undostack.setClean()
-            self.sgnProjectSaved.emit()
 
     @QtCore.pyqtSlot()
     def doSelectAll(self) -> None:
@@ -3295,15 +3340,14 @@ class Session(
         Render ontology elements by full IRIs
         """
         with BusyProgressDialog('Switching label rendering', parent=self):
-            settings = QtCore.QSettings()
-            settings.setValue('ontology/iri/render', IRIRender.FULL.value)
+            self.project.renderer.setRendering(IRIRender.FULL.value)
             self.action(objectName='render_full_iri').setChecked(True)
             self.action(objectName='render_prefixed_iri').setChecked(False)
             self.action(objectName='render_simple_name').setChecked(False)
             for langTag in self.project.getLanguages():
                 actionObjName = 'render_label_{}'.format(langTag)
                 self.action(objectName=actionObjName).setChecked(False)
-            for node in self.project.nodes():
+            for node in self.project.iterNodes():
                 if isinstance(node, PredicateNodeMixin):
                     node.doUpdateNodeLabel()
             self.sgnRenderingModified.emit(IRIRender.FULL.value)
@@ -3314,15 +3358,14 @@ class Session(
         Render ontology elements by prefixed IRIs
         """
         with BusyProgressDialog('Switching label rendering', parent=self):
-            settings = QtCore.QSettings()
-            settings.setValue('ontology/iri/render', IRIRender.PREFIX.value)
+            self.project.renderer.setRendering(IRIRender.PREFIX.value)
             self.action(objectName='render_full_iri').setChecked(False)
             self.action(objectName='render_prefixed_iri').setChecked(True)
             self.action(objectName='render_simple_name').setChecked(False)
             for langTag in self.project.getLanguages():
                 actionObjName = 'render_label_{}'.format(langTag)
                 self.action(objectName=actionObjName).setChecked(False)
-            for node in self.project.nodes():
+            for node in self.project.iterNodes():
                 if isinstance(node, PredicateNodeMixin):
                     node.doUpdateNodeLabel()
             self.sgnRenderingModified.emit(IRIRender.PREFIX.value)
@@ -3333,8 +3376,7 @@ class Session(
         Render ontology elements by prefixed IRIs
         """
         with BusyProgressDialog('Switching label rendering', parent=self):
-            settings = QtCore.QSettings()
-            settings.setValue('ontology/iri/render', IRIRender.SIMPLE_NAME.value)
+            self.project.renderer.setRendering(IRIRender.SIMPLE_NAME.value)
             self.action(objectName='render_full_iri').setChecked(False)
             self.action(objectName='render_prefixed_iri').setChecked(False)
             self.action(objectName='render_simple_name').setChecked(True)
@@ -3342,7 +3384,7 @@ class Session(
             for langTag in self.project.getLanguages():
                 actionObjName = 'render_label_{}'.format(langTag)
                 self.action(objectName=actionObjName).setChecked(False)
-            for node in self.project.nodes():
+            for node in self.project.iterNodes():
                 if isinstance(node, PredicateNodeMixin):
                     node.doUpdateNodeLabel()
         self.sgnRenderingModified.emit(IRIRender.SIMPLE_NAME.value)
@@ -3355,9 +3397,7 @@ class Session(
         with BusyProgressDialog('Switching label rendering', parent=self):
             action = self.sender()
             lang = action.data()
-            settings = QtCore.QSettings()
-            settings.setValue('ontology/iri/render', IRIRender.LABEL.value)
-            settings.setValue('ontology/iri/render/language', lang)
+            self.project.renderer.setRendering(IRIRender.LABEL.value, lang)
             self.action(objectName='render_full_iri').setChecked(False)
             self.action(objectName='render_prefixed_iri').setChecked(False)
             self.action(objectName='render_simple_name').setChecked(False)
@@ -3365,7 +3405,7 @@ class Session(
             for langTag in self.project.getLanguages():
                 actionObjName = 'render_label_{}'.format(langTag)
                 self.action(objectName=actionObjName).setChecked(langTag == lang)
-            for node in self.project.nodes():
+            for node in self.project.iterNodes():
                 if isinstance(node, (PredicateNodeMixin, FacetNode)):
                     node.doUpdateNodeLabel()
             self.sgnRenderingModified.emit(IRIRender.LABEL.value)
@@ -3393,6 +3433,57 @@ class Session(
             unable to get update information.
             """))
 
+    @QtCore.pyqtSlot()
+    def onProjectSaveCompleted(self) -> None:
+        """
+        Executed when the project save worker thread successfully writes the project file.
+        """
+        # THE PROJECT IS CLEAN ONLY IF IT WAS NOT EDITED WHILE THE FILE WAS WRITTEN
+        if self.undostack.index() == self.projectSaveIndex:
+            self.undostack.setClean()
+        # EDITS JOURNALED BEFORE THE SNAPSHOT ARE NOW STORED IN THE PROJECT FILE
+        if self.journal:
+            self.journal.rebase(self.projectSaveJournalSeq, self.projectSavePath)
+        self.sgnProjectSaved.emit()
+
+    @QtCore.pyqtSlot(Exception)
+    def onProjectSaveErrored(self, exception: Exception) -> None:
+        """
+        Executed when the project save worker thread fails to write the project file.
+        """
+        if self.project.path == self.projectSavePath and self.projectSavePreviousPath is not None:
+            self.project.path = self.projectSavePreviousPath
+        msgbox = QtWidgets.QMessageBox(self)
+        msgbox.setDetailedText(format_exception(exception))
+        msgbox.setIconPixmap(QtGui.QIcon(':/icons/48/ic_error_outline_black').pixmap(48))
+        msgbox.setStandardButtons(QtWidgets.QMessageBox.Close)
+        msgbox.setText('Eddy could not save the current project!')
+        msgbox.setWindowIcon(QtGui.QIcon(':/icons/128/ic_eddy'))
+        msgbox.setWindowTitle('Save failed!')
+        msgbox.exec_()
+
+    @QtCore.pyqtSlot()
+    def onProjectSaveFinished(self) -> None:
+        """
+        Executed when the project save worker terminates.
+        """
+        # RELEASE THE THREAD NAME SO THAT THE PENDING SAVE, IF ANY, CAN BE STARTED
+        self.stopThread('GrapholIRIProjectSave')
+        progressBar = self.widget('progress_bar')
+        progressBar.setToolTip('')
+        progressBar.setRange(0, 0)
+        progressBar.setVisible(False)
+        # PERFORM THE SAVE REQUESTED WHILE THE PREVIOUS ONE WAS RUNNING
+        if self.projectSavePending:
+            self.saveProject()
+
+    @QtCore.pyqtSlot(int, int)
+    def onProjectSaveProgress(self, current: int, total: int) -> None:
+        """
+        Executed when the project save worker thread writes a part of the project file.
+        """
+        self.widget('progress_bar').setValue(current)
+
     @QtCore.pyqtSlot()
     def onProjectSaved(self) -> None:
         """
@@ -3532,6 +3623,12 @@ class Session(
             for plugin in self.plugins():
                 self.pmanager.dispose(plugin)
             self.pmanager.clear()
+            # WAIT FOR THE PROJECT FILE TO BE WRITTEN
+            self.waitForProjectSave()
+            # CLOSE THE AUTOSAVE JOURNAL, KEEPING IT IF UNSAVED CHANGES ARE NOT DISCARDED
+            self.waitForThread('ProjectJournalCompaction')
+            if self.journal:
+                self.journal.close(discard=self.undostack.isClean() or not save)
             # DISPOSE ALL THE RUNNING THREADS
             self.stopRunningThreads()
             # HIDE ALL THE NOTIFICATION POPUPS
@@ -3580,6 +3677,7 @@ class Session(
         """
         Create a new diagram view displaying the given diagram.
         """
+        diagram.renderPendingItems()
         view = DiagramView(diagram, self)
         view.centerOn(0, 0)
         return view
@@ -3602,6 +3700,59 @@ class Session(
         settings.setValue('session/state', self.saveState())
         settings.sync()
 
+    def recoverProject(self, path: str) -> str:
+        """
+        Ask whether to recover the edits journaled for the project stored at the given path,
+        returning the path of the file the project has to be loaded from.
+        """
+        msgbox = QtWidgets.QMessageBox(self)
+        msgbox.setIconPixmap(QtGui.QIcon(':/icons/48/ic_help_outline_black').pixmap(48))
+        msgbox.setWindowIcon(QtGui.QIcon(':/icons/128/ic_eddy'))
+        msgbox.setWindowTitle('Recover unsaved changes?')
+        msgbox.setStandardButtons(QtWidgets.QMessageBox.No | QtWidgets.QMessageBox.Yes)
+        msgbox.setText('Eddy was not closed properly and the project contains unsaved changes. '
+                       'Do you want to recover them?')
+        msgbox.exec_()
+        if msgbox.result() == QtWidgets.QMessageBox.Yes:
+            try:
+                return ProjectJournal.recover(path)
+            except Exception as e:
+                LOGGER.exception('Failed to recover project %s: %s', path, e)
+        fremove(ProjectJournal.journalPath(path))
+        fremove(ProjectJournal.autosavePath(path))
+        return path
+
+    def saveProject(self, previousPath: Optional[str] = None) -> None:
+        """
+        Save the current project to its path using a background thread.
+        The project is snapshotted before this method returns, so that it can be edited
+        while the file is being written: a save requested while another one is still
+        running is coalesced into a single save performed once the running one terminates.
+        If the save fails, the project path is restored to the given previous one.
+        """
+        if self.thread('GrapholIRIProjectSave'):
+            self.projectSavePending = True
+            return
+        self.projectSavePending = False
+        exporter = self.createProjectExporter(File.Graphol, self.project, self)
+        worker = GrapholIRIProjectSaveWorker(exporter)
+        self.projectSaveIndex = self.undostack.index()
+        self.projectSavePath = worker.path
+        self.projectSavePreviousPath = previousPath
+        self.projectSaveJournalSeq = self.journal.seq if self.journal else None
+        # SHOW PROGRESS BAR
+        progressBar = self.widget('progress_bar')
+        progressBar.setToolTip('Saving project...')
+        progressBar.setRange(0, worker.max)
+        progressBar.setValue(0)
+        progressBar.setVisible(True)
+        # RUN THE SAVE WORKER IN A THREAD
+        connect(worker.sgnCompleted, self.onProjectSaveCompleted)
+        connect(worker.sgnErrored, self.onProjectSaveErrored)
+        connect(worker.sgnProgress, self.onProjectSaveProgress)
+        connect(worker.finished, self.onProjectSaveFinished)
+        self.startThread('GrapholIRIProjectSave', worker)
+
     def setWindowTitle(self, project: Project, diagram: Diagram = None) -> None:
         """
         Set the main window title.
@@ -3611,3 +3762,31 @@ class Session(
         if diagram:
             title = '{0} - {1}'.format(diagram.name, title)
         super().setWindowTitle(title)
+
+    def waitForProjectSave(self) -> None:
+        """
+        Block until the running project save, and any save coalesced with it, terminates.
+        """
+        self.waitForThread('GrapholIRIProjectSave')
+
+    def waitForThread(self, name: str) -> None:
+        """
+        Block until the thread with the given name, and any thread started with the same
+        name while its signals are delivered, terminates.
+        """
+        qthread = self.thread(name)
+        while qthread:
+            # THE THREAD IS QUIT THROUGH A QUEUED SIGNAL: SPIN AN EVENT LOOP RATHER THAN
+            # BLOCKING ON QThread.wait(), SO THAT THE WORKER SIGNALS ARE DELIVERED AND
+            # THE COALESCED SAVE, IF ANY, IS STARTED BEFORE THE LOOP QUITS
+            loop = QtCore.QEventLoop(self)
+            connect(qthread.finished, loop.quit)
+            if qthread.isFinished():
+                self.app.processEvents()
+            else:
+                loop.exec_()
+            loop.deleteLater()
+            nextQThread = self.thread(name)
+            if nextQThread is qthread:
+                break
+            qthread = nextQThread
@@ -64,7 +64,7 @@ class SyntaxValidationDialog(QtWidgets.QDialog, HasThreadingSystem):
         # edge endpoints at first, and then (if no error is detected) will perform the validation on the
         # edge itself. However, disconnected nodes won't be taken into account and thus we must perform
         # an additional step to validate the isolated nodes separately.
-        self.items = list(project.edges()) + list(filter(lambda n: not n.adjacentNodes(), project.nodes()))
+        self.items = list(project.iterEdges()) + list(filter(lambda n: not n.adjacentNodes(), project.iterNodes()))
         self.project = project
         self.workerThread = None
         self.worker = None
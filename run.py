@@ -35,9 +35,11 @@
 
 """Launcher script for Eddy."""
 
+import multiprocessing
 import sys
 
 from eddy.core.application import main
 
 if __name__ == '__main__':
+    multiprocessing.freeze_support()
     sys.exit(main())
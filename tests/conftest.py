@@ -116,6 +116,7 @@ def qapp(qapp_args, tmpdir_factory):
         settings = QtCore.QSettings()
         settings.setValue('workspace/home', str(workspace_tmpdir))
         settings.setValue('update/check_on_startup', False)
+        settings.setValue('project/autosave', False)
         _qapp_instance.configure()
         yield _qapp_instance
     else:
@@ -661,3 +661,34 @@ def test_action_open_description_dialog(session, qtbot):
             QtWidgets.QApplication.activeModalWidget().close()
             qtbot.wait(250)
             node.setSelected(False)
+
+
+#############################################
+#   LABEL RENDERING
+#################################
+
+def test_action_render_by_full_and_prefixed_iri(session, qtbot):
+    # GIVEN
+    project = session.project
+    iri = project.getIRI('http://www.dis.uniroma1.it/~graphol/test_project/hasParent')
+    nodes = project.iriOccurrences(Item.RoleNode, iri)
+    # WHEN
+    session.action('render_full_iri').trigger()
+    # THEN
+    assert project.renderer.rendering() == 'full_iri'
+    assert all(node.labelString == str(iri) for node in nodes)
+    # WHEN
+    session.action('render_prefixed_iri').trigger()
+    # THEN
+    assert project.renderer.rendering() == 'prefix_iri'
+    assert all(node.labelString == 'test:hasParent' for node in nodes)
+    # WHEN
+    with qtbot.waitSignal(project.renderer.sgnLabelChanged):
+        project.setPrefix('tp', 'http://www.dis.uniroma1.it/~graphol/test_project/has')
+    # THEN
+    assert all(node.labelString == 'tp:Parent' for node in nodes)
+    # WHEN
+    with qtbot.waitSignal(project.renderer.sgnLabelChanged):
+        project.removePrefix('tp')
+    # THEN
+    assert all(node.labelString == 'test:hasParent' for node in nodes)
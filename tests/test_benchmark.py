@@ -0,0 +1,305 @@
+# -*- coding: utf-8 -*-
+
+##########################################################################
+#                                                                        #
+#  Eddy: a graphical editor for the specification of Graphol ontologies  #
+#  Copyright (C) 2015 Daniele Pantaleone <danielepantaleone@me.com>      #
+#                                                                        #
+#  This program is free software: you can redistribute it and/or modify  #
+#  it under the terms of the GNU General Public License as published by  #
+#  the Free Software Foundation, either version 3 of the License, or     #
+#  (at your option) any later version.                                   #
+#                                                                        #
+#  This program is distributed in the hope that it will be useful,       #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of        #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the          #
+#  GNU General Public License for more details.                          #
+#                                                                        #
+#  You should have received a copy of the GNU General Public License     #
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.  #
+#                                                                        #
+#  #####################                          #####################  #
+#                                                                        #
+#  Graphol is developed by members of the DASI-lab group of the          #
+#  Dipartimento di Ingegneria Informatica, Automatica e Gestionale       #
+#  A.Ruberti at Sapienza University of Rome: http://www.dis.uniroma1.it  #
+#                                                                        #
+#     - Domenico Lembo <lembo@dis.uniroma1.it>                           #
+#     - Valerio Santarelli <santarelli@dis.uniroma1.it>                  #
+#     - Domenico Fabio Savo <savo@dis.uniroma1.it>                       #
+#     - Daniele Pantaleone <pantaleone@dis.uniroma1.it>                  #
+#     - Marco Console <console@dis.uniroma1.it>                          #
+#                                                                        #
+##########################################################################
+
+
+import timeit
+
+import jpype
+import pytest
+from PyQt5 import (
+    QtCore,
+    QtGui,
+)
+
+from eddy.core.datatypes.graphol import Item
+from eddy.core.diagram import Diagram
+from eddy.core.datatypes.owl import OWLAxiom
+from eddy.core.exporters.owl2 import OWLOntologyExporterWorker
+from eddy.core.functions.path import expandPath
+from eddy.core.project import (
+    K_ITEMS,
+    K_TYPE,
+    ProjectIndex,
+)
+from eddy.ui.session import Session
+
+
+@pytest.fixture
+def session(qapp, qtbot, logging_disabled):
+    """
+    Provide an initialized Session instance.
+    """
+    with logging_disabled:
+        session = Session(qapp, expandPath('@tests/test_project_3/test_project_3_1.graphol'))
+        session.show()
+    qtbot.addWidget(session)
+    qtbot.waitExposed(session, timeout=3000)
+    with qtbot.waitSignal(session.sgnDiagramFocused):
+        session.sgnFocusDiagram.emit(session.project.diagram('diagram'))
+    yield session
+
+
+#############################################
+#   HELPERS
+#################################
+
+class JNICallCounter(object):
+    """
+    Wraps Java classes and objects counting the calls crossing the JNI boundary.
+    Java objects returned by the wrapped calls are wrapped as well, so that
+    calls performed on intermediate results (e.g. collections) are counted too.
+    """
+    def __init__(self, obj, counter):
+        self._obj = obj
+        self._counter = counter
+
+    @classmethod
+    def unwrap(cls, value):
+        if isinstance(value, cls):
+            return value._obj
+        if isinstance(value, (list, tuple)):
+            return type(value)(cls.unwrap(x) for x in value)
+        return value
+
+    def _invoke(self, func, *args):
+        self._counter['calls'] += 1
+        result = func(*[self.unwrap(x) for x in args])
+        if isinstance(result, jpype.JObject):
+            return JNICallCounter(result, self._counter)
+        return result
+
+    def __call__(self, *args):
+        return self._invoke(self._obj, *args)
+
+    def __getattr__(self, name):
+        attr = getattr(self._obj, name)
+        if callable(attr):
+            return lambda *args: self._invoke(attr, *args)
+        return attr
+
+    def __eq__(self, other):
+        return self._obj == self.unwrap(other)
+
+    def __hash__(self):
+        return hash(self._obj)
+
+    def __iter__(self):
+        return iter(self._obj)
+
+
+class IndexedDiagram(object):
+    """
+    Minimal diagram stand-in exposing what the ProjectIndex needs.
+    """
+    def __init__(self, name):
+        self.name = name
+
+
+class IndexedItem(object):
+    """
+    Minimal item stand-in exposing what the ProjectIndex needs.
+    """
+    def __init__(self, iid, item):
+        self.id = iid
+        self.item = item
+
+    def type(self):
+        return self.item
+
+    def isEdge(self):
+        return Item.InclusionEdge <= self.item <= Item.DifferentEdge
+
+    def isNode(self):
+        return Item.ConceptNode <= self.item < Item.InclusionEdge
+
+
+#############################################
+#   EDGE GEOMETRY
+#################################
+
+def test_benchmark_edge_geometry_paint_and_hit_test(session, benchmark):
+    # GIVEN
+    diagram = Diagram.create('benchmark', 50000, session.project)
+    nodes = []
+    for i in range(101):
+        node = diagram.factory.create(Item.IntersectionNode)
+        node.setPos(QtCore.QPointF((i % 11) * 200, (i // 11) * 200))
+        diagram.addItem(node)
+        nodes.append(node)
+    edges = []
+    for i in range(10000):
+        source, target = nodes[i % 100], nodes[i % 100 + 1]
+        edge = diagram.factory.create(Item.InclusionEdge, source=source, target=target,
+                                      breakpoints=[QtCore.QPointF(source.pos().x() + 100, target.pos().y() + i % 50)])
+        source.addEdge(edge)
+        target.addEdge(edge)
+        diagram.addItem(edge)
+        edges.append(edge)
+    for edge in edges:
+        edge.updateEdge()
+    image = QtGui.QImage(1024, 1024, QtGui.QImage.Format_ARGB32)
+    area = diagram.itemsBoundingRect()
+
+    def paintAndHitTest():
+        painter = QtGui.QPainter(image)
+        diagram.render(painter, QtCore.QRectF(image.rect()), area)
+        painter.end()
+        return sum(len(diagram.items(edge.mapToScene(edge.breakpoints[0]))) for edge in edges[::100])
+
+    def cached():
+        for edge in edges:
+            edge.boundingRect()
+            edge.shape()
+
+    def uncached():
+        # Reference implementation rebuilding the geometry on every call (as previously done).
+        for edge in edges:
+            edge.createBoundingRect()
+            edge.createShape()
+
+    # WHEN
+    result = benchmark.pedantic(paintAndHitTest, rounds=3)
+    # THEN
+    assert result >= 100
+    assert all(edge.boundingRect() == edge.createBoundingRect() for edge in edges)
+    assert all(edge.shape() == edge.createShape() for edge in edges)
+    benchmark.extra_info['edges'] = len(edges)
+    benchmark.extra_info['cached_seconds'] = min(timeit.repeat(cached, number=1, repeat=3))
+    benchmark.extra_info['uncached_seconds'] = min(timeit.repeat(uncached, number=1, repeat=3))
+
+
+def test_benchmark_edge_depth_hub_node_drag(session, benchmark):
+    # GIVEN
+    diagram = Diagram.create('benchmark', 5000, session.project)
+    hub = diagram.factory.create(Item.IntersectionNode)
+    hub.setPos(QtCore.QPointF(0, 0))
+    diagram.addItem(hub)
+    edges = []
+    for i in range(200):
+        node = diagram.factory.create(Item.IntersectionNode)
+        node.setPos(QtCore.QPointF((i % 20 - 10) * 120, (i // 20 - 5) * 120 + 60))
+        diagram.addItem(node)
+        edge = diagram.factory.create(Item.InclusionEdge, source=node, target=hub)
+        node.addEdge(edge)
+        hub.addEdge(edge)
+        diagram.addItem(edge)
+        edges.append(edge)
+    for edge in edges:
+        edge.updateEdge()
+    steps = iter(range(1, 1000000))
+
+    def drag():
+        # Same as Diagram.mouseMoveEvent when moving the hub node.
+        hub.setPos(QtCore.QPointF(next(steps) % 50, 0))
+        for edge in edges:
+            edge.updateEdge()
+
+    # WHEN
+    benchmark(drag)
+    # THEN
+    assert all(edge.zValue() > max(edge.source.zValue(), edge.target.zValue()) for edge in edges)
+    benchmark.extra_info['edges'] = len(edges)
+    benchmark.extra_info['max_edge_depth'] = max(edge.zValue() for edge in edges)
+
+
+#############################################
+#   OWL 2 EXPORT
+#################################
+
+def test_benchmark_owl_export_jni_calls_per_axiom(session, benchmark):
+    # GIVEN
+    project = session.project
+    counter = {'calls': 0}
+    workers = []
+
+    def setup():
+        worker = OWLOntologyExporterWorker(project, axioms={x for x in OWLAxiom})
+        for name in ('AddOntologyAnnotation', 'Arrays', 'HashSet', 'IRI', 'LinkedList', 'OWLManager', 'OWLOntologyID'):
+            setattr(worker, name, JNICallCounter(getattr(worker, name), counter))
+        workers.append(worker)
+        counter['calls'] = 0
+        return (worker,), {}
+
+    # WHEN
+    benchmark.pedantic(lambda worker: worker.run(), setup=setup, rounds=3)
+    # THEN
+    axioms = len(workers[-1].axioms())
+    assert axioms > 0
+    benchmark.extra_info['axioms'] = axioms
+    benchmark.extra_info['jni_calls'] = counter['calls']
+    benchmark.extra_info['jni_calls_per_axiom'] = counter['calls'] / axioms
+
+
+#############################################
+#   PROJECT INDEX
+#################################
+
+def test_benchmark_project_index_counts(benchmark):
+    # GIVEN
+    index = ProjectIndex(None)
+    types = [Item.ConceptNode, Item.RoleNode, Item.UnionNode, Item.InclusionEdge, Item.InputEdge]
+    diagrams = [IndexedDiagram('diagram{}'.format(i)) for i in range(50)]
+    for i in range(50000):
+        index.addItem(diagrams[i // 1000], IndexedItem('i{}'.format(i), types[i % len(types)]))
+    diagram = diagrams[0]
+
+    def counts():
+        return (
+            index.isEmpty(),
+            index.itemNum(Item.InclusionEdge),
+            index.itemNum(Item.ConceptNode, diagram),
+            index.itemCount(),
+            index.nodeCount(),
+            index.edgeCount(diagram),
+        )
+
+    def copies():
+        # Reference implementation copying the index content (as previously done).
+        return (
+            len(set.union(*(set(x.values()) for x in index[K_ITEMS].values()))) == 0,
+            len(set.union(*(x[Item.InclusionEdge] for x in index[K_TYPE].values()))),
+            len(index[K_TYPE][diagram.name][Item.ConceptNode]),
+            len(index.items()),
+            len(index.nodes()),
+            len(index.edges(diagram)),
+        )
+
+    # WHEN
+    result = benchmark(counts)
+    # THEN
+    assert result == (False, 10000, 200, 50000, 30000, 400)
+    assert result == copies()
+    benchmark.extra_info['items'] = index.itemCount()
+    benchmark.extra_info['copying_seconds'] = min(timeit.repeat(copies, number=1, repeat=3))
+    benchmark.extra_info['counting_seconds'] = min(timeit.repeat(counts, number=1, repeat=3))
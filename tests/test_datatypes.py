@@ -33,13 +33,28 @@
 ##########################################################################
 
 
+import weakref
+
 import pytest
 
-from eddy.core.datatypes.collections import DistinctList
+from eddy.core.datatypes.collections import (
+    DistinctList,
+    StringTrie,
+)
 from eddy.core.datatypes.qt import (
     SemVerVersionNumber,
     VersionNumber,
 )
+from eddy.core.owl import (
+    AnnotationAssertion,
+    AnnotationAssertionProperty,
+    AnnotationAssertionStore,
+    EventBus,
+    IRI,
+    IRIManager,
+    OWL2Datatype,
+    RE_IRI_FAST,
+)
 
 
 class TestDistinctList:
@@ -88,6 +103,32 @@ class TestDistinctList:
         assert D1 == DistinctList([1, 2, 3, 4, 5, 6, 7, 8])
 
 
+class TestStringTrie:
+    """
+    Tests for the StringTrie class.
+    """
+    def test_match(self):
+        T1 = StringTrie([('http://a/', 'a'), ('http://a/b#', 'b'), ('http://a/b#', 'c'), ('http://x/', 'x')])
+        assert list(T1.match('http://a/b#c'))[0] == ('http://a/', 'a')
+        assert sorted(T1.match('http://a/b#c')) == [('http://a/', 'a'), ('http://a/b#', 'b'), ('http://a/b#', 'c')]
+        assert list(T1.match('http://a/c')) == [('http://a/', 'a')]
+        assert list(T1.match('http://b/')) == []
+
+    def test_remove(self):
+        T1 = StringTrie([('http://a/', 'a'), ('http://a/b#', 'b')])
+        T1.remove('http://a/b#', 'b')
+        T1.remove('http://a/b#', 'z')
+        T1.remove('http://c/', 'c')
+        assert list(T1.match('http://a/b#c')) == [('http://a/', 'a')]
+        T1.remove('http://a/', 'a')
+        assert list(T1.match('http://a/b#c')) == []
+
+    def test_clear(self):
+        T1 = StringTrie([('http://a/', 'a')])
+        T1.clear()
+        assert list(T1.match('http://a/')) == []
+
+
 class TestSemVerVersionNumber:
     """
     Tests for the SemVerVersionNumber class.
@@ -327,3 +368,237 @@ class TestVersionNumber:
     def test_version_str_repr(self, version, expected):
         assert str(VersionNumber(version)) == expected
         assert repr(VersionNumber(version)) == "<VersionNumber({0})>".format(repr(expected))
+
+
+class TestIRI:
+    """
+    Tests for the IRI class.
+    """
+    def test_string_form(self):
+        iri = IRI('http://www.example.com/ontology#', 'Person')
+        assert str(iri) == 'http://www.example.com/ontology#Person'
+        assert str(iri) is str(iri)
+        assert len(iri) == len('http://www.example.com/ontology#Person')
+        assert iri[-6:] == 'Person'
+        assert ''.join(iri) == 'http://www.example.com/ontology#Person'
+
+    def test_string_form_after_namespace_change(self):
+        iri = IRI('http://www.example.com/ontology#', 'Person')
+        modified = []
+        iri.sgnIRIModified.connect(modified.append)
+        iri.namespace = 'http://www.example.org/people/'
+        assert modified == ['http://www.example.com/ontology#Person']
+        assert str(iri) == 'http://www.example.org/people/Person'
+        assert iri[:7] == 'http://'
+        assert iri.authority == 'www.example.org'
+
+    @pytest.mark.parametrize('string', [
+        'http://www.example.com/ontology#',
+        'https://www.example.com:8080/ontology/Person',
+        'http://www.example.com/ontology?version=1#Person',
+        'http://www.example.com/onto%20logy#Per%C3%A9son',
+        'urn:isbn:0451450523',
+        'urn:uuid:6e8bc430-9c3a-11d9-9669-0800200c9a66',
+    ])
+    def test_fast_path_agrees_with_grammar(self, string):
+        assert RE_IRI_FAST.match(string)
+        assert IRI(string).isValid()
+        assert IRI(string).isURI()
+        assert str(IRI(string)) == string
+
+    @pytest.mark.parametrize('string', [
+        'http://www.example.com/onto logy#',
+        'http://www.example.com/ontology#Person#Name',
+        'http://www.example.com/%zz',
+        'urn:isbn',
+    ])
+    def test_fast_path_rejects_unusual_shapes(self, string):
+        assert not RE_IRI_FAST.match(string)
+
+    def test_components_are_parsed_lazily(self):
+        iri = IRI('http://www.example.com:8080/ontology?version=1#', 'Person')
+        assert iri._components is None
+        assert iri.scheme == 'http'
+        assert iri.authority == 'www.example.com:8080'
+        assert iri.path == '/ontology'
+        assert iri.query == 'version=1'
+        assert iri.fragment == 'Person'
+
+    def test_invalid_iri_raises(self):
+        with pytest.raises(ValueError):
+            IRI('http://www.example.com/ontology#', 'Per son')
+
+    def test_events_are_dispatched_through_the_bus(self):
+        iri = IRI('http://www.example.com/ontology#', 'Person')
+        broadcast = []
+        received = []
+        observer = lambda *args: broadcast.append(args)
+        slot = lambda: received.append(EventBus.instance().source())
+        EventBus.instance().sgnIRIModified.connect(observer)
+        iri.sgnIRIModified.connect(slot)
+        iri.namespace = 'http://www.example.org/people/'
+        iri.sgnIRIModified.disconnect(slot)
+        iri.namespace = 'http://www.example.com/ontology#'
+        EventBus.instance().sgnIRIModified.disconnect(observer)
+        assert received == [iri]
+        assert broadcast == [
+            (iri, 'http://www.example.com/ontology#Person'),
+            (iri, 'http://www.example.org/people/Person'),
+        ]
+
+    def test_events_do_not_keep_receivers_alive(self):
+        class Receiver:
+            def onIRIModified(self):
+                pass
+        iri = IRI('http://www.example.com/ontology#', 'Person')
+        receiver = Receiver()
+        iri.sgnIRIModified.connect(receiver.onIRIModified)
+        ref = weakref.ref(receiver)
+        del receiver
+        assert ref() is None
+        iri.namespace = 'http://www.example.org/people/'
+
+    def test_annotation_assertion_modification_reaches_subject_observers(self):
+        iri = IRI('http://www.example.com/ontology#', 'Person')
+        label = AnnotationAssertion(iri, AnnotationAssertionProperty.Label.value, 'Person',
+                                    OWL2Datatype.PlainLiteral.value, 'en')
+        modified = []
+        iri.addAnnotationAssertion(label)
+        iri.sgnAnnotationModified.connect(modified.append)
+        label.value = 'Human'
+        iri.removeAnnotationAssertion(label)
+        label.value = 'Person'
+        assert modified == [label]
+
+    def test_annotation_assertion_modification_reaches_assertion_observers(self):
+        iri = IRI('http://www.example.com/ontology#', 'Person')
+        label = AnnotationAssertion(iri, AnnotationAssertionProperty.Label.value, 'Person',
+                                    OWL2Datatype.PlainLiteral.value, 'en')
+        twin = AnnotationAssertion(iri, AnnotationAssertionProperty.Label.value, 'Person',
+                                   OWL2Datatype.PlainLiteral.value, 'en')
+        modified = []
+        label.sgnAnnotationModified.connect(lambda: modified.append(label))
+        twin.sgnAnnotationModified.connect(lambda: modified.append(twin))
+        label.value = 'Human'
+        label.value = 'Man'
+        label.language = 'it'
+        twin.value = 'Human'
+        assert modified == [label, label, label, twin]
+
+
+class TestIRIManager:
+    """
+    Tests for the IRIManager class.
+    """
+    def test_bulk_iri_registration(self, qapp):
+        manager = IRIManager()
+        person = manager.getIRI('http://www.example.com/ontology#Person')
+        iris = manager.getIRIs([
+            'http://www.example.com/ontology#Person',
+            'http://www.example.com/ontology#Student',
+        ], imported=True)
+        assert iris[0] is person
+        assert str(iris[1]) == 'http://www.example.com/ontology#Student'
+        assert iris[1].manager is manager
+        assert iris[1] not in manager.iris
+        assert manager.getIRI('http://www.example.com/ontology#Student', imported=True) is iris[1]
+        assert manager.getIRIs(['http://www.example.com/ontology#Student']) == [iris[1]]
+        assert iris[1] in manager.iris
+
+
+class TestAnnotationAssertionStore:
+    """
+    Tests for the AnnotationAssertionStore class.
+    """
+    @staticmethod
+    def label(subject, value, language):
+        return AnnotationAssertion(subject, AnnotationAssertionProperty.Label.value, value,
+                                   OWL2Datatype.PlainLiteral.value, language)
+
+    def test_add_keeps_insertion_order_and_rejects_equal_assertions(self):
+        iri = IRI('http://www.example.com/ontology#', 'Person')
+        store = AnnotationAssertionStore()
+        labels = [self.label(iri, 'Person', lang) for lang in ('en', 'it', 'de')]
+        assert all(store.add(label) for label in labels)
+        assert not store.add(self.label(iri, 'Person', 'it'))
+        assert list(store) == labels
+        assert len(store) == 3
+        assert self.label(iri, 'Person', 'de') in store
+        assert self.label(iri, 'Persona', 'it') not in store
+
+    def test_lookup_by_property_and_language(self):
+        iri = IRI('http://www.example.com/ontology#', 'Person')
+        store = AnnotationAssertionStore()
+        labels = [self.label(iri, 'Person{}'.format(i), 'l{}'.format(i)) for i in range(30)]
+        for label in labels:
+            store.add(label)
+        assert store.first(AnnotationAssertionProperty.Label.value, 'l17') is labels[17]
+        assert store.first(AnnotationAssertionProperty.Label.value, 'xx') is labels[0]
+        assert store.first(AnnotationAssertionProperty.Comment.value, 'l17') is None
+        assert store.assertions(AnnotationAssertionProperty.Label.value, 'l3') == [labels[3]]
+        assert store.assertions(AnnotationAssertionProperty.Label.value) == labels
+
+    def test_remove_and_reindex(self):
+        iri = IRI('http://www.example.com/ontology#', 'Person')
+        store = AnnotationAssertionStore()
+        english = self.label(iri, 'Person', 'en')
+        italian = self.label(iri, 'Persona', 'it')
+        store.add(english)
+        store.add(italian)
+        assert store.remove(self.label(iri, 'Person', 'en'))
+        assert not store.remove(english)
+        assert list(store) == [italian]
+        italian.language = 'es'
+        store.reindex(italian)
+        assert store.assertions(AnnotationAssertionProperty.Label.value, 'it') == []
+        assert store.first(AnnotationAssertionProperty.Label.value, 'es') is italian
+        assert self.label(iri, 'Persona', 'es') in store
+
+    def test_small_store_is_indexed_once_it_grows_past_the_threshold(self):
+        iri = IRI('http://www.example.com/ontology#', 'Person')
+        store = AnnotationAssertionStore()
+        labels = [self.label(iri, 'Person{}'.format(i), 'en') for i in range(AnnotationAssertionStore.IndexThreshold)]
+        for label in labels:
+            store.add(label)
+        labels[0].language = 'it'
+        store.reindex(labels[0])
+        assert store.first(AnnotationAssertionProperty.Label.value, 'it') is labels[0]
+        labels.append(self.label(iri, 'Persona', 'it'))
+        assert store.add(labels[-1])
+        assert not store.add(self.label(iri, 'Person0', 'it'))
+        assert store.assertions(AnnotationAssertionProperty.Label.value, 'it') == [labels[0], labels[-1]]
+        assert store.assertions(AnnotationAssertionProperty.Label.value, 'en') == labels[1:-1]
+        assert list(store.items()) == [(AnnotationAssertionProperty.Label.value, labels)]
+        assert store.remove(self.label(iri, 'Person0', 'it')) is labels[0]
+        assert store.first(AnnotationAssertionProperty.Label.value, 'it') is labels[-1]
+        assert list(store) == labels[1:]
+
+    def test_indexing_follows_insertion_order(self):
+        iri = IRI('http://www.example.com/ontology#', 'Person')
+        store = AnnotationAssertionStore()
+        labels = [self.label(iri, 'Person{}'.format(i), 'en') for i in range(5)]
+        for label in labels:
+            store.add(label)
+        assert store.remove(self.label(iri, 'Person2', 'en')) is labels[2]
+        assert [store[i] for i in range(len(store))] == labels[:2] + labels[3:]
+        assert store[-1] is labels[4]
+        labels.append(self.label(iri, 'Person5', 'en'))
+        store.add(labels[-1])
+        assert store[-1] is labels[5]
+        assert list(store) == labels[:2] + labels[3:]
+
+    def test_modified_assertion_about_another_subject_is_reindexed(self):
+        iri = IRI('http://www.example.com/ontology#', 'Person')
+        other = IRI('http://www.example.com/ontology#', 'Human')
+        label = self.label(other, 'Person', 'en')
+        modified = []
+        iri.addAnnotationAssertion(label)
+        iri.sgnAnnotationModified.connect(modified.append)
+        label.language = 'it'
+        assert modified == [label]
+        assert iri.getAnnotationAssertions(AnnotationAssertionProperty.Label.value, 'en') == []
+        assert iri.getAnnotationAssertions(AnnotationAssertionProperty.Label.value, 'it') == [label]
+        iri.removeAnnotationAssertion(self.label(other, 'Person', 'it'))
+        label.language = 'de'
+        assert modified == [label]
+        assert not iri.annotationAssertions
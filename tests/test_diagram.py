@@ -37,9 +37,11 @@ import pytest
 
 from PyQt5 import QtCore
 
+from eddy.core.commands.nodes import CommandNodeAdd
 from eddy.core.datatypes.graphol import Item
 from eddy.core.datatypes.misc import DiagramMode
 from eddy.core.datatypes.qt import Font
+from eddy.core.diagram import Diagram
 from eddy.core.functions.misc import first
 from eddy.core.functions.path import expandPath
 from eddy.ui.iri import IriBuilderDialog
@@ -555,3 +557,95 @@ class TestDiagram:
         assert pos3 == node3.textPos()
         assert pos4 == node4.textPos()
 
+    #############################################
+    #   OWL 2 DL COMPLIANCE
+    #################################
+
+    def test_non_dl_compliant_iris_follow_node_insertion_and_removal(self, session):
+        # GIVEN
+        project = session.project
+        diagram = session.mdi.activeDiagram()
+        role = project.getIRI('http://www.dis.uniroma1.it/~graphol/test_project/hasFather')
+        label = project.getIRI('http://www.w3.org/2000/01/rdf-schema#label')
+        attribute = diagram.factory.create(Item.AttributeNode, iri=role)
+        concept = diagram.factory.create(Item.ConceptNode, iri=label)
+        assert project.isDLCompliant()
+        # WHEN
+        session.undostack.push(CommandNodeAdd(diagram, attribute))
+        session.undostack.push(CommandNodeAdd(diagram, concept))
+        # THEN
+        assert not project.isDLCompliant()
+        assert project.nonDLCompliantIRIs() == {role, label}
+        # WHEN
+        session.undostack.undo()
+        session.undostack.undo()
+        # THEN
+        assert project.isDLCompliant()
+        assert project.nonDLCompliantIRIs() == set()
+
+    def test_typed_occurrence_views_follow_node_insertion_and_removal(self, session):
+        # GIVEN
+        project = session.project
+        diagram = session.mdi.activeDiagram()
+        iri = project.getIRI('http://www.dis.uniroma1.it/~graphol/test_project/hasFather')
+        attributes = set(project.iriOccurrences(Item.AttributeNode, diagram=diagram))
+        occurrences = set(project.iriOccurrences(diagram=diagram))
+        node = diagram.factory.create(Item.AttributeNode, iri=iri)
+        # WHEN
+        session.undostack.push(CommandNodeAdd(diagram, node))
+        # THEN
+        assert project.iriOccurrences(Item.AttributeNode, diagram=diagram) == attributes | {node}
+        assert project.iriOccurrences(diagram=diagram) == occurrences | {node}
+        assert node in project.iriOccurrences(Item.AttributeNode)
+        assert node not in project.iriOccurrences(Item.RoleNode, diagram=diagram)
+        assert iri in project.itemIRIs(Item.AttributeNode)
+        # WHEN
+        session.undostack.undo()
+        # THEN
+        assert project.iriOccurrences(Item.AttributeNode, diagram=diagram) == attributes
+        assert project.iriOccurrences(diagram=diagram) == occurrences
+        assert node not in project.iriOccurrences(Item.AttributeNode)
+
+    #############################################
+    #   EDGE DEPTH
+    #################################
+
+    def test_edge_depth_follows_overlapping_nodes(self, session):
+        # GIVEN
+        diagram = Diagram.create('depth', 5000, session.project)
+        source = diagram.factory.create(Item.IntersectionNode)
+        source.setPos(QtCore.QPointF(-200, 0))
+        diagram.addItem(source)
+        target = diagram.factory.create(Item.IntersectionNode)
+        target.setPos(QtCore.QPointF(200, 0))
+        diagram.addItem(target)
+        edge = diagram.factory.create(Item.InclusionEdge, source=source, target=target)
+        source.addEdge(edge)
+        target.addEdge(edge)
+        diagram.addItem(edge)
+        edge.updateEdge()
+        depth = edge.zValue()
+        node = diagram.factory.create(Item.IntersectionNode)
+        node.setZValue(depth + 5)
+        # WHEN
+        node.setPos(QtCore.QPointF(0, 0))
+        diagram.addItem(node)
+        edge.updateEdge()
+        # THEN
+        assert edge.zValue() == pytest.approx(depth + 5.1)
+        # WHEN
+        node.setPos(QtCore.QPointF(0, 1000))
+        edge.updateEdge()
+        # THEN
+        assert edge.zValue() == pytest.approx(depth)
+        # WHEN
+        node.setPos(QtCore.QPointF(0, 0))
+        node.setZValue(depth + 7)
+        edge.updateEdge()
+        # THEN
+        assert edge.zValue() == pytest.approx(depth + 7.1)
+        # WHEN
+        diagram.removeItem(node)
+        edge.updateEdge()
+        # THEN
+        assert edge.zValue() == pytest.approx(depth)
@@ -34,6 +34,8 @@
 
 
 import os
+import threading
+
 import pytest
 
 from PyQt5 import QtPrintSupport
@@ -42,15 +44,22 @@ from eddy.core.datatypes.graphol import Item
 from eddy.core.datatypes.owl import OWLSyntax, OWLAxiom
 from eddy.core.datatypes.system import File
 from eddy.core.exporters.graphml import GraphMLDiagramExporter
+from eddy.core.exporters.graphol_iri import DomSnapshot
 from eddy.core.exporters.graphol_iri import GrapholIRIProjectExporter
+from eddy.core.exporters.graphol_iri import GrapholIRIProjectSaveWorker
 from eddy.core.exporters.graphreferences import GraphReferencesProjectExporter
 from eddy.core.exporters.image import BmpDiagramExporter
 from eddy.core.exporters.image import JpegDiagramExporter
 from eddy.core.exporters.image import PngDiagramExporter
+from eddy.core.commands.common import CommandItemsRemove
+from eddy.core.diagram import Diagram
 from eddy.core.exporters.owl2 import OWLOntologyExporterWorker
+from eddy.core.exporters.owl2 import getOWLOntologyMirror
 from eddy.core.exporters.pdf import PdfDiagramExporter, PdfProjectExporter
 from eddy.core.functions.fsystem import fread
+from eddy.core.functions.misc import first
 from eddy.core.functions.path import expandPath
+from eddy.core.jvm import getJavaVM
 from eddy.ui.session import Session
 
 
@@ -84,6 +93,84 @@ def test_export_project_as_graphol(session, qtbot, tmpdir):
     assert os.path.isfile(str(savePath))
 
 
+def test_export_project_as_graphol_streams_document_content(session, qtbot, tmpdir):
+    # GIVEN
+    savePath = tmpdir.join('savedAs.graphol')
+    project = session.project
+    project.addDiagram(Diagram.create('empty', 5000, project))
+    worker = GrapholIRIProjectExporter(project, session, str(savePath))
+    worker.createDomDocument()
+    expected = worker.document.toString(2)
+    # WHEN
+    worker.run()
+    # THEN
+    assert len(project.diagrams()) == 2
+    assert fread(str(savePath)) == expected
+    assert not os.path.exists(str(tmpdir.join('.savedAs.graphol')))
+
+
+def test_save_project_worker_snapshots_serialized_documents(session, qtbot, tmpdir):
+    # GIVEN
+    savePath = tmpdir.join('saved.graphol')
+    project = session.project
+    project.addDiagram(Diagram.create('empty', 5000, project))
+    exporter = GrapholIRIProjectExporter(project, session, str(savePath))
+    exporter.createDomDocument()
+    expected = exporter.document.toString(2)
+    worker = GrapholIRIProjectSaveWorker(exporter)
+    assert all(isinstance(part, DomSnapshot) for part in worker.parts)
+    edge = first(project.edges(), filter_on_item=lambda e: e.type() is Item.InclusionEdge)
+    session.undostack.push(CommandItemsRemove(edge.diagram, [edge]))
+    # WHEN
+    worker.run()
+    # THEN
+    assert worker.max == 3
+    assert exporter.document is None
+    assert fread(str(savePath)) == expected
+
+
+def test_save_project_in_background(session, qtbot, tmpdir):
+    # GIVEN
+    project = session.project
+    project.path = str(tmpdir.join('saved.graphol'))
+    edge1, edge2 = [e for e in project.edges() if e.type() is Item.InclusionEdge][:2]
+    session.undostack.push(CommandItemsRemove(edge1.diagram, [edge1]))
+    exporter = GrapholIRIProjectExporter(project, session)
+    exporter.createDomDocument()
+    expected = exporter.document.toString(2)
+    # WHEN
+    with qtbot.waitSignal(session.sgnProjectSaved, timeout=10000):
+        session.doSave()
+        # THE SNAPSHOT IS TAKEN BEFORE doSave RETURNS
+        session.undostack.push(CommandItemsRemove(edge2.diagram, [edge2]))
+    # THEN
+    assert fread(project.path) == expected
+    assert not session.undostack.isClean()
+    assert not session.projectSavePending
+
+
+def test_save_project_in_background_coalesces_requests(session, qtbot, tmpdir):
+    # GIVEN
+    project = session.project
+    project.path = str(tmpdir.join('saved.graphol'))
+    edge = first(project.edges(), filter_on_item=lambda e: e.type() is Item.InclusionEdge)
+    session.undostack.push(CommandItemsRemove(edge.diagram, [edge]))
+    # WHEN
+    with qtbot.waitSignal(session.sgnProjectSaved, timeout=10000):
+        session.doSave()
+        session.doSave()
+        session.doSave()
+        assert session.projectSavePending
+    with qtbot.waitSignal(session.sgnProjectSaved, timeout=10000):
+        pass
+    session.waitForProjectSave()
+    # THEN
+    assert not session.projectSavePending
+    assert session.thread('GrapholIRIProjectSave') is None
+    assert session.undostack.isClean()
+    assert 'id="{}"'.format(edge.id) not in fread(project.path)
+
+
 #############################################
 #   CSV EXPORT
 #################################
@@ -515,3 +602,102 @@ def test_export_project_to_owl_with_normalization(session, tmpdir):
 
     # AND
     assert len(content) == 88
+
+
+def test_export_project_to_owl_converts_each_node_once(session):
+    # WHEN
+    project = session.project
+    worker = OWLOntologyExporterWorker(project, axioms={x for x in OWLAxiom})
+    worker.run()
+    # THEN
+    assert worker.cacheMisses() == len(project.nodes())
+    assert worker.cacheHits() > 0
+
+
+def test_export_project_to_owl_mirror_retranslates_changed_diagrams_only(session):
+    # GIVEN
+    project = session.project
+    mirror = getOWLOntologyMirror(project)
+    ontology = mirror.getOntology()
+    partitions = dict(mirror._partitions)
+    # THEN
+    assert getOWLOntologyMirror(project) is mirror
+    assert mirror.getOntology() is ontology
+    assert all(mirror._partitions[d] is partitions[d] for d in project.diagrams())
+    # WHEN
+    edge = first(project.edges(), filter_on_item=lambda e: e.type() is Item.InclusionEdge)
+    diagram = edge.diagram
+    session.undostack.push(CommandItemsRemove(diagram, [edge]))
+    mirror.getOntology()
+    worker = OWLOntologyExporterWorker(project, axioms={x for x in OWLAxiom})
+    worker.run()
+    # THEN
+    assert mirror._partitions[diagram] is not partitions[diagram]
+    assert all(mirror._partitions[d] is partitions[d] for d in project.diagrams() if d is not diagram)
+    assert ontology.getAxiomCount() == worker.ontology.getAxiomCount()
+
+
+def test_export_project_to_owl_mirror_is_not_modified_while_locked(session):
+    # GIVEN
+    project = session.project
+    mirror = getOWLOntologyMirror(project)
+    edge = first(project.edges(), filter_on_item=lambda e: e.type() is Item.InclusionEdge)
+    synchronized = threading.Event()
+
+    def synchronize():
+        getJavaVM().attachThreadToJVM()
+        try:
+            mirror.getOntology()
+        finally:
+            getJavaVM().detachThreadFromJVM()
+            synchronized.set()
+
+    # WHEN
+    with mirror.lockOntology() as ontology:
+        count = ontology.getAxiomCount()
+        assert mirror.getOntology() is ontology
+        session.undostack.push(CommandItemsRemove(edge.diagram, [edge]))
+        thread = threading.Thread(target=synchronize)
+        thread.start()
+        # THEN
+        assert not synchronized.wait(0.5)
+        assert ontology.getAxiomCount() == count
+    thread.join(30)
+    assert synchronized.is_set()
+    assert ontology.getAxiomCount() < count
+
+
+def test_export_project_to_owl_mirror_keeps_diagrams_dirty_on_error(session, monkeypatch):
+    # GIVEN
+    project = session.project
+    mirror = getOWLOntologyMirror(project)
+    ontology = mirror.getOntology()
+    partitions = dict(mirror._partitions)
+    count = ontology.getAxiomCount()
+    edge = first(project.edges(), filter_on_item=lambda e: e.type() is Item.InclusionEdge)
+    diagram = edge.diagram
+    session.undostack.push(CommandItemsRemove(diagram, [edge]))
+    mirror._dirty.update(project.diagrams())
+
+    def fail(*args, **kwargs):
+        raise RuntimeError('malformed diagram')
+
+    # WHEN
+    with monkeypatch.context() as m:
+        m.setattr(OWLOntologyExporterWorker, 'createEdgeAxioms', fail)
+        with pytest.raises(RuntimeError):
+            mirror.getOntology()
+    # THEN
+    assert diagram in mirror._dirty
+    assert mirror._partitions[diagram] is partitions[diagram]
+    assert ontology.getAxiomCount() == count
+    # WHEN
+    mirror.getOntology()
+    worker = OWLOntologyExporterWorker(project, axioms={x for x in OWLAxiom})
+    worker.run()
+    # THEN
+    assert not mirror._dirty
+    assert mirror._partitions[diagram] is not partitions[diagram]
+    assert ontology.getAxiomCount() == worker.ontology.getAxiomCount()
+    assert sum(mirror._refcount.values()) == \
+        sum(len(x) for x in mirror._partitions.values()) + len(mirror._headerAxioms)
@@ -41,7 +41,7 @@ from PyQt5 import QtCore
 
 from eddy.core.functions.geometry import angle, distance, projection
 from eddy.core.functions.geometry import intersection, midpoint
-from eddy.core.functions.misc import clamp, first, last, lstrip, natsorted, rstrip
+from eddy.core.functions.misc import chunks, clamp, first, last, lstrip, natsorted, rstrip
 from eddy.core.functions.misc import isEmpty, rangeF, snapF
 from eddy.core.functions.owl import OWLText, OWLShortIRI
 from eddy.core.functions.path import compressPath
@@ -59,6 +59,17 @@ def test_angle():
     assert +math.pi / 4 == angle(QtCore.QPointF(0, 0), QtCore.QPointF(1, -1))
 
 
+def test_chunks():
+    assert [[0, 1, 2], [3, 4, 5], [6]] == list(chunks(range(7), 3))
+    assert [[0, 1, 2]] == list(chunks((x for x in range(3)), 3))
+    assert [] == list(chunks([], 3))
+
+
+def test_chunks_with_exception():
+    with pytest.raises(ValueError):
+        list(chunks([1, 2, 3], 0))
+
+
 def test_clamp():
     assert 0.0 == clamp(val=-4.0, minval=0.0)
     assert 0.0 == clamp(val=-4.0, minval=0.0, maxval=8.0)
@@ -33,6 +33,8 @@
 ##########################################################################
 
 
+from concurrent.futures.process import BrokenProcessPool
+
 import pytest
 from PyQt5 import QtWidgets
 
@@ -45,6 +47,14 @@ from eddy.core.loaders.graphol_iri import (
     GrapholIRIProjectLoader_v2,
     GrapholIRIProjectLoader_v3,
 )
+from eddy.core.loaders.graphol_parser import splitDiagrams
+from eddy.core.jvm import getJavaVM, getOWLOntologyManager
+from eddy.core.loaders.owl2 import (
+    ImportedOntologySignatureCache,
+    OwlOntologyImportRevalidationWorker,
+    OwlOntologyImportSetWorker,
+)
+from eddy.core.owl import IRIManager, ImportedOntology
 from eddy.ui.session import Session
 
 
@@ -72,6 +82,31 @@ def no_message_box(monkeypatch):
     monkeypatch.setattr(QtWidgets.QMessageBox, 'show', lambda *args: True)
 
 
+def dump_project(project):
+    """
+    Returns a comparable summary of the given project content.
+    """
+    return (
+        project.name,
+        str(project.ontologyIRI),
+        sorted(project.prefixDictItems()),
+        sorted(
+            (str(iri), sorted((str(a.assertionProperty), str(a.value), str(a.language))
+                              for a in iri.annotationAssertions))
+            for iri in project.iris
+        ),
+        sorted(
+            (d.name, n.id, n.type(), n.pos().x(), n.pos().y(), n.text())
+            for d in project.diagrams() for n in d.nodes()
+        ),
+        sorted(
+            (d.name, e.id, e.type(), e.source.id, e.target.id,
+             tuple((p.x(), p.y()) for p in e.breakpoints))
+            for d in project.diagrams() for e in d.edges()
+        ),
+    )
+
+
 #############################################
 #   GRAPHOL IMPORT
 #################################
@@ -176,6 +211,279 @@ def test_load_project_from_graphol_v3(session, qtbot, tmpdir):
     assert len(list(filter(lambda n: n.type() == Item.IndividualNode, loader.session.project.diagram(diagram2).nodes()))) == 0
 
 
+def test_load_project_from_graphol_v3_streaming(session, qtbot, tmpdir):
+    # GIVEN
+    graphol = tmpdir.mkdir('MovieOntology').join('MovieOntology_v3.graphol')
+    fcopy(expandPath('@tests/test_resources/loaders/graphol/v3/MovieOntology/MovieOntology_v3.graphol'), str(graphol))
+
+    # WHEN
+    loader = GrapholIRIProjectLoader_v3(str(graphol), session, streaming=False)
+    loader.run()
+    expected = dump_project(loader.session.project)
+    loader = GrapholIRIProjectLoader_v3(str(graphol), session, streaming=True)
+    loader.run()
+    # THEN
+    assert loader.document is None
+    assert len(loader.session.project.diagram('movie').nodes()) == 347
+    assert len(loader.session.project.diagram('movie').edges()) == 433
+    assert dump_project(loader.session.project) == expected
+
+
+def test_load_project_from_graphol_v3_parallel(session, qtbot, tmpdir):
+    # GIVEN
+    graphol = tmpdir.mkdir('MovieOntology').join('MovieOntology_v3.graphol')
+    fcopy(expandPath('@tests/test_resources/loaders/graphol/v3/MovieOntology/MovieOntology_v3.graphol'), str(graphol))
+    # WHEN
+    loader = GrapholIRIProjectLoader_v3(str(graphol), session, parallel=False)
+    loader.run()
+    expected = dump_project(loader.session.project)
+    loader = GrapholIRIProjectLoader_v3(str(graphol), session, parallel=True)
+    loader.parallelThreshold = 0
+    loader.run()
+    # THEN
+    assert loader.document is None
+    assert [d.name for d in sorted(loader.session.project.diagrams(), key=lambda d: d.name)] == ['movie', 'territory', 'territory_original']
+    assert dump_project(loader.session.project) == expected
+
+
+def test_load_project_from_graphol_v3_parallel_with_broken_workers(session, qtbot, tmpdir, monkeypatch):
+    # GIVEN
+    graphol = tmpdir.mkdir('MovieOntology').join('MovieOntology_v3.graphol')
+    fcopy(expandPath('@tests/test_resources/loaders/graphol/v3/MovieOntology/MovieOntology_v3.graphol'), str(graphol))
+
+    class BrokenExecutor(object):
+        def __init__(self, *args, **kwargs):
+            pass
+        def map(self, func, iterable):
+            fragments = list(iterable)
+            yield func(fragments[0])
+            raise BrokenProcessPool('a worker process terminated abruptly')
+        def shutdown(self, *args, **kwargs):
+            pass
+
+    # WHEN
+    loader = GrapholIRIProjectLoader_v3(str(graphol), session, parallel=False)
+    loader.run()
+    expected = dump_project(loader.session.project)
+    monkeypatch.setattr('eddy.core.loaders.graphol_iri.ProcessPoolExecutor', BrokenExecutor)
+    monkeypatch.setattr('eddy.core.loaders.graphol_iri.os.cpu_count', lambda: 4)
+    loader = GrapholIRIProjectLoader_v3(str(graphol), session, parallel=True)
+    loader.parallelThreshold = 0
+    loader.run()
+    # THEN
+    assert dump_project(loader.session.project) == expected
+
+
+def test_load_project_from_graphol_v3_parallel_with_diagram_tags_in_comments(session, qtbot, tmpdir):
+    # GIVEN
+    source = expandPath('@tests/test_resources/loaders/graphol/v3/MovieOntology/MovieOntology_v3.graphol')
+    graphol = tmpdir.mkdir('MovieOntology').join('MovieOntology_v3.graphol')
+    with open(source, 'rb') as file:
+        data = file.read()
+    data = data.replace(b'<imports/>', b'<imports/><!-- <diagram name="commented"> --><![CDATA[</diagram>]]>', 1)
+    graphol.write_binary(data)
+    # WHEN
+    assert splitDiagrams(data) == (data, [])
+    loader = GrapholIRIProjectLoader_v3(str(graphol), session, parallel=False)
+    loader.run()
+    expected = dump_project(loader.session.project)
+    loader = GrapholIRIProjectLoader_v3(str(graphol), session, parallel=True)
+    loader.parallelThreshold = 0
+    loader.run()
+    # THEN
+    assert [d.name for d in sorted(loader.session.project.diagrams(), key=lambda d: d.name)] == ['movie', 'territory', 'territory_original']
+    assert dump_project(loader.session.project) == expected
+
+
+def test_load_project_from_graphol_v3_deferred_render(session, qtbot, tmpdir):
+    # GIVEN
+    graphol = tmpdir.mkdir('MovieOntology').join('MovieOntology_v3.graphol')
+    fcopy(expandPath('@tests/test_resources/loaders/graphol/v3/MovieOntology/MovieOntology_v3.graphol'), str(graphol))
+    # WHEN
+    loader = GrapholIRIProjectLoader_v3(str(graphol), session)
+    loader.run()
+    project = loader.session.project
+    # THEN
+    assert all(diagram.hasPendingRender() for diagram in project.diagrams())
+    # WHEN
+    with qtbot.waitSignal(session.sgnDiagramFocused):
+        session.sgnFocusDiagram.emit(project.diagram('movie'))
+    # THEN
+    assert not project.diagram('movie').hasPendingRender()
+    qtbot.waitUntil(lambda: not any(diagram.hasPendingRender() for diagram in project.diagrams()))
+    assert all(not edge.path.geometry().isEmpty() for edge in project.edges())
+
+
+def test_load_project_from_graphol_v3_deferred_render_stops_when_session_is_closed(session, qtbot, tmpdir):
+    # GIVEN
+    graphol = tmpdir.mkdir('MovieOntology').join('MovieOntology_v3.graphol')
+    fcopy(expandPath('@tests/test_resources/loaders/graphol/v3/MovieOntology/MovieOntology_v3.graphol'), str(graphol))
+    loader = GrapholIRIProjectLoader_v3(str(graphol), session)
+    loader.run()
+    project = loader.session.project
+    # WHEN
+    session.close()
+    qtbot.wait(200)
+    # THEN
+    assert all(diagram.hasPendingRender() for diagram in project.diagrams())
+
+
+#############################################
+#   OWL 2 IMPORTS
+#################################
+
+def test_imported_ontology_signature_cache(tmpdir):
+    # GIVEN
+    document = tmpdir.join('ontology.owl')
+    document.write('<rdf:RDF/>')
+    ont = ImportedOntology('http://www.example.com/ontology', str(document), localFileSystem=True)
+    cache = ImportedOntologySignatureCache(str(tmpdir.join('cache')))
+    signature = {
+        'classes': ['http://www.example.com/ontology#Person'],
+        'objectProperties': ['http://www.example.com/ontology#knows'],
+        'dataProperties': [],
+        'individuals': ['http://www.example.com/ontology#alice'],
+    }
+    assert cache.load(ont) is None
+    # WHEN
+    cache.store(ont, signature)
+    # THEN
+    assert cache.load(ont) == signature
+    assert cache.load(ImportedOntology('http://www.example.com/other', str(document), localFileSystem=True)) is None
+    # WHEN
+    document.write('<rdf:RDF></rdf:RDF>')
+    # THEN
+    assert cache.load(ont) is None
+
+
+def test_load_imported_ontology_from_signature_cache(qapp, tmpdir):
+    # GIVEN
+    manager = IRIManager()
+    ont = ImportedOntology('http://www.example.com/ontology', 'http://www.example.com/ontology.owl')
+    manager.addImportedOntology(ont)
+    cache = ImportedOntologySignatureCache(str(tmpdir.join('cache')))
+    cache.store(ont, {
+        'classes': ['http://www.example.com/ontology#Person'],
+        'objectProperties': [],
+        'dataProperties': ['http://www.example.com/ontology#name'],
+        'individuals': [],
+    })
+    # WHEN
+    worker = OwlOntologyImportSetWorker(manager, cache=cache)
+    worker.run()
+    # THEN
+    assert worker.loadCount == 1
+    assert worker.cachedImports == [ont]
+    assert ont.correctlyLoaded
+    assert {str(iri) for iri in ont.classes} == {'http://www.example.com/ontology#Person'}
+    assert {str(iri) for iri in ont.dataProperties} == {'http://www.example.com/ontology#name'}
+    assert all(manager.isImportedIRI(iri) for iri in ont.iris)
+
+
+def test_signature_cache_entry_follows_declared_iris(qapp, tmpdir):
+    # GIVEN
+    document = tmpdir.join('ontology.owl')
+    document.write("""<?xml version="1.0"?>
+<rdf:RDF xmlns:owl="http://www.w3.org/2002/07/owl#" xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#">
+  <owl:Ontology rdf:about="http://www.example.com/ontology">
+    <owl:versionIRI rdf:resource="http://www.example.com/ontology/2.0"/>
+  </owl:Ontology>
+  <owl:Class rdf:about="http://www.example.com/ontology#Person"/>
+</rdf:RDF>""")
+    cache = ImportedOntologySignatureCache(str(tmpdir.join('cache')))
+
+    def load():
+        manager = IRIManager()
+        ont = ImportedOntology('http://www.example.com/ontology', str(document),
+                               versionIri='http://www.example.com/ontology/1.0', localFileSystem=True)
+        manager.addImportedOntology(ont)
+        worker = OwlOntologyImportSetWorker(manager, cache=cache)
+        worker.run()
+        return worker, ont
+
+    # WHEN
+    worker, ont = load()
+    # THEN
+    assert worker.cachedImports == []
+    assert ont.versionIRI == 'http://www.example.com/ontology/2.0'
+    # WHEN
+    worker, ont = load()
+    # THEN
+    assert worker.cachedImports == [ont]
+    assert {str(iri) for iri in ont.classes} == {'http://www.example.com/ontology#Person'}
+
+
+@pytest.mark.parametrize('maxWorkers', [1, 4])
+def test_load_imported_ontologies(qapp, tmpdir, logging_disabled, maxWorkers):
+    # GIVEN
+    manager = IRIManager()
+    imports = []
+    for name in ('first', 'second', 'third'):
+        document = tmpdir.join('{}.owl'.format(name))
+        document.write("""<?xml version="1.0"?>
+<rdf:RDF xmlns:owl="http://www.w3.org/2002/07/owl#" xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#">
+  <owl:Ontology rdf:about="http://www.example.com/{0}"/>
+  <owl:Class rdf:about="http://www.example.com/{0}#Person"/>
+  <owl:ObjectProperty rdf:about="http://www.example.com/{0}#knows"/>
+</rdf:RDF>""".format(name))
+        imports.append(ImportedOntology('http://www.example.com/{}'.format(name), str(document), localFileSystem=True))
+    imports.append(ImportedOntology('http://www.example.com/missing', str(tmpdir.join('missing.owl')), localFileSystem=True))
+    for ont in imports:
+        manager.addImportedOntology(ont)
+    worker = OwlOntologyImportSetWorker(manager)
+    worker.maxWorkers = maxWorkers
+    steps = []
+    errors = []
+    worker.sgnStepPerformed.connect(steps.append)
+    worker.sgnErrored.connect(lambda ont, _: errors.append(ont))
+    # WHEN
+    with logging_disabled:
+        worker.run()
+    # THEN
+    assert worker.loadCount == 3
+    assert steps == [1, 2, 3, 4]
+    assert errors == [imports[-1]]
+    assert not imports[-1].correctlyLoaded
+    for ont in imports[:-1]:
+        assert ont.correctlyLoaded
+        assert {str(iri) for iri in ont.classes} == {'{}#Person'.format(ont.ontologyIRI)}
+        assert {str(iri) for iri in ont.objectProperties} == {'{}#knows'.format(ont.ontologyIRI)}
+    # AND THEN
+    IRIClass = getJavaVM().getJavaClass('org.semanticweb.owlapi.model.IRI')
+    assert IRIClass is getJavaVM().getJavaClass('org.semanticweb.owlapi.model.IRI')
+    shared = getOWLOntologyManager(manager)
+    assert shared is getOWLOntologyManager(manager)
+    for ont in imports[:-1]:
+        assert shared.getOntology(IRIClass.create(ont.ontologyIRI)) is not None
+
+
+def test_revalidate_imported_ontologies_replaces_shared_ontologies(qapp, tmpdir):
+    # GIVEN
+    manager = IRIManager()
+    document = tmpdir.join('ontology.owl')
+    content = """<?xml version="1.0"?>
+<rdf:RDF xmlns:owl="http://www.w3.org/2002/07/owl#" xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#">
+  <owl:Ontology rdf:about="http://www.example.com/ontology"/>
+  {}
+</rdf:RDF>"""
+    document.write(content.format('<owl:Class rdf:about="http://www.example.com/ontology#Person"/>'))
+    ont = ImportedOntology('http://www.example.com/ontology', str(document), localFileSystem=True)
+    manager.addImportedOntology(ont)
+    OwlOntologyImportSetWorker(manager).run()
+    document.write(content.format('<owl:Class rdf:about="http://www.example.com/ontology#Student"/>'))
+    worker = OwlOntologyImportRevalidationWorker(manager, [ont], ImportedOntologySignatureCache(str(tmpdir.join('cache'))))
+    changes = []
+    worker.sgnSignatureChanged.connect(lambda _, signature: changes.append(signature))
+    # WHEN
+    worker.run()
+    # THEN
+    assert [c['classes'] for c in changes] == [['http://www.example.com/ontology#Student']]
+    IRIClass = getJavaVM().getJavaClass('org.semanticweb.owlapi.model.IRI')
+    ontology = getOWLOntologyManager(manager).getOntology(IRIClass.create(ont.ontologyIRI))
+    assert ontology.containsClassInSignature(IRIClass.create('http://www.example.com/ontology#Student'))
+    assert not ontology.containsClassInSignature(IRIClass.create('http://www.example.com/ontology#Person'))
+
+
 #############################################
 #   GRAPHML IMPORT
 #################################
@@ -0,0 +1,244 @@
+# -*- coding: utf-8 -*-
+
+##########################################################################
+#                                                                        #
+#  Eddy: a graphical editor for the specification of Graphol ontologies  #
+#  Copyright (C) 2015 Daniele Pantaleone <danielepantaleone@me.com>      #
+#                                                                        #
+#  This program is free software: you can redistribute it and/or modify  #
+#  it under the terms of the GNU General Public License as published by  #
+#  the Free Software Foundation, either version 3 of the License, or     #
+#  (at your option) any later version.                                   #
+#                                                                        #
+#  This program is distributed in the hope that it will be useful,       #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of        #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the          #
+#  GNU General Public License for more details.                          #
+#                                                                        #
+#  You should have received a copy of the GNU General Public License     #
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.  #
+#                                                                        #
+#  #####################                          #####################  #
+#                                                                        #
+#  Graphol is developed by members of the DASI-lab group of the          #
+#  Dipartimento di Ingegneria Informatica, Automatica e Gestionale       #
+#  A.Ruberti at Sapienza University of Rome: http://www.dis.uniroma1.it  #
+#                                                                        #
+#     - Domenico Lembo <lembo@dis.uniroma1.it>                           #
+#     - Valerio Santarelli <santarelli@dis.uniroma1.it>                  #
+#     - Domenico Fabio Savo <savo@dis.uniroma1.it>                       #
+#     - Daniele Pantaleone <pantaleone@dis.uniroma1.it>                  #
+#     - Marco Console <console@dis.uniroma1.it>                          #
+#                                                                        #
+##########################################################################
+
+
+import json
+import shutil
+
+import pytest
+
+from PyQt5 import (
+    QtCore,
+    QtXml,
+)
+
+from eddy.core.commands.common import CommandItemsRemove
+from eddy.core.commands.iri import CommandIRIAddAnnotationAssertion
+from eddy.core.commands.nodes import CommandNodeMove
+from eddy.core.commands.project import CommandProjectAddPrefix
+from eddy.core.datatypes.graphol import Item
+from eddy.core.exporters.graphol_iri import GrapholIRIProjectExporter
+from eddy.core.functions.fsystem import (
+    fexists,
+    fread,
+)
+from eddy.core.functions.misc import first
+from eddy.core.functions.path import expandPath
+from eddy.core.journal import ProjectJournal
+from eddy.core.owl import AnnotationAssertion
+from eddy.ui.session import Session
+
+
+@pytest.fixture
+def session(qapp, qtbot, logging_disabled, tmpdir):
+    """
+    Provide an initialized Session instance, working on a copy of the test project.
+    """
+    path = str(tmpdir.join('test_project_3_1.graphol'))
+    shutil.copy(expandPath('@tests/test_project_3/test_project_3_1.graphol'), path)
+    settings = QtCore.QSettings()
+    settings.setValue('project/autosave', True)
+    try:
+        with logging_disabled:
+            session = Session(qapp, path)
+            session.show()
+    finally:
+        settings.setValue('project/autosave', False)
+    qtbot.addWidget(session)
+    qtbot.waitExposed(session, timeout=3000)
+    with qtbot.waitSignal(session.sgnDiagramFocused):
+        session.sgnFocusDiagram.emit(session.project.diagram('diagram'))
+    yield session
+
+
+def canonical(element):
+    """
+    Returns a representation of the given QDomElement which does not depend on attributes order.
+    """
+    attributes = element.attributes()
+    children = []
+    child = element.firstChild()
+    while not child.isNull():
+        if child.isElement():
+            children.append(canonical(child.toElement()))
+        elif child.isText():
+            children.append(child.toText().data())
+        child = child.nextSibling()
+    return (element.tagName(),
+            sorted((attributes.item(i).nodeName(), attributes.item(i).nodeValue())
+                   for i in range(attributes.count())),
+            children)
+
+
+def contents(document):
+    """
+    Returns the IRIs and diagram items of the given Graphol document, indexed by identifier.
+    """
+    result = {}
+    projectEl = document.documentElement().firstChildElement('project')
+    iriEl = projectEl.firstChildElement('ontology').firstChildElement('iris').firstChildElement('iri')
+    while not iriEl.isNull():
+        result[iriEl.firstChildElement('value').text()] = canonical(iriEl)
+        iriEl = iriEl.nextSiblingElement('iri')
+    diagramEl = projectEl.firstChildElement('diagrams').firstChildElement('diagram')
+    while not diagramEl.isNull():
+        itemEl = diagramEl.firstChildElement()
+        while not itemEl.isNull():
+            result[(diagramEl.attribute('name'), itemEl.attribute('id'))] = canonical(itemEl)
+            itemEl = itemEl.nextSiblingElement()
+        diagramEl = diagramEl.nextSiblingElement('diagram')
+    return result
+
+
+def entries(path):
+    """
+    Returns the entries of the journal of the project stored at the given path.
+    """
+    return [json.loads(line) for line in fread(ProjectJournal.journalPath(path)).splitlines()]
+
+
+#############################################
+#   JOURNAL
+#################################
+
+def test_journal_records_edits_and_recovers_them(session):
+    # GIVEN
+    project = session.project
+    diagram = session.mdi.activeDiagram()
+    edge1, edge2 = [e for e in diagram.edges() if e.type() is Item.InclusionEdge][:2]
+    node = first(diagram.nodes(), filter_on_item=lambda n: n.type() is Item.ConceptNode)
+    comment = project.getIRI('http://www.w3.org/2000/01/rdf-schema#comment')
+    assertion = AnnotationAssertion(node.iri, comment, 'journaled comment', None, 'en')
+    # WHEN
+    session.undostack.push(CommandItemsRemove(edge1.diagram, [edge1]))
+    session.undostack.push(CommandItemsRemove(edge2.diagram, [edge2]))
+    session.undostack.undo()
+    moveData = diagram.setupMove([node])
+    session.undostack.push(CommandNodeMove(diagram, moveData, diagram.completeMove(moveData, QtCore.QPointF(40, 60))))
+    session.undostack.push(CommandIRIAddAnnotationAssertion(project, node.iri, assertion))
+    # THEN
+    journal = entries(project.path)
+    assert [entry['seq'] for entry in journal] == [0, 1, 2, 3, 4]
+    assert journal[0]['items'] == [[diagram.name, edge1.id, None]]
+    assert [iri for iri, _ in journal[4]['iris']] == [str(node.iri)]
+    # WHEN
+    original = QtXml.QDomDocument()
+    original.setContent(fread(project.path))
+    exporter = GrapholIRIProjectExporter(project, session)
+    exporter.createDomDocument()
+    expected = contents(original)
+    current = contents(exporter.document)
+    del expected[(diagram.name, edge1.id)]
+    for key in [(diagram.name, x.id) for x in {node, edge2} | node.edges] + [str(node.iri)]:
+        expected[key] = current[key]
+    recovered = QtXml.QDomDocument()
+    recovered.setContent(fread(ProjectJournal.recover(project.path)))
+    # THEN
+    assert contents(recovered) == expected
+    assert fread(ProjectJournal.journalPath(project.path)) == ''
+
+
+def test_journal_compacts_unjournaled_edits(session, qtbot):
+    # GIVEN
+    project = session.project
+    edge = first(project.edges(), filter_on_item=lambda e: e.type() is Item.InclusionEdge)
+    session.undostack.push(CommandItemsRemove(edge.diagram, [edge]))
+    # WHEN
+    session.undostack.push(CommandProjectAddPrefix(project, 'journal', 'http://journal.example/'))
+    session.waitForThread('ProjectJournalCompaction')
+    # THEN
+    assert fexists(ProjectJournal.autosavePath(project.path))
+    assert 'http://journal.example/' in fread(ProjectJournal.autosavePath(project.path))
+    assert entries(project.path) == []
+    assert session.journal.baseSeq == 2
+
+
+def test_journal_compacts_again_edits_performed_during_a_compaction(session, qtbot):
+    # GIVEN
+    project = session.project
+    session.undostack.push(CommandProjectAddPrefix(project, 'first', 'http://first.example/'))
+    assert session.journal.compaction
+    # WHEN
+    session.undostack.push(CommandProjectAddPrefix(project, 'second', 'http://second.example/'))
+    session.waitForThread('ProjectJournalCompaction')
+    # THEN
+    assert session.journal.compaction is None
+    assert not session.journal.compactionPending
+    assert 'http://second.example/' in fread(ProjectJournal.autosavePath(project.path))
+    assert entries(project.path) == []
+    assert session.journal.baseSeq == 2
+
+
+def test_journal_compacts_edits_performed_while_the_compaction_thread_winds_down(session, qtbot, monkeypatch):
+    # GIVEN
+    project = session.project
+    journal = session.journal
+    completed = journal.onCompactionCompleted
+    calls = []
+
+    def onCompactionCompleted():
+        completed()
+        if not calls:
+            calls.append(session.thread('ProjectJournalCompaction'))
+            session.undostack.push(CommandProjectAddPrefix(project, 'second', 'http://second.example/'))
+
+    monkeypatch.setattr(journal, 'onCompactionCompleted', onCompactionCompleted)
+    # WHEN
+    session.undostack.push(CommandProjectAddPrefix(project, 'first', 'http://first.example/'))
+    session.waitForThread('ProjectJournalCompaction')
+    # THEN
+    assert calls and calls[0] is not None
+    assert journal.compaction is None
+    assert 'http://second.example/' in fread(ProjectJournal.autosavePath(project.path))
+    assert entries(project.path) == []
+
+
+def test_journal_is_rebased_when_the_project_is_saved(session, qtbot):
+    # GIVEN
+    project = session.project
+    edge = first(project.edges(), filter_on_item=lambda e: e.type() is Item.InclusionEdge)
+    session.undostack.push(CommandItemsRemove(edge.diagram, [edge]))
+    # WHEN
+    with qtbot.waitSignal(session.sgnProjectSaved, timeout=10000):
+        session.doSave()
+        session.undostack.undo()
+    # THEN
+    assert [entry['seq'] for entry in entries(project.path)] == [1]
+    assert not fexists(ProjectJournal.autosavePath(project.path))
+    assert ProjectJournal.exists(project.path)
+    # WHEN
+    session.undostack.push(CommandItemsRemove(edge.diagram, [edge]))
+    session.journal.close(discard=True)
+    # THEN
+    assert not ProjectJournal.exists(project.path)